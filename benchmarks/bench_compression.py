@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+Büyük bir şeffaflık response'unun (varsayılan ~30 MB JSON) yerel bir stub
+sunucudan çekilip decode edilmesinin wall time ve peak RSS değerlerini
+sıkıştırmalı (gzip) ve sıkıştırmasız transfer için karşılaştırır.
+
+    requests : requests.Session().get(...).json() - stdlib json
+    epint    : HTTPClient - Accept-Encoding müzakeresi (kuruluysa br/zstd) ve
+               JsonCodec (kurulu backend)
+    epint/json : epint ile aynı, JsonCodec'in stdlib backend'i ile (transfer
+               farkını parser farkından ayırmak için)
+
+Stub sunucu loopback üzerinde çalıştığından gzip'in kazancı burada transfer
+edilen byte'tadır (ağ gecikmesi yok); gerçek ağda wall time'a yansır.
+
+Peak RSS process ömrü boyunca tutulduğundan her ölçüm ayrı bir child
+process'te yapılır; sunucu parent process'te çalışır. Linux'ta ru_maxrss
+exec sonrası parent'ın değerini taşıdığından /proc/self/status'taki VmHWM
+kullanılır.
+
+Kullanım:
+    PYTHONPATH=src python benchmarks/bench_compression.py [--items N] [--repeat N]
+"""
+
+import argparse
+import gzip
+import json
+import resource
+import subprocess
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+def _payload(items: int) -> bytes:
+    rows = [
+        {"date": "2026-01-01T%02d:00:00+03:00" % (i % 24), "hour": "%02d:00" % (i % 24),
+         "price": 2500.0 + i % 97, "priceUsd": 75.5, "priceEur": 70.25}
+        for i in range(items)
+    ]
+    return json.dumps({"items": rows, "page": {"total": items}}).encode("utf-8")
+
+
+def _serve(items: int) -> ThreadingHTTPServer:
+    plain = _payload(items)
+    compressed = gzip.compress(plain, compresslevel=6)
+    print(f"{items} items: {len(plain) / 2 ** 20:.1f} MB, gzip {len(compressed) / 2 ** 20:.1f} MB")
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            use_gzip = "gzip" in self.headers.get("Accept-Encoding", "")
+            body = compressed if use_gzip else plain
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            if use_gzip:
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+def _peak_rss_kb() -> int:
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def _child(url: str, client: str, compress: bool) -> None:
+    """Tek bir ölçüm: wall time (sn) ve peak RSS (MB) yazdır"""
+    if client == "requests":
+        import requests
+
+        session = requests.Session()
+        session.headers["Accept-Encoding"] = "gzip, deflate" if compress else "identity"
+        fetch = lambda: session.get(url).json()
+    else:
+        from epint.modules.http_client import HTTPClient
+        from epint.modules.json_codec import JsonCodec
+
+        if client == "epint/json":
+            JsonCodec.set_backend("json")
+        http = HTTPClient(rate_limit=False, circuit_breaker=False, compress=compress)
+        fetch = lambda: JsonCodec.decode_response(http.get(url))
+
+    baseline = _peak_rss_kb()
+    start = time.perf_counter()
+    data = fetch()
+    elapsed = time.perf_counter() - start
+    assert data["page"]["total"] == len(data["items"])
+    peak = _peak_rss_kb()
+    print(f"{elapsed} {(peak - baseline) / 1024}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=250000)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--child", nargs=3, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        url, client, compress = args.child
+        _child(url, client, compress == "1")
+        return
+
+    server = _serve(args.items)
+    url = f"http://127.0.0.1:{server.server_port}/v1/markets/dam/data/mcp"
+    print(f"{'client':<12}{'transfer':<10}{'wall (ms)':>12}{'peak RSS (MB)':>16}")
+    for client in ("requests", "epint", "epint/json"):
+        for compress in (False, True):
+            results = []
+            for _ in range(args.repeat):
+                output = subprocess.run(
+                    [sys.executable, __file__, "--child", url, client, "1" if compress else "0"],
+                    check=True, capture_output=True, text=True,
+                ).stdout.split()
+                results.append((float(output[0]), float(output[1])))
+            wall = min(result[0] for result in results) * 1000
+            rss = min(result[1] for result in results)
+            print(f"{client:<12}{'gzip' if compress else 'identity':<10}{wall:>12.1f}{rss:>16.1f}")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+swagger.json (JSON + $ref çözümleme) ile önceden derlenmiş index yükleme
+sürelerini karşılaştırır.
+
+Kullanım:
+    PYTHONPATH=src python benchmarks/bench_endpoint_index.py [kategori ...] [--repeat N]
+"""
+
+import argparse
+import os
+import statistics
+import tempfile
+import time
+from typing import Tuple
+
+from epint.endpoints import get_endpoints_dir, list_categories
+from epint.endpoints.compiler import compile_category, load_index
+from epint.models.swagger import SwaggerModel
+
+
+def _measure(func, repeat: int) -> Tuple[float, float]:
+    """En iyi ve medyan ölçümü milisaniye olarak döndür"""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return min(timings), statistics.median(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("categories", nargs="*")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    categories = sorted(args.categories or list_categories())
+
+    print(f"{'category':<28}{'json min/med (ms)':>22}{'index min/med (ms)':>22}{'speedup':>10}")
+    total_json = total_index = 0.0
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for category in categories:
+            swagger_path = os.path.join(get_endpoints_dir(), category, "swagger.json")
+            index_path = os.path.join(tmp_dir, f"{category}.pickle")
+            compile_category(category, swagger_path, index_path)
+
+            json_min, json_med = _measure(lambda: SwaggerModel(swagger_path), args.repeat)
+            index_min, index_med = _measure(lambda: load_index(index_path, swagger_path), args.repeat)
+            total_json += json_min
+            total_index += index_min
+
+            print(
+                f"{category:<28}{json_min:>11.2f}/{json_med:<10.2f}"
+                f"{index_min:>11.2f}/{index_med:<10.2f}{json_min / index_min:>9.1f}x"
+            )
+
+    print(f"{'TOTAL (min)':<28}{total_json:>11.2f}{'':<11}{total_index:>11.2f}{'':<11}{total_json / total_index:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+"""
+`import epint` süresini `python -X importtime` ile ölçer.
+
+Her ölçüm yeni bir process'te yapılır; epint'in kümülatif import süresinin
+medyanı, en pahalı alt modüller ve import sırasında yüklenmemesi gereken
+(network/auth katmanı) modüller raporlanır. --budget verilirse medyan bütçeyi
+aşarsa veya yasaklı bir modül yüklenirse çıkış kodu 1 olur; CI'da regresyon
+kontrolü olarak kullanılabilir.
+
+Kullanım:
+    PYTHONPATH=src python benchmarks/bench_import_time.py [--repeat N] [--budget MS]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+# import epint sırasında yüklenmemesi gereken modüller (ilk çağrıda yüklenir)
+DEFERRED_MODULES = ("requests", "urllib3", "zoneinfo", "difflib")
+
+
+def _run_once() -> Tuple[Dict[str, Tuple[int, int]], List[str]]:
+    """Tek bir process'te import et; {modül: (self_us, cumulative_us)} ve yüklenen yasaklı modüller"""
+    code = (
+        "import sys, epint; "
+        f"print(','.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=dict(os.environ),
+        check=True,
+    )
+
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        if not self_us.strip().isdigit():
+            continue  # başlık satırı
+        timings[name.strip()] = (int(self_us), int(cumulative_us))
+
+    loaded = [m for m in result.stdout.strip().split(",") if m]
+    return timings, loaded
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--budget", type=float, default=None, help="milisaniye cinsinden medyan bütçe")
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    totals = []
+    self_times: Dict[str, List[int]] = {}
+    loaded = []
+    for _ in range(args.repeat):
+        timings, loaded = _run_once()
+        totals.append(timings["epint"][1] / 1000)
+        for name, (self_us, _) in timings.items():
+            self_times.setdefault(name, []).append(self_us)
+
+    median = statistics.median(totals)
+    print(f"import epint: median {median:.1f} ms, min {min(totals):.1f} ms ({args.repeat} runs)")
+
+    print(f"\n{'module':<50}{'self (ms)':>12}")
+    slowest = sorted(self_times.items(), key=lambda item: statistics.median(item[1]), reverse=True)
+    for name, values in slowest[:args.top]:
+        print(f"{name:<50}{statistics.median(values) / 1000:>12.2f}")
+
+    failed = False
+    if loaded:
+        print(f"\nDeferred modules loaded at import: {', '.join(loaded)}")
+        failed = True
+    if args.budget is not None and median > args.budget:
+        print(f"\nImport time budget exceeded: {median:.1f} ms > {args.budget:.1f} ms")
+        failed = True
+
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,63 @@
+# -*- coding: utf-8 -*-
+"""
+Büyük bir şeffaflık response'unun (on binlerce item) decode süresini
+requests'in response.json()'u (stdlib) ile JsonCodec'in kurulu backend'leri
+için karşılaştırır. Ayrıca request body encode süresi de ölçülür.
+
+Kullanım:
+    PYTHONPATH=src python benchmarks/bench_json_codec.py [--items N] [--repeat N]
+"""
+
+import argparse
+import importlib.util
+import json
+import time
+
+from epint.modules.json_codec import BACKENDS, JsonCodec
+
+
+def _payload(items: int) -> bytes:
+    rows = [
+        {"date": "2026-01-01T%02d:00:00+03:00" % (i % 24), "hour": "%02d:00" % (i % 24),
+         "price": 2500.0 + i % 97, "priceUsd": 75.5, "priceEur": 70.25}
+        for i in range(items)
+    ]
+    return json.dumps({"items": rows, "page": {"total": items}}).encode("utf-8")
+
+
+def _best_ms(func, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--items", type=int, default=50000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    content = _payload(args.items)
+    body = json.loads(content)
+    print(f"{args.items} items, {len(content) / 1024:.0f} KB")
+    print(f"{'backend':<22}{'decode (ms)':>12}{'encode (ms)':>12}")
+
+    # requests: response.text (charset tespiti + decode) üzerinden json.loads
+    decode = _best_ms(lambda: json.loads(content.decode("utf-8")), args.repeat)
+    encode = _best_ms(lambda: json.dumps(body).encode("utf-8"), args.repeat)
+    print(f"{'requests (stdlib)':<22}{decode:>12.1f}{encode:>12.1f}")
+
+    for backend in BACKENDS:
+        if backend != "json" and importlib.util.find_spec(backend) is None:
+            continue
+        JsonCodec.set_backend(backend)
+        decode = _best_ms(lambda: JsonCodec.loads(content), args.repeat)
+        encode = _best_ms(lambda: JsonCodec.dumps(body), args.repeat)
+        print(f"{'JsonCodec ' + backend:<22}{decode:>12.1f}{encode:>12.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+"""
+Aynı endpoint'in tekrar tekrar çağrılmasında Python tarafındaki çağrı başı
+maliyeti, normal çağrı ile Endpoint.prepare ile hazırlanmış callable için
+karşılaştırır.
+
+Network ve ticket alma maliyeti ölçüme dahil edilmez: ticket'lar sabit
+döner ve client isteği göndermeden hazır bir response döndürür.
+
+Kullanım:
+    PYTHONPATH=src python benchmarks/bench_prepared_endpoint.py [kategori] [endpoint] [--repeat N]
+"""
+
+import argparse
+import time
+
+import epint
+from epint.models.endpoint_registry import EndpointModel
+from epint.modules.authentication.auth_manager import Authentication
+
+
+class _Response:
+    status_code = 200
+    headers = {"Content-Type": "application/json"}
+    content = b"{}"
+    text = "{}"
+
+    def json(self):
+        return {}
+
+    def raise_for_status(self):
+        pass
+
+
+class _NullClient:
+    """İsteği göndermeden sabit response döndüren client"""
+
+    auth = None
+
+    def get(self, url, **kwargs):
+        return _Response()
+
+    post = get
+
+
+def _per_call_us(func, repeat: int) -> float:
+    start = time.perf_counter()
+    for i in range(repeat):
+        func(i)
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("category", nargs="?", default="seffaflik_electricity")
+    parser.add_argument("endpoint", nargs="?", default="mcp_data")
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    epint.set_auth("bench", "bench")
+    Authentication.get_tgt = lambda self: ("TGT-bench-cas", None)
+    Authentication.get_st = lambda self, service: ("ST-bench-cas", None)
+
+    endpoint = getattr(getattr(epint, args.category), args.endpoint)
+    endpoint.client = _NullClient()
+    EndpointModel.get_request_plan(endpoint._category, endpoint._name, endpoint._data)
+
+    days = [f"2026-01-{day:02d}" for day in range(1, 29)]
+    direct = _per_call_us(
+        lambda i: endpoint(region="TR1", startDate=days[i % 28], endDate=days[i % 28]), args.repeat
+    )
+    prepared_endpoint = endpoint.prepare(region="TR1")
+    prepared = _per_call_us(
+        lambda i: prepared_endpoint(startDate=days[i % 28], endDate=days[i % 28]), args.repeat
+    )
+
+    print(f"{endpoint._category}.{endpoint._name}")
+    print(f"{'endpoint(...)':<22}{direct:>10.1f} us")
+    print(f"{'prepared(...)':<22}{prepared:>10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# -*- coding: utf-8 -*-
+"""
+Worker process'lerinde kategori yükleme süresini ve özel (paylaşılmayan)
+belleği JSON, index ve mmap'lenmiş registry imajı için karşılaştırır.
+
+Her worker tüm kategorileri yükleyip her kategoriden --touch kadar endpoint'e
+erişir. Private bellek /proc/self/smaps_rollup'tan okunur (Linux).
+
+Kullanım:
+    PYTHONPATH=src python benchmarks/bench_registry_image.py [--workers N] [--touch N]
+"""
+
+import argparse
+import multiprocessing
+import os
+import tempfile
+import time
+
+from epint.endpoints import get_endpoints_dir, list_categories
+from epint.endpoints.compiler import get_index_path
+from epint.endpoints.registry_image import build_image
+
+
+def _private_kb() -> int:
+    total = 0
+    with open("/proc/self/smaps_rollup") as f:
+        for line in f:
+            if line.startswith(("Private_Clean:", "Private_Dirty:")):
+                total += int(line.split()[1])
+    return total
+
+
+def _worker(mode: str, image_path: str, touch: int, queue) -> None:
+    from epint.models.endpoint_registry import EndpointModel
+    from epint.models import endpoint_registry
+
+    if mode == "json":
+        endpoint_registry.load_index = lambda *args, **kwargs: None
+    elif mode == "image":
+        EndpointModel.use_registry_image(image_path)
+
+    before = _private_kb()
+    start = time.perf_counter()
+    for category in list_categories():
+        EndpointModel.load_swagger(category, os.path.join(get_endpoints_dir(), category, "swagger.json"))
+        for name in list(EndpointModel.get_category_endpoints(category))[:touch]:
+            EndpointModel.get_endpoint(category, name)
+    elapsed = (time.perf_counter() - start) * 1000
+    queue.put((elapsed, _private_kb() - before))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--touch", type=int, default=5)
+    args = parser.parse_args()
+
+    has_index = all(
+        os.path.exists(get_index_path(os.path.join(get_endpoints_dir(), category, "swagger.json")))
+        for category in list_categories()
+    )
+    modes = ["json", "index", "image"] if has_index else ["json", "image"]
+
+    ctx = multiprocessing.get_context("fork")
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        image_path = build_image(os.path.join(tmp_dir, "registry.image"))
+        print(f"image: {os.path.getsize(image_path) / 1024:.0f} KB")
+        print(f"{'mode':<8}{'load (ms)':>12}{'private / worker':>20}")
+
+        for mode in modes:
+            queue = ctx.Queue()
+            workers = [ctx.Process(target=_worker, args=(mode, image_path, args.touch, queue)) for _ in range(args.workers)]
+            for worker in workers:
+                worker.start()
+            results = [queue.get() for _ in workers]
+            for worker in workers:
+                worker.join()
+
+            elapsed = sum(r[0] for r in results) / len(results)
+            private = sum(r[1] for r in results) / len(results)
+            print(f"{mode:<8}{elapsed:>12.1f}{private / 1024:>17.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+"""
+RequestModel oluşturma maliyetini, planı her çağrıda derleyerek ve
+önceden derlenmiş planı kullanarak karşılaştırır.
+
+Kullanım:
+    PYTHONPATH=src python benchmarks/bench_request_plan.py [kategori] [--repeat N]
+"""
+
+import argparse
+import os
+import time
+
+from epint.endpoints import get_endpoints_dir
+from epint.models.request_model import RequestModel
+from epint.models.request_plan import compile_request_plan
+from epint.models.request_validator import RequestValidator
+from epint.models.swagger import SwaggerModel
+
+KWARGS = {"startDate": "2026-01-01", "endDate": "2026-01-31"}
+
+
+def _per_call_us(func, endpoints, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for endpoint, plan in endpoints:
+            func(endpoint, plan)
+    return (time.perf_counter() - start) / (repeat * len(endpoints)) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("category", nargs="?", default="seffaflik-electricity")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    # Tüm endpoint'ler aynı genel kwargs ile oluşturulur; eksik zorunlu alanlar ölçümü kesmesin
+    RequestValidator.set_enabled(False)
+
+    swagger_path = os.path.join(get_endpoints_dir(), args.category, "swagger.json")
+    swagger_model = SwaggerModel(swagger_path, category=args.category)
+    endpoints = [(data, compile_request_plan(data)) for data in swagger_model.get_all_endpoints().values()]
+
+    compile_each = _per_call_us(lambda data, plan: RequestModel(data, KWARGS), endpoints, args.repeat)
+    cached_plan = _per_call_us(lambda data, plan: RequestModel(data, KWARGS, plan), endpoints, args.repeat)
+    compile_only = _per_call_us(lambda data, plan: compile_request_plan(data), endpoints, args.repeat)
+
+    print(f"{args.category}: {len(endpoints)} endpoints")
+    print(f"{'compile per call':<22}{compile_each:>10.1f} us")
+    print(f"{'cached plan':<22}{cached_plan:>10.1f} us")
+    print(f"{'plan compile only':<22}{compile_only:>10.1f} us")
+
+
+if __name__ == "__main__":
+    main()
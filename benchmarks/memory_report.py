@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+"""
+Yüklenen her kategori için endpoint verisinin bellekte kapladığı byte'ları raporlar.
+
+    expanded : Çözülmüş endpoint verisinin her referans kendi kopyasını
+               tutsaydı kaplayacağı boyut - definition'lar memoize edilmeden
+               önceki davranışın üst sınırı (eski çözümleyici tekrar eden
+               referansları None'a düşürüyordu)
+    shared   : Aynı verinin gerçek boyutu (paylaşılan definition objeleri bir
+               kez sayılır)
+    full     : Normal modda registry'nin tuttuğu toplam: ham swagger verisi
+               (SwaggerModel._data) + çözülmüş endpoint'ler, string'ler dahil
+    lean     : Lean registry modunda tutulan toplam, string'ler dahil
+
+expanded/shared sütunlarında string'ler ham spec ile paylaşıldığından yalnızca
+dict/list konteynerleri sayılır.
+
+Kullanım:
+    PYTHONPATH=src python benchmarks/memory_report.py [kategori ...]
+"""
+
+import argparse
+import os
+import sys
+from typing import Any, Dict, Set
+
+from epint.endpoints import get_endpoints_dir, list_categories
+from epint.models.swagger import SwaggerModel, to_lean_endpoint
+
+
+def shared_size(obj: Any, seen: Set[int], count_strings: bool = False) -> int:
+    """Konteynerleri (ve istenirse string'leri) her obje bir kez sayılacak şekilde topla"""
+    if id(obj) in seen:
+        return 0
+    if isinstance(obj, str):
+        if not count_strings:
+            return 0
+        seen.add(id(obj))
+        return sys.getsizeof(obj)
+    if not isinstance(obj, (dict, list)):
+        return 0
+    seen.add(id(obj))
+
+    size = sys.getsizeof(obj)
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += shared_size(key, seen, count_strings) + shared_size(value, seen, count_strings)
+    else:
+        size += sum(shared_size(item, seen, count_strings) for item in obj)
+    return size
+
+
+def expanded_size(obj: Any, memo: Dict[int, int]) -> int:
+    """Konteynerleri paylaşılan objeler her referansta yeniden sayılacak şekilde topla"""
+    if not isinstance(obj, (dict, list)):
+        return 0
+    if id(obj) not in memo:
+        values = obj.values() if isinstance(obj, dict) else obj
+        memo[id(obj)] = sys.getsizeof(obj) + sum(expanded_size(value, memo) for value in values)
+    return memo[id(obj)]
+
+
+def _format_bytes(size: int) -> str:
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.1f} {unit}" if unit != "B" else f"{size} B"
+        size /= 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("categories", nargs="*")
+    args = parser.parse_args()
+
+    print(f"{'category':<28}{'expanded':>12}{'shared':>12}{'full':>12}{'lean':>12}{'full/lean':>11}")
+    totals = [0, 0, 0, 0]
+
+    for category in sorted(args.categories or list_categories()):
+        swagger_path = os.path.join(get_endpoints_dir(), category, "swagger.json")
+        swagger_model = SwaggerModel(swagger_path, category=category)
+        endpoints = dict(swagger_model.get_all_endpoints().items())
+
+        expanded = expanded_size(endpoints, {})
+        shared = shared_size(endpoints, set())
+        full = shared_size([swagger_model._data, endpoints], set(), count_strings=True)
+        memo = {}
+        lean_endpoints = {name: to_lean_endpoint(data, memo) for name, data in endpoints.items()}
+        lean = shared_size(lean_endpoints, set(), count_strings=True)
+
+        for i, size in enumerate((expanded, shared, full, lean)):
+            totals[i] += size
+        _print_row(category, expanded, shared, full, lean)
+
+    _print_row("TOTAL", *totals)
+
+
+def _print_row(label: str, expanded: int, shared: int, full: int, lean: int) -> None:
+    sizes = "".join(f"{_format_bytes(size):>12}" for size in (expanded, shared, full, lean))
+    print(f"{label:<28}{sizes}{full / lean:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
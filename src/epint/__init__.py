@@ -14,18 +14,29 @@
 
 from .modules.version import __version__, __appname__, __fullname__, __author__
 from .modules.search.ipython_blockage import IPYTHON_MAGIC_METHODS
-from .modules.datetime import DateTimeUtils
 from .modules.search.method_name_decorator import to_python_method_name
 from .modules.search.find_closest import find_closest_match
 from .modules.category_proxy import CategoryProxy
-from .endpoints import get_endpoints_dir, list_categories
+from .endpoints import categories_version, get_endpoints_dir, list_categories
 from .models.endpoint_registry import EndpointModel
 import os
+from typing import Optional
 
 
+# İlk erişimde import edilen public isimler (import epint süresini kısa tutmak için)
+_LAZY_ATTRIBUTES = {
+    'DateTimeUtils': '.modules.datetime',
+}
+
 # Kategori cache
 _category_objects = {}
 
+# epint.<isim> -> kategori ismi çözümleme cache'i; sadece bulunan isimler tutulur,
+# kategori listesi yenilenince (bkz. refresh_categories) veya sınır dolunca boşaltılır
+_resolved_names = {}
+_resolved_version = None
+_RESOLVED_NAMES_LIMIT = 256
+
 # Kategori alternatif isimleri (alias'lar)
 CATEGORY_ALIASES = {
     'transparency': 'seffaflik-electricity',
@@ -61,6 +72,118 @@ def set_mode(mode: str) -> None:
 
     _mode = "test" if mode.lower() != "prod" else "prod"
 
+def set_lean_registry(enabled: bool = True) -> None:
+    """Lean registry modunu ayarla (bkz. EndpointModel.set_lean)"""
+    EndpointModel.set_lean(enabled)
+
+def use_registry_image(path: Optional[str] = None) -> bool:
+    """Kategorileri mmap'lenen registry imajından yükle (bkz. EndpointModel.use_registry_image)"""
+    return EndpointModel.use_registry_image(path)
+
+def set_request_validation(enabled: bool = True) -> None:
+    """Ticket alınmadan önce yapılan required/enum/format kontrolünü aç/kapat (bkz. RequestValidator)"""
+    from .models.request_validator import RequestValidator
+    RequestValidator.set_enabled(enabled)
+
+def set_hedging(categories, enabled: bool = True, policy=None) -> None:
+    """
+    Şeffaflık kategorileri için hedged request'leri aç/kapat (bkz. Hedging)
+
+    Args:
+        categories: Kategori ismi/alias'ı veya listesi ('seffaflik' tüm şeffaflık kategorileri)
+        enabled: False ise kapatır
+        policy: HedgePolicy (None ise varsayılan: p95 gecikme)
+    """
+    from .modules.http_client.hedging import Hedging
+    if isinstance(categories, str):
+        categories = [categories]
+    names = [CATEGORY_ALIASES.get(category, category) for category in categories]
+    if enabled:
+        Hedging.enable(names, policy)
+    else:
+        Hedging.disable(names)
+
+def set_http_cache(targets, enabled: bool = True, ttl=None, store=None) -> None:
+    """
+    Endpoint'ler veya kategoriler için ETag/Last-Modified cache'ini aç/kapat (bkz. HTTPCache)
+
+    Args:
+        targets: 'kategori' veya 'kategori.endpoint' (ör. 'transparency.powerplant_list') ya da listesi
+        enabled: False ise kapatır
+        ttl: Sunucu validator göndermezse kaydın taze sayılacağı süre (saniye)
+        store: HTTPCache (None ise geçici dizindeki varsayılan depo)
+    """
+    from .modules.http_client.http_cache import CachePolicy, Caching
+    if isinstance(targets, str):
+        targets = [targets]
+    names = []
+    for target in targets:
+        category, _, name = target.partition('.')
+        category = CATEGORY_ALIASES.get(category, category).replace('_', '-')
+        names.append(f"{category}.{name}" if name else category)
+    if enabled:
+        Caching.enable(names, CachePolicy(ttl, store))
+    else:
+        Caching.disable(names)
+
+def get_rate_limit_state() -> list:
+    """Host/kullanıcı bazındaki rate limiter'ların anlık durumu (bkz. RateLimiter.state)"""
+    from .modules.http_client.rate_limiter import RateLimiter
+    return RateLimiter.states()
+
+def get_circuit_breaker_state() -> list:
+    """Host bazındaki circuit breaker'ların anlık durumu (bkz. CircuitBreaker.state)"""
+    from .modules.http_client.circuit_breaker import CircuitBreaker
+    return CircuitBreaker.states()
+
+def is_host_available(url: str) -> bool:
+    """URL'in host'una istek gönderilebilir mi (devre açıksa False; toplu işleri ertelemek için)"""
+    from .modules.http_client.circuit_breaker import CircuitBreaker
+    return CircuitBreaker.is_available(url)
+
+def warmup(categories=None, connections: int = 2, tickets: bool = True,
+           keep_warm: bool = False, interval: Optional[float] = None) -> dict:
+    """
+    Kategorileri yükle, host'lara bağlantı aç ve TGT'leri al (bkz. modules.warmup)
+
+    Args:
+        categories: Kategori ismi/alias'ı veya listesi (None ise yüklenmiş kategoriler)
+        connections: Host başına havuzda açılacak bağlantı sayısı
+        tickets: False ise TGT alınmaz
+        keep_warm: True ise bağlantılar ve ticket'lar arka planda periyodik olarak sıcak tutulur
+        interval: Keep-warm periyodu (saniye; None ise KEEP_WARM_INTERVAL)
+
+    Returns:
+        Host başına açılan bağlantı/süre/hata, ticket durumu ve toplam süre
+    """
+    from .modules.warmup import KEEP_WARM_INTERVAL, KeepWarm, warmup as _warmup
+    if tickets:
+        _check_auth()
+    if categories is None:
+        names = list(EndpointModel.get_all_categories())
+    else:
+        if isinstance(categories, str):
+            categories = [categories]
+        names = []
+        for category in categories:
+            name = _resolve_category(category)
+            if name is None:
+                raise ValueError(f"Kategori bulunamadı: {category}")
+            if name not in names:
+                names.append(name)
+    for name in names:
+        load_category(name)
+
+    report = _warmup(names, connections, tickets)
+    if keep_warm:
+        KeepWarm.start(names, connections, tickets, interval or KEEP_WARM_INTERVAL)
+    return report
+
+def stop_keep_warm() -> None:
+    """warmup(keep_warm=True) ile başlatılan arka plan ısınmasını durdur"""
+    from .modules.warmup import KeepWarm
+    KeepWarm.stop_current()
+
 def _check_auth():
     """Auth bilgilerinin set edilip edilmediğini kontrol et"""
     if _username is None or _password is None:
@@ -82,37 +205,24 @@ def get_endpoints(category: str):
     """Kategori endpoint'lerini döndür"""
     return EndpointModel.get_category_endpoints(category)
 
-def __getattr__(name):
-    if name in IPYTHON_MAGIC_METHODS:
-        raise AttributeError(f"'{__name__}' module has blocked attribute '{name}'")
-
+def _resolve_category(name: str) -> Optional[str]:
+    """Attribute ismini kategori ismine çöz (alias, seffaflik/reconciliation kısaltmaları ve fuzzy matching)"""
     categories = list_categories()
 
     # 1. Önce orijinal isimle tam eşleşme kontrolü (en yüksek öncelik)
     if name in categories:
-        load_category(name)
-        if name not in _category_objects:
-            _category_objects[name] = CategoryProxy(name)
-        return _category_objects[name]
+        return name
 
     # 2. Alternatif isimlerle (alias) eşleşme kontrolü
     if name in CATEGORY_ALIASES:
-        category = CATEGORY_ALIASES[name]
-        load_category(category)
-        if category not in _category_objects:
-            _category_objects[category] = CategoryProxy(category)
-        return _category_objects[category]
+        return CATEGORY_ALIASES[name]
 
     # 2b. Alternatif isimlerle (alias) fuzzy matching
     normalized_name = to_python_method_name(name)
     alias_keys = list(CATEGORY_ALIASES.keys())
     closest_alias = find_closest_match(normalized_name, alias_keys, threshold=0.6)
     if closest_alias:
-        category = CATEGORY_ALIASES[closest_alias]
-        load_category(category)
-        if category not in _category_objects:
-            _category_objects[category] = CategoryProxy(category)
-        return _category_objects[category]
+        return CATEGORY_ALIASES[closest_alias]
     normalized_categories = {to_python_method_name(cat): cat for cat in categories}
 
     # 3. Seffaflik kategorileri için prefix'i yoksayarak arama
@@ -132,32 +242,20 @@ def __getattr__(name):
                     or name_lower in seffaflik_variants
                     or (fuzzy_match and (normalized_name == fuzzy_match or name_lower == fuzzy_match))
                 ):
-                    category = 'seffaflik-electricity'
-                    load_category(category)
-                    if category not in _category_objects:
-                        _category_objects[category] = CategoryProxy(category)
-                    return _category_objects[category]
+                    return 'seffaflik-electricity'
                 else:
                     # Alt kategori ismi varsa (örn: "electricity", "naturalgas") fuzzy matching yap
                     for cat in seffaflik_categories:
                         suffix = cat.replace('seffaflik-', '')
                         normalized_suffix = to_python_method_name(suffix)
                         if normalized_name == normalized_suffix:
-                            category = cat
-                            load_category(category)
-                            if category not in _category_objects:
-                                _category_objects[category] = CategoryProxy(category)
-                            return _category_objects[category]
+                            return cat
                     # Fuzzy matching ile en yakın seffaflik kategorisini bul
                     closest_seffaflik = find_closest_match(normalized_name, [to_python_method_name(cat.replace('seffaflik-', '')) for cat in seffaflik_categories], threshold=0.6)
                     if closest_seffaflik:
                         for cat in seffaflik_categories:
                             if to_python_method_name(cat.replace('seffaflik-', '')) == closest_seffaflik:
-                                category = cat
-                                load_category(category)
-                                if category not in _category_objects:
-                                    _category_objects[category] = CategoryProxy(category)
-                                return _category_objects[category]
+                                return cat
 
     # 4. Reconciliation kategorileri için prefix'i yoksayarak arama
     # Örnek: "invoice" -> "reconciliation-invoice"
@@ -168,37 +266,57 @@ def __getattr__(name):
                 suffix = cat.replace('reconciliation-', '')
                 normalized_suffix = to_python_method_name(suffix)
                 if normalized_name == normalized_suffix:
-                    category = cat
-                    load_category(category)
-                    if category not in _category_objects:
-                        _category_objects[category] = CategoryProxy(category)
-                    return _category_objects[category]
+                    return cat
 
     # 4. Normalize edilmiş isimle tam eşleşme kontrolü
     if normalized_name in normalized_categories:
-        category = normalized_categories[normalized_name]
-        load_category(category)
-        if category not in _category_objects:
-            _category_objects[category] = CategoryProxy(category)
-        return _category_objects[category]
+        return normalized_categories[normalized_name]
 
     # 5. Normalize edilmiş isimle fuzzy matching
     closest_normalized = find_closest_match(normalized_name, list(normalized_categories.keys()), threshold=0.6)
     if closest_normalized:
-        category = normalized_categories[closest_normalized]
-        load_category(category)
-        if category not in _category_objects:
-            _category_objects[category] = CategoryProxy(category)
-        return _category_objects[category]
+        return normalized_categories[closest_normalized]
 
     # 6. Orijinal kategori isimleriyle fuzzy matching (en düşük öncelik)
     closest = find_closest_match(normalized_name, categories, threshold=0.6)
     if closest:
-        load_category(closest)
-        if closest not in _category_objects:
-            _category_objects[closest] = CategoryProxy(closest)
-        return _category_objects[closest]
+        return closest
+
+    return None
+
+def __getattr__(name):
+    if name in IPYTHON_MAGIC_METHODS:
+        raise AttributeError(f"'{__name__}' module has blocked attribute '{name}'")
+
+    if name in _LAZY_ATTRIBUTES:
+        import importlib
+        value = getattr(importlib.import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+
+    # Bulunan isimler (typo'lar dahil) cache'lenir; tekrar eden erişimler dosya
+    # sistemine ve fuzzy matching'e uğramaz. Bulunamayanlar cache'lenmez: sonradan
+    # eklenen kategoriler çözülebilir ve hasattr() denemeleri cache'i büyütmez.
+    global _resolved_version
+    version = categories_version()
+    if version != _resolved_version:
+        _resolved_names.clear()
+        _resolved_version = version
+
+    category = _resolved_names.get(name)
+    if category is None:
+        category = _resolve_category(name)
+        if category is None:
+            raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+        if len(_resolved_names) >= _RESOLVED_NAMES_LIMIT:
+            _resolved_names.clear()
+        _resolved_names[name] = category
+
+    proxy = _category_objects.get(category)
+    if proxy is None:
+        load_category(category)
+        proxy = _category_objects.setdefault(category, CategoryProxy(category))
+    return proxy
 
-    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
@@ -12,13 +12,65 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import json
 import os
-from typing import Dict, Any
+from typing import Dict, Any, List, Optional
+
+
+MANIFEST_FILENAME = "manifest.json"
+
+# list_categories() sonucu; refresh_categories() çağrılana kadar bir kez hesaplanır
+_categories: Optional[List[str]] = None
+
+# Kategori listesi her yenilendiğinde artar (isim çözümleme cache'leri için)
+_categories_version = 0
 
 
 def get_endpoints_dir() -> str:
     return os.path.dirname(__file__)
 
-def list_categories() -> list:
+def get_manifest_path() -> str:
+    return os.path.join(get_endpoints_dir(), MANIFEST_FILENAME)
+
+def scan_categories() -> list:
+    """Kategori dizinlerini dosya sisteminden tara"""
     return [d for d in os.listdir(get_endpoints_dir()) 
             if os.path.isdir(os.path.join(get_endpoints_dir(), d)) and not d.startswith('_')]
+
+def write_manifest(path: Optional[str] = None) -> str:
+    """Build sırasında kategori listesini statik manifest dosyasına yaz"""
+    path = path or get_manifest_path()
+    tmp_path = path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({'categories': sorted(scan_categories())}, f)
+    os.replace(tmp_path, path)
+    refresh_categories()
+    return path
+
+def refresh_categories() -> None:
+    """list_categories() sonucunu unut; sonraki çağrı manifest/dizinden yeniden okur"""
+    global _categories, _categories_version
+
+    _categories = None
+    _categories_version += 1
+
+def categories_version() -> int:
+    """Kategori listesinin sürümü (refresh_categories ile artar)"""
+    return _categories_version
+
+def list_categories() -> list:
+    """
+    Kategori isimlerini döndür
+
+    Build sırasında üretilen manifest varsa oradan, yoksa dizin taramasıyla
+    bir kez hesaplanır; sonraki çağrılar dosya sistemine dokunmaz.
+    """
+    global _categories
+
+    if _categories is None:
+        try:
+            with open(get_manifest_path(), 'r', encoding='utf-8') as f:
+                _categories = list(json.load(f)['categories'])
+        except (OSError, ValueError, KeyError, TypeError):
+            _categories = scan_categories()
+    return list(_categories)
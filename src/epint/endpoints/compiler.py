@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Kategori swagger.json dosyalarını önceden derlenmiş endpoint index'ine çevirir.
+
+Index; çözülmüş parametreleri, response schema'larını, normalize edilmiş
+method isimlerini ve host bilgisini tek bir pickle dosyasında tutar. Böylece
+runtime'da json.load + $ref çözümleme maliyeti yerine tek bir okuma yapılır.
+
+Derleme, kategori listesini de statik manifest dosyasına yazar (bkz.
+epint.endpoints.list_categories).
+
+Build adımı (bkz. epint.endpoints.__main__):
+    python -m epint.endpoints            # tüm kategoriler
+    python -m epint.endpoints gop grid   # seçili kategoriler
+    python -m epint.endpoints --image    # + tek dosyalık registry imajı
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import sys
+import tempfile
+import threading
+from typing import Dict, Any, List, Optional
+
+from . import get_endpoints_dir, scan_categories, write_manifest
+
+
+INDEX_FILENAME = "index.pickle"
+INDEX_FORMAT = 2
+
+
+def get_index_path(swagger_path: str) -> str:
+    """swagger.json ile aynı dizindeki index dosyasının yolunu döndür"""
+    return os.path.join(os.path.dirname(swagger_path), INDEX_FILENAME)
+
+
+def source_signature(swagger_path: str) -> Dict[str, Any]:
+    """Kaynak swagger.json'ın boyutu, mtime'ı ve içerik hash'i"""
+    stat = os.stat(swagger_path)
+    return {'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns, 'sha256': _file_digest(swagger_path)}
+
+
+def _file_digest(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def is_source_current(signature: Optional[Dict[str, Any]], swagger_path: str) -> bool:
+    """
+    Derlenmiş veri kaynak swagger.json ile hâlâ tutarlı mı?
+
+    Boyut farklıysa eski; boyut ve mtime aynıysa güncel sayılır. Sadece mtime
+    değişmişse (aynı boyutta düzenleme, paket kurulumu, checkout) içerik
+    hash'i karşılaştırılır; eşleşen (boyut, mtime) ikilisi doğrulama
+    kayıtlarına yazılır ve sonraki process'ler dosyayı tekrar hash'lemez.
+    Kaynak dosya okunamıyorsa derlenmiş veri kullanılır.
+    """
+    try:
+        stat = os.stat(swagger_path)
+    except OSError:
+        return True
+    if not signature or stat.st_size != signature.get('size'):
+        return False
+    if stat.st_mtime_ns == signature.get('mtime_ns'):
+        return True
+
+    stamp = [stat.st_size, stat.st_mtime_ns, signature.get('sha256')]
+    stamps = _read_stamps()
+    if stamps.get(os.path.abspath(swagger_path)) == stamp:
+        return True
+    try:
+        if _file_digest(swagger_path) != signature.get('sha256'):
+            return False
+    except OSError:
+        return True
+    _write_stamp(os.path.abspath(swagger_path), stamp)
+    return True
+
+
+# Hash'i doğrulanmış kaynakların {yol: [boyut, mtime_ns, sha256]} kayıtları
+STAMPS_FILENAME = "source-stamps.json"
+_stamps_lock = threading.Lock()
+
+
+def _stamps_path() -> str:
+    """Doğrulama kayıtları paket dizini salt-okunur olabileceği için geçici dizinde tutulur"""
+    import getpass
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = str(os.getuid()) if hasattr(os, 'getuid') else 'shared'
+    user_hash = hashlib.md5(user.encode('utf-8', errors='ignore')).hexdigest()[:8]
+    return os.path.join(tempfile.gettempdir(), f"epint-{user_hash}", STAMPS_FILENAME)
+
+
+def _read_stamps() -> Dict[str, Any]:
+    try:
+        with open(_stamps_path(), 'r', encoding='utf-8') as f:
+            stamps = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    return stamps if isinstance(stamps, dict) else {}
+
+
+def _write_stamp(swagger_path: str, stamp: List[Any]) -> None:
+    path = _stamps_path()
+    with _stamps_lock:
+        stamps = _read_stamps()
+        stamps[swagger_path] = stamp
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(stamps, f)
+            os.replace(tmp_path, path)
+        except OSError:
+            pass
+
+
+def build_index(category: str, swagger_path: str) -> Dict[str, Any]:
+    """Swagger dosyasını parse edip index sözlüğünü oluştur"""
+    from ..models.swagger import SwaggerModel
+    from ..modules.search.method_name_decorator import to_python_method_name
+
+    swagger_model = SwaggerModel(swagger_path, category=category)
+
+    # Index tamamen çözülmüş veriyi taşır; lazy tablo burada bir kez gezilir
+    endpoints = {name: dict(data) for name, data in swagger_model.get_all_endpoints().items()}
+
+    return {
+        'format': INDEX_FORMAT,
+        'category': category,
+        'source': source_signature(swagger_path),
+        'host': swagger_model.host,
+        'basePath': swagger_model.base_path,
+        'endpoints': endpoints,
+        'method_names': {to_python_method_name(name): name for name in endpoints},
+    }
+
+
+def compile_category(category: str, swagger_path: Optional[str] = None, output_path: Optional[str] = None) -> str:
+    """
+    Tek bir kategorinin index dosyasını üret
+
+    Args:
+        category: Kategori ismi (örn: 'seffaflik-electricity')
+        swagger_path: Kaynak swagger.json yolu (None ise paket içindeki dosya)
+        output_path: Index'in yazılacağı yol (None ise swagger.json'ın yanı)
+
+    Returns:
+        Yazılan index dosyasının yolu
+    """
+    if swagger_path is None:
+        swagger_path = os.path.join(get_endpoints_dir(), category, "swagger.json")
+    if output_path is None:
+        output_path = get_index_path(swagger_path)
+
+    index = build_index(category, swagger_path)
+
+    # Yarım yazılmış dosya okunmasın diye önce geçici dosyaya yaz
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, output_path)
+
+    return output_path
+
+
+def compile_all(categories: Optional[List[str]] = None) -> List[str]:
+    """Verilen (veya tüm) kategorilerin index dosyalarını üret"""
+    written = []
+    for category in sorted(categories or scan_categories()):
+        swagger_path = os.path.join(get_endpoints_dir(), category, "swagger.json")
+        if os.path.exists(swagger_path):
+            written.append(compile_category(category, swagger_path))
+    return written
+
+
+def load_index(index_path: str, swagger_path: Optional[str] = None) -> Optional[Dict[str, Any]]:
+    """
+    Index dosyasını oku
+
+    Dosya yoksa, okunamıyorsa, formatı eskiyse veya kaynak swagger.json
+    index üretildikten sonra değişmişse None döner; çağıran taraf JSON'a
+    fallback yapar.
+
+    Args:
+        index_path: Index dosyasının yolu
+        swagger_path: Kaynak swagger.json yolu (tutarlılık kontrolü için)
+
+    Returns:
+        Index sözlüğü veya None
+    """
+    try:
+        with open(index_path, 'rb') as f:
+            index = pickle.load(f)
+    except FileNotFoundError:
+        return None
+    except Exception:
+        # Bozuk/uyumsuz index: sessizce JSON'a dön
+        return None
+
+    if not isinstance(index, dict) or index.get('format') != INDEX_FORMAT:
+        return None
+
+    if swagger_path is not None and not is_source_current(index.get('source'), swagger_path):
+        return None
+
+    return index
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    argv = sys.argv[1:] if argv is None else argv
+    with_image = '--image' in argv
+    categories = [arg for arg in argv if arg != '--image'] or None
+
+    written = compile_all(categories)
+    written.append(write_manifest())
+    if with_image:
+        from .registry_image import build_image
+        written.append(build_image(categories=categories))
+
+    for path in written:
+        print(f"{path} ({os.path.getsize(path)} bytes)")
+    return 0
@@ -0,0 +1,209 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Tüm kategorilerin derlenmiş endpoint'lerini tek bir salt-okunur dosyada tutan
+registry imajı.
+
+Dosya her process'te mmap ile açılır; sayfalar işletim sisteminin page
+cache'i üzerinden process'ler arasında paylaşılır. Her endpoint ayrı bir
+pickle bloğu olarak saklandığı için sadece erişilen endpoint'ler
+unpickle edilir.
+
+Dosya düzeni:
+    [magic (8 byte)][format (uint32)][header uzunluğu (uint64)]
+    [header pickle][endpoint blokları ...]
+
+Header; kategori başına host/basePath, kaynak swagger.json imzası
+(boyut, mtime, sha256),
+normalize edilmiş method isimleri ve {endpoint_ismi: (offset, uzunluk)}
+tablosunu içerir.
+"""
+
+import mmap
+import os
+import pickle
+import struct
+from typing import Dict, Any, List, Optional, Tuple
+
+from . import get_endpoints_dir, scan_categories
+
+
+IMAGE_FILENAME = "registry.image"
+IMAGE_MAGIC = b"EPINTREG"
+IMAGE_FORMAT = 2
+
+_PREAMBLE = struct.Struct("<8sIQ")
+
+
+def get_image_path() -> str:
+    """Paket içindeki varsayılan registry imajının yolu"""
+    return os.path.join(get_endpoints_dir(), IMAGE_FILENAME)
+
+
+def build_image(output_path: Optional[str] = None, categories: Optional[List[str]] = None,
+                swagger_paths: Optional[Dict[str, str]] = None) -> str:
+    """
+    Registry imajını üret
+
+    Args:
+        output_path: İmajın yazılacağı yol (None ise paket içindeki varsayılan yol)
+        categories: Dahil edilecek kategoriler (None ise tüm kategoriler)
+        swagger_paths: {kategori: swagger.json yolu} (None ise paket içindeki dosyalar)
+
+    Returns:
+        Yazılan imaj dosyasının yolu
+    """
+    from .compiler import build_index
+
+    if output_path is None:
+        output_path = get_image_path()
+    if swagger_paths is None:
+        swagger_paths = {
+            category: os.path.join(get_endpoints_dir(), category, "swagger.json")
+            for category in (categories or scan_categories())
+        }
+
+    header: Dict[str, Dict[str, Any]] = {}
+    blobs: List[bytes] = []
+    offset = 0
+
+    for category in sorted(swagger_paths):
+        swagger_path = swagger_paths[category]
+        if not os.path.exists(swagger_path):
+            continue
+
+        index = build_index(category, swagger_path)
+        offsets: Dict[str, Tuple[int, int]] = {}
+        for name, endpoint_data in index['endpoints'].items():
+            blob = pickle.dumps(endpoint_data, protocol=pickle.HIGHEST_PROTOCOL)
+            offsets[name] = (offset, len(blob))
+            blobs.append(blob)
+            offset += len(blob)
+
+        header[category] = {
+            'source': index['source'],
+            'host': index['host'],
+            'basePath': index['basePath'],
+            'method_names': index['method_names'],
+            'endpoints': offsets,
+        }
+
+    header_blob = pickle.dumps({'categories': header}, protocol=pickle.HIGHEST_PROTOCOL)
+
+    # Yarım yazılmış imaj açılmasın diye önce geçici dosyaya yaz
+    tmp_path = output_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(_PREAMBLE.pack(IMAGE_MAGIC, IMAGE_FORMAT, len(header_blob)))
+        f.write(header_blob)
+        for blob in blobs:
+            f.write(blob)
+    os.replace(tmp_path, output_path)
+
+    return output_path
+
+
+class RegistryImage:
+    """mmap ile açılmış salt-okunur registry imajı"""
+
+    def __init__(self, path: str):
+        """
+        İmajı aç ve header'ı oku
+
+        Raises:
+            OSError: Dosya açılamazsa
+            ValueError: Dosya geçerli bir registry imajı değilse
+        """
+        self.path = path
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            if len(self._mmap) < _PREAMBLE.size:
+                raise ValueError(f"Geçersiz registry imajı: {path}")
+            magic, image_format, header_size = _PREAMBLE.unpack_from(self._mmap, 0)
+            if magic != IMAGE_MAGIC or image_format != IMAGE_FORMAT:
+                raise ValueError(f"Desteklenmeyen registry imajı: {path}")
+
+            header_end = _PREAMBLE.size + header_size
+            header = pickle.loads(self._mmap[_PREAMBLE.size:header_end])
+        except ValueError:
+            self._mmap.close()
+            raise
+        except Exception as e:
+            self._mmap.close()
+            raise ValueError(f"Bozuk registry imajı: {path}") from e
+
+        self._categories: Dict[str, Dict[str, Any]] = header['categories']
+        self._data_offset = header_end
+
+    def has_category(self, category: str, swagger_path: Optional[str] = None) -> bool:
+        """
+        Kategori imajda var mı (ve kaynak swagger.json değişmemiş mi)?
+
+        Args:
+            category: Kategori ismi
+            swagger_path: Verilirse dosya imajdaki imzayla karşılaştırılır (bkz. is_source_current)
+        """
+        from .compiler import is_source_current
+
+        info = self._categories.get(category)
+        if info is None:
+            return False
+        return swagger_path is None or is_source_current(info.get('source'), swagger_path)
+
+    def get_categories(self) -> List[str]:
+        """İmajdaki kategori isimleri"""
+        return list(self._categories)
+
+    def get_operations(self, category: str) -> Dict[str, Tuple[int, int]]:
+        """Kategori endpoint'lerinin {isim: (offset, uzunluk)} tablosu (kopya)"""
+        return dict(self._categories[category]['endpoints'])
+
+    def get_method_names(self, category: str) -> Dict[str, str]:
+        """Normalize edilmiş method isimlerinden endpoint isimlerine mapping"""
+        return self._categories[category]['method_names']
+
+    def read_endpoint(self, offset: int, length: int) -> Dict[str, Any]:
+        """Tek bir endpoint bloğunu mmap'ten okuyup unpickle et"""
+        start = self._data_offset + offset
+        return pickle.loads(self._mmap[start:start + length])
+
+    def get_endpoint(self, category: str, name: str) -> Optional[Dict[str, Any]]:
+        """Endpoint verisini isimle oku (cache'lenmez)"""
+        info = self._categories.get(category)
+        if info is None or name not in info['endpoints']:
+            return None
+        return self.read_endpoint(*info['endpoints'][name])
+
+    def close(self):
+        self._mmap.close()
+
+    def __repr__(self) -> str:
+        return f"<RegistryImage: {self.path}, categories={len(self._categories)}>"
+
+
+def open_image(path: Optional[str] = None) -> Optional[RegistryImage]:
+    """
+    Registry imajını aç
+
+    Dosya yoksa veya geçerli bir imaj değilse None döner.
+
+    Args:
+        path: İmaj yolu (None ise paket içindeki varsayılan yol)
+    """
+    try:
+        return RegistryImage(path or get_image_path())
+    except (OSError, ValueError):
+        return None
@@ -12,16 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict, Any
+from __future__ import annotations
+
+import contextlib
+from typing import TYPE_CHECKING, Dict, Any, Optional
 
 import epint
-from ..modules.authentication.auth_manager import Authentication
-from ..modules.http_client import HTTPClient
-from ..modules.error_handler import ErrorHandler
 from ..modules.search.find_closest import dict_key_search
-from ..modules.repr_formatter.endpoint_repr import format_endpoint_repr
-from .request_model import RequestModel
-from .response_model import ResponseModel
+
+if TYPE_CHECKING:
+    from ..modules.http_client import HTTPClient
+    from ..modules.http_client.async_client import AsyncHTTPClient
+    from .prepared_endpoint import PreparedEndpoint
 
 
 class Endpoint:
@@ -31,30 +33,76 @@ class Endpoint:
         self._category = category
         self._name = name
         self._data = data
-        self.client = HTTPClient()
+        self._client: Optional[HTTPClient] = None
+        self._aclient: Optional[AsyncHTTPClient] = None
+
+    @property
+    def client(self) -> HTTPClient:
+        """HTTP client (network katmanı ilk istekte import edilir)"""
+        if self._client is None:
+            from ..modules.http_client import HTTPClient
+            self._client = HTTPClient()
+        return self._client
+
+    @client.setter
+    def client(self, client: HTTPClient):
+        self._client = client
+
+    @property
+    def aclient(self) -> AsyncHTTPClient:
+        """acall için asyncio HTTP client'ı (bağlantı havuzu process/event loop genelinde paylaşılır)"""
+        if self._aclient is None:
+            from ..modules.http_client.async_client import AsyncHTTPClient
+            self._aclient = AsyncHTTPClient()
+        return self._aclient
+
+    @aclient.setter
+    def aclient(self, client: AsyncHTTPClient):
+        self._aclient = client
 
     def __repr__(self) -> str:
         """Endpoint bilgilerini detaylı olarak göster"""
-        return format_endpoint_repr(self._category, self._name, self._data)
+        data = self._data
+        if data.get('lean'):
+            # Lean registry dokümantasyon alanlarını tutmaz, sadece burada diskten okunur
+            from .endpoint_registry import EndpointModel
+            data = EndpointModel.get_endpoint_docs(self._category, self._name) or data
+        from ..modules.repr_formatter.endpoint_repr import format_endpoint_repr
+        return format_endpoint_repr(self._category, self._name, data)
 
-    def __call__(self, **kwargs: Any) -> Dict[str, Any]:
-        """Endpoint çağrıldığında çalışır"""
+    def binding_stats(self) -> Dict[str, Any]:
+        """Kwarg -> parametre binding cache istatistikleri (hit oranı, fuzzy çözülen yazımlar)"""
+        from .endpoint_registry import EndpointModel
+        return EndpointModel.get_request_plan(self._category, self._name, self._data).bindings.stats()
 
-        all_data = dict_key_search(['allData', 'all_data', 'alldata', 'all-data', 'AllData', 'ALL_DATA'], kwargs)
+    def prepare(self, **static: Any) -> PreparedEndpoint:
+        """
+        Sabit parametreleri bir kez bağlayıp sadece değişen alanları alan callable döndür
 
-        debug = dict_key_search(['debug', 'Debug', 'DEBUG'], kwargs)
+        Örnek:
+            >>> mcp = epint.seffaflik_electricity.mcp.prepare(region='TR1')
+            >>> for day in days:
+            ...     mcp(startDate=day, endDate=day)
+        """
+        from .prepared_endpoint import PreparedEndpoint
+        return PreparedEndpoint(self, static)
+
+    def _get_auth(self, client: Optional[HTTPClient] = None):
+        """Global kimlik bilgileri ve runtime moduna göre Authentication oluştur ve client'a bağla"""
+        from ..modules.authentication.auth_manager import Authentication
 
         target_service = "transparency" if "seffaflik" in self._category else "epys"
         runtime_mode = epint._mode
         auth = Authentication(epint._username, epint._password, target_service, runtime_mode)
 
         # HTTPClient'a auth parametresini geç
-        if not hasattr(self.client, 'auth') or self.client.auth != auth:
-            self.client.auth = auth
-
-        # RequestModel oluştur
-        request_model = RequestModel(self._data, kwargs)
+        client = self.client if client is None else client
+        if not hasattr(client, 'auth') or client.auth != auth:
+            client.auth = auth
+        return auth
 
+    def _attach_tickets(self, auth, request_model) -> None:
+        """Kategoriye göre TGT/ST header'larını request'e ekle"""
         if "gop" != self._category:
             request_model.headers["TGT"] = auth.get_tgt()[0]
         if not ("gop" in self._category or "seffaflik" in self._category):
@@ -62,11 +110,18 @@ class Endpoint:
         if "gop" in self._category:
             request_model.headers["gop-service-ticket"] = auth.get_st(request_model.st_service_url)[0]
 
+    async def _aattach_tickets(self, auth, request_model) -> None:
+        """_attach_tickets'in asyncio karşılığı (ticket'lar event loop'u bloklamadan alınır)"""
+        if "gop" != self._category:
+            request_model.headers["TGT"] = (await auth.aget_tgt())[0]
+        if not ("gop" in self._category or "seffaflik" in self._category):
+            request_model.headers["ST"] = (await auth.aget_st(request_model.st_service_url))[0]
+        if "gop" in self._category:
+            request_model.headers["gop-service-ticket"] = (await auth.aget_st(request_model.st_service_url))[0]
 
-        url = self.client.buildurl(self._data.get("host"), self._data.get("basePath"), self._data.get("path"))
-        method = self._data.get("method")
-
-        # Prepare parameters for the HTTP request, including body if exists
+    @staticmethod
+    def _build_request_args(request_model) -> Dict[str, Any]:
+        """RequestModel'den HTTP client argümanlarını oluştur (body varsa dahil)"""
         request_args = {
             "headers": request_model.headers
         }
@@ -76,17 +131,53 @@ class Endpoint:
             request_args["json"] = request_model.json
         if request_model.data is not None:
             request_args["data"] = request_model.data
+        return request_args
 
-        if debug:
-            return request_model
+    def _with_hedge(self, request_args: Dict[str, Any]) -> Dict[str, Any]:
+        """Kategori için hedging açıksa (bkz. epint.set_hedging) kuralları istek argümanlarına ekle"""
+        from ..modules.http_client.hedging import Hedging
+
+        hedge = Hedging.policy_for(self._category)
+        if hedge is None:
+            return request_args
+        return dict(request_args, hedge=hedge)
+
+    def _with_cache(self, request_args: Dict[str, Any]) -> Dict[str, Any]:
+        """Endpoint veya kategorisi için cache açıksa (bkz. epint.set_http_cache) kuralları ekle"""
+        from ..modules.http_client.http_cache import Caching
+
+        cache = Caching.policy_for(self._category, self._name)
+        if cache is None:
+            return request_args
+        return dict(request_args, cache=cache)
+
+    def _send(self, auth, method: str, url: str, request_args: Dict[str, Any],
+              download: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        İsteği gönder ve ResponseModel ile parse edilmiş veriyi döndür
+
+        download verilirse (bkz. _pop_download) body parse edilmeden akışlı
+        olarak yazılır ve DownloadReport döndürülür.
+        """
+        from ..modules.error_handler import ErrorHandler
+        from .response_model import ResponseModel
 
         # ErrorHandler oluştur
         error_handler = ErrorHandler(auth)
+        if download is not None:
+            # Büyük dosyalar hedge edilmez; body iter_content ile okunur
+            request_args = dict(request_args, stream=True)
+        else:
+            request_args = self._with_cache(self._with_hedge(request_args))
         try:
             response = self.client.__getattribute__(method.lower())(
                 url,
                 **request_args
             )
+            if download is not None:
+                from ..modules.http_client.download import download_response
+                return download_response(response, **download)
+
             # ResponseModel oluştur
             response_model = ResponseModel(self._data, response)
             result_data = response_model.data
@@ -98,6 +189,146 @@ class Endpoint:
 
             raise
 
+    async def _asend(self, auth, method: str, url: str, request_args: Dict[str, Any],
+                     download: Optional[Dict[str, Any]] = None) -> Any:
+        """_send'in asyncio karşılığı (akışlı indirme event loop'u bloklamaz, bkz. adownload_response)"""
+        from ..modules.error_handler import ErrorHandler
+        from .response_model import ResponseModel
+
+        error_handler = ErrorHandler(auth)
+        if download is not None:
+            request_args = dict(request_args, stream=True)
+        else:
+            request_args = self._with_cache(self._with_hedge(request_args))
+        try:
+            response = await self.aclient.__getattribute__(method.lower())(
+                url,
+                **request_args
+            )
+            if download is not None:
+                from ..modules.http_client.download import adownload_response
+
+                return await adownload_response(response, **download)
+            return ResponseModel(self._data, response).data
+        except Exception as e:
+            error_handler.handle_exception(e)
+
+            raise
+
+    @staticmethod
+    def _pop_deadline(kwargs: Dict[str, Any]):
+        """deadline= / timeout_total= kontrol kwargs'larını ayıklayıp Deadline oluştur (yoksa None)"""
+        from ..modules.http_client.deadline import Deadline
+
+        # Fuzzy eşleşme endDate gibi gerçek parametreleri yutabileceği için sadece birebir isimler
+        options = {}
+        for option, names in (('deadline', ('deadline',)), ('timeout_total', ('timeout_total', 'timeoutTotal'))):
+            for name in names:
+                if name in kwargs:
+                    options[option] = kwargs.pop(name)
+        return Deadline.from_options(**options)
+
+    @staticmethod
+    def _pop_download(kwargs: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """to= / chunk_size= akışlı indirme seçeneklerini ayıkla (to verilmediyse None)"""
+        from ..modules.http_client.download import CHUNK_SIZE
+
+        # _pop_deadline gibi sadece birebir isimler
+        to = kwargs.pop('to', None)
+        chunk_size = kwargs.pop('chunk_size', None)
+        if to is None:
+            return None
+        return {'to': to, 'chunk_size': chunk_size or CHUNK_SIZE}
+
+    @staticmethod
+    def _deadline_scope(deadline):
+        """Deadline varsa çağrı boyunca context'e yerleştir"""
+        return deadline.activate() if deadline is not None else contextlib.nullcontext()
+
+    def _build_request_model(self, kwargs: Dict[str, Any]):
+        """Kontrol kwargs'larını (allData, debug) ayıklayıp RequestModel oluştur; (model, debug) döner"""
+        from .request_model import RequestModel
+        from .endpoint_registry import EndpointModel
+
+        all_data = dict_key_search(['allData', 'all_data', 'alldata', 'all-data', 'AllData', 'ALL_DATA'], kwargs)
+
+        debug = dict_key_search(['debug', 'Debug', 'DEBUG'], kwargs)
+
+        plan = EndpointModel.get_request_plan(self._category, self._name, self._data)
+        return RequestModel(self._data, kwargs, plan), debug
+
+    async def acall(self, **kwargs: Any) -> Any:
+        """
+        Endpoint'i asyncio ile çağır
+
+        __call__ ile aynı parametreleri alır; ticket alma, istek ve 429
+        beklemeleri event loop'u bloklamaz, task iptal edilebilir.
+
+        Örnek:
+            >>> results = await asyncio.gather(*(
+            ...     ep.transparency.mcp_data.acall(startDate=day, endDate=day) for day in days
+            ... ))
+        """
+        epint._check_auth()
+
+        deadline = self._pop_deadline(kwargs)
+        download = self._pop_download(kwargs)
+        request_model, debug = self._build_request_model(kwargs)
+        return await self._arun(self._acall(request_model, debug, download), deadline)
+
+    @staticmethod
+    async def _arun(coroutine, deadline) -> Any:
+        """Coroutine'i (varsa) deadline ile çalıştır; süre dolarsa DeadlineExceeded"""
+        import asyncio
+        from ..modules.http_client.deadline import DeadlineExceeded
+
+        if deadline is None:
+            return await coroutine
+        with deadline.activate():
+            try:
+                return await asyncio.wait_for(coroutine, deadline.remaining())
+            except asyncio.TimeoutError as e:
+                raise DeadlineExceeded(deadline, "asenkron çağrı") from e
+
+    async def _acall(self, request_model, debug, download=None) -> Any:
+        auth = self._get_auth(self.aclient)
+        await self._aattach_tickets(auth, request_model)
+
+        if debug:
+            return request_model
+
+        return await self._asend(auth, self._data.get("method"), request_model.url,
+                                 self._build_request_args(request_model), download)
+
+    def __call__(self, **kwargs: Any) -> Dict[str, Any]:
+        """Endpoint çağrıldığında çalışır"""
+        # Endpoint objeleri CategoryProxy'de cache'lendiği için auth kontrolü çağrıda da yapılır
+        epint._check_auth()
+
+        # Toplam süre sınırı ticket alma, tüm denemeler ve beklemeler için geçerli
+        deadline = self._pop_deadline(kwargs)
+
+        # to= verilirse export body'si bellekte tutulmadan yazılır
+        download = self._pop_download(kwargs)
+
+        # RequestModel oluştur (ticket alınmadan önce doğrulanır)
+        request_model, debug = self._build_request_model(kwargs)
+
+        with self._deadline_scope(deadline):
+            # Auth ve network katmanı (requests/urllib3) ilk gerçek çağrıda yüklenir
+            auth = self._get_auth()
+            self._attach_tickets(auth, request_model)
+
+            method = self._data.get("method")
+
+            # Prepare parameters for the HTTP request, including body if exists
+            request_args = self._build_request_args(request_model)
+
+            if debug:
+                return request_model
+
+            return self._send(auth, method, request_model.url, request_args, download)
+
 
 __all__ = ['Endpoint']
 
@@ -13,10 +13,17 @@
 # limitations under the License.
 
 import os
-from typing import Dict, Any, Optional
+from typing import TYPE_CHECKING, Dict, Any, Mapping, Optional, Tuple
 
-from .swagger import SwaggerModel
+from .swagger import LazyEndpointTable, SwaggerModel, freeze_endpoint, to_lean_endpoint
 from .endpoint_callable import Endpoint
+from ..endpoints.compiler import get_index_path, load_index
+from ..endpoints.registry_image import RegistryImage, open_image
+from ..modules.search.find_closest import FuzzyMatcher
+from ..modules.search.method_name_decorator import to_python_method_name
+
+if TYPE_CHECKING:
+    from .request_plan import RequestPlan
 
 
 class EndpointModel:
@@ -24,30 +31,121 @@ class EndpointModel:
     _endpoints: Dict[str, Dict[str, Any]] = {}
     _categories: Dict[str, Dict[str, Any]] = {}
     _swagger_models: Dict[str, SwaggerModel] = {}
+    _swagger_paths: Dict[str, str] = {}
+    _method_names: Dict[str, Dict[str, str]] = {}
+    _name_matchers: Dict[Tuple[str, bool], FuzzyMatcher] = {}
+    _lean: bool = False
+    _image: Optional[RegistryImage] = None
+    _request_plans: Dict[str, Tuple[Dict[str, Any], 'RequestPlan']] = {}
+
+    @classmethod
+    def set_lean(cls, enabled: bool = True):
+        """
+        Lean registry modunu aç/kapat
+
+        Lean modda kategoriler yüklenirken endpoint'ler tamamen derlenir,
+        yalnızca çalıştırma için gereken alanlar (tip, format, isim, konum,
+        host) tutulur ve ham swagger verisi bellekte bırakılmaz. Summary,
+        description ve example gibi dokümantasyon alanları sadece repr
+        istendiğinde diskten okunur. Ayar, bundan sonra yüklenen
+        kategorileri etkiler.
+        """
+        cls._lean = bool(enabled)
+
+    @classmethod
+    def use_registry_image(cls, path: Optional[str] = None) -> bool:
+        """
+        Kategorileri mmap ile açılan tek dosyalık registry imajından yükle
+
+        Çok process'li (gunicorn, multiprocessing) kullanımda her worker
+        swagger.json'ları ayrı ayrı parse etmek yerine aynı imaj dosyasını
+        okur; dosya sayfaları işletim sistemi tarafından paylaşılır ve
+        endpoint'ler sadece erişildiklerinde unpickle edilir. Ayar, bundan
+        sonra yüklenen kategorileri etkiler.
+
+        Args:
+            path: İmaj yolu (None ise paket içindeki varsayılan imaj,
+                  bkz. 'python -m epint.endpoints --image')
+
+        Returns:
+            İmaj açılabildiyse True
+        """
+        image = open_image(path)
+        if image is None:
+            return False
+        cls._image = image
+        return True
 
     @classmethod
     def load_swagger(cls, category: str, swagger_path: str):
-        if category in cls._swagger_models:
+        if category in cls._swagger_models or category in cls._swagger_paths:
             return  # Zaten yüklü
 
+        # Registry imajı açıksa kategori doğrudan mmap üzerinden okunur
+        image = cls._image
+        if image is not None and image.has_category(category, swagger_path):
+            cls._swagger_paths[category] = swagger_path
+            cls._categories[category] = LazyEndpointTable(cls._image_reader(image), image.get_operations(category))
+            cls._forget_method_names(category)
+            cls._method_names[category] = image.get_method_names(category)
+            return
+
+        # Önce build sırasında üretilmiş index'i dene (tek okuma, $ref çözümleme yok)
+        index = load_index(get_index_path(swagger_path), swagger_path)
+        if index is not None:
+            cls._swagger_paths[category] = swagger_path
+            cls._register_compiled(category, index['endpoints'])
+            cls._forget_method_names(category)
+            cls._method_names[category] = index['method_names']
+            return
+
         if not os.path.exists(swagger_path):
             return
 
-        swagger_model = SwaggerModel(swagger_path)
+        swagger_model = SwaggerModel(swagger_path, category=category)
+        cls._swagger_paths[category] = swagger_path
+
+        if cls._lean:
+            # Tüm endpoint'leri derle; SwaggerModel (ham spec) saklanmaz
+            cls._register_compiled(category, swagger_model.get_all_endpoints())
+            return
+
         cls._swagger_models[category] = swagger_model
 
-        # Endpoint'leri kaydet
-        for name, endpoint_data in swagger_model.get_all_endpoints().items():
-            endpoint_data['category'] = category
+        # Endpoint'ler lazy tablo olarak kaydedilir; schema'lar ilk get_endpoint /
+        # CategoryProxy erişiminde çözülür
+        cls._categories[category] = swagger_model.get_all_endpoints()
+        cls._forget_method_names(category)
+
+    @classmethod
+    def _image_reader(cls, image: RegistryImage):
+        """LazyEndpointTable için (offset, uzunluk) -> endpoint verisi okuyucusu"""
+        if not cls._lean:
+            return image.read_endpoint
+
+        # Her blok ayrı unpickle edildiği için endpoint'ler arasında paylaşılan obje
+        # yoktur; memo okuma başına oluşturulur ve kaynakla birlikte serbest kalır
+        return lambda offset, length: to_lean_endpoint(image.read_endpoint(offset, length))
+
+    @classmethod
+    def _register_compiled(cls, category: str, endpoints: Mapping[str, Dict[str, Any]]):
+        """Çözülmüş endpoint'leri (lean modda dokümantasyonsuz halleriyle) kaydet"""
+        memo: Dict[int, Any] = {}
+        for name, endpoint_data in endpoints.items():
+            if cls._lean:
+                endpoint_data = to_lean_endpoint(endpoint_data, memo)
             cls.register_endpoint(category, name, endpoint_data)
 
     @classmethod
-    def register_endpoint(cls, category: str, name: str, data: Dict[str, Any]):
-        """Endpoint kaydet"""
+    def register_endpoint(cls, category: str, name: str, data: Mapping[str, Any]):
+        """Endpoint kaydet (veri salt-okunur olarak saklanır)"""
+        data = freeze_endpoint(data)
         if category not in cls._categories:
             cls._categories[category] = {}
         cls._categories[category][name] = data
+        cls._forget_method_names(category)
         cls._endpoints[f"{category}.{name}"] = data
+        cls._request_plans.pop(f"{category}.{name}", None)
 
     @classmethod
     def get_endpoint(cls, category: str, name: str) -> Optional[Endpoint]:
@@ -57,11 +155,85 @@ class EndpointModel:
             return Endpoint(category, name, data)
         return None
 
+    @classmethod
+    def get_request_plan(cls, category: str, name: str, data: Dict[str, Any]) -> 'RequestPlan':
+        """
+        Endpoint'in derlenmiş request planını al (ilk istekte derlenir ve cache'lenir)
+
+        Plan, verildiği endpoint verisiyle birlikte saklanır; farklı bir veri
+        objesiyle istenirse yeniden derlenir.
+        """
+        key = f"{category}.{name}"
+        cached = cls._request_plans.get(key)
+        if cached is not None and cached[0] is data:
+            return cached[1]
+
+        from .request_plan import compile_request_plan
+        plan = compile_request_plan(data)
+        cls._request_plans[key] = (data, plan)
+        return plan
+
     @classmethod
     def get_category_endpoints(cls, category: str) -> Dict[str, Dict[str, Any]]:
         """Kategori endpoint'lerini al"""
         return cls._categories.get(category, {})
 
+    @classmethod
+    def get_method_names(cls, category: str) -> Dict[str, str]:
+        """Normalize edilmiş method isimlerinden endpoint isimlerine mapping"""
+        method_names = cls._method_names.get(category)
+        if method_names is None:
+            method_names = {
+                to_python_method_name(name): name
+                for name in cls.get_category_endpoints(category).keys()
+            }
+            cls._method_names[category] = method_names
+        return method_names
+
+    @classmethod
+    def get_name_matcher(cls, category: str, normalized: bool = True) -> FuzzyMatcher:
+        """
+        Kategori için bir kez kurulan FuzzyMatcher
+
+        Args:
+            category: Kategori ismi
+            normalized: True ise normalize edilmiş method isimleri, False ise endpoint isimleri
+        """
+        key = (category, normalized)
+        matcher = cls._name_matchers.get(key)
+        if matcher is None:
+            names = cls.get_method_names(category) if normalized else cls.get_category_endpoints(category)
+            matcher = cls._name_matchers[key] = FuzzyMatcher(names)
+        return matcher
+
+    @classmethod
+    def _forget_method_names(cls, category: str) -> None:
+        """Kategorinin isim tablosu değişti: method isimlerini ve matcher'ları yeniden hesaplat"""
+        cls._method_names.pop(category, None)
+        cls._name_matchers.pop((category, True), None)
+        cls._name_matchers.pop((category, False), None)
+
+    @classmethod
+    def get_endpoint_docs(cls, category: str, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Endpoint'in dokümantasyon alanlarını da içeren tam verisini diskten oku
+
+        Lean modda registry'de tutulmayan summary/description/example gibi
+        alanlar için kullanılır; sonuç cache'lenmez.
+        """
+        swagger_path = cls._swagger_paths.get(category)
+        if swagger_path is None:
+            return None
+
+        if cls._image is not None and cls._image.has_category(category, swagger_path):
+            return cls._image.get_endpoint(category, name)
+
+        index = load_index(get_index_path(swagger_path), swagger_path)
+        if index is not None:
+            return index['endpoints'].get(name)
+
+        return SwaggerModel(swagger_path, category=category).get_endpoint(name)
+
     @classmethod
     def get_all_categories(cls) -> Dict[str, Dict[str, Any]]:
         """Tüm kategorileri al"""
@@ -69,8 +241,12 @@ class EndpointModel:
 
     @classmethod
     def get_swagger_model(cls, category: str) -> Optional[SwaggerModel]:
-        """Swagger modeli al"""
-        return cls._swagger_models.get(category)
+        """Swagger modeli al (index'ten yüklenen kategoriler için ilk istekte parse edilir)"""
+        swagger_model = cls._swagger_models.get(category)
+        if swagger_model is None and category in cls._swagger_paths:
+            swagger_model = SwaggerModel(cls._swagger_paths[category], category=category)
+            cls._swagger_models[category] = swagger_model
+        return swagger_model
 
 
 __all__ = ['EndpointModel']
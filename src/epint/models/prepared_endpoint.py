@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Dict, Any, Optional, Tuple
+
+import epint
+from ..modules.search.find_closest import dict_key_search
+from .endpoint_callable import Endpoint
+from .endpoint_registry import EndpointModel
+from .request_model import RequestModel
+
+
+class PreparedEndpoint:
+    """
+    Sabit parametreleri önceden bağlanmış endpoint callable'ı (bkz. Endpoint.prepare)
+
+    Hazırlık sırasında endpoint'in request planı alınır, sabit kwargs bir kez
+    eşleştirilip dönüştürülür (template RequestModel), URL ve Authentication
+    oluşturulur. Her çağrıda sadece değişen kwargs işlenir.
+
+    Kimlik bilgileri veya runtime modu değişirse (epint.set_auth / set_mode)
+    auth ve URL bir sonraki çağrıda yeniden oluşturulur.
+    """
+
+    def __init__(self, endpoint: Endpoint, static: Dict[str, Any]):
+        epint._check_auth()
+
+        static = dict(static)
+        dict_key_search(['allData', 'all_data', 'alldata', 'all-data', 'AllData', 'ALL_DATA'], static)
+        self._debug = bool(dict_key_search(['debug', 'Debug', 'DEBUG'], static))
+        # timeout_total gibi süre seçenekleri her çağrıda yeniden başlar
+        self._deadline_options = {name: static.pop(name) for name in ('deadline', 'timeout_total', 'timeoutTotal')
+                                  if name in static}
+
+        self._endpoint = endpoint
+        self._data = endpoint._data
+        self._static = static
+        self._method = self._data.get("method")
+        self._plan = EndpointModel.get_request_plan(endpoint._category, endpoint._name, self._data)
+
+        self._auth_key: Optional[Tuple[Any, ...]] = None
+        self._auth = None
+        self._template: Optional[RequestModel] = None
+        self._url = ""
+        self._refresh()
+
+    def _refresh(self) -> None:
+        """Auth, template ve URL'yi güncel kimlik bilgileri/runtime moduna göre oluştur"""
+        self._auth_key = (epint._username, epint._password, epint._mode)
+        self._auth = self._endpoint._get_auth()
+        # Değişen zorunlu alanlar henüz yok; doğrulama her çağrıda tam request üzerinde yapılır
+        self._template = RequestModel(self._data, self._static, self._plan, validate=False)
+        self._url = self._template.url
+
+    @property
+    def static(self) -> Dict[str, Any]:
+        """Hazırlık sırasında verilen sabit kwargs (kopya)"""
+        return dict(self._static)
+
+    @property
+    def url(self) -> str:
+        """Önceden oluşturulmuş tam URL"""
+        return self._url
+
+    def _pop_deadline(self, kwargs: Dict[str, Any]):
+        """Çağrıdaki deadline/timeout_total, yoksa hazırlıkta verilen süre seçenekleri"""
+        deadline = Endpoint._pop_deadline(kwargs)
+        if deadline is None and self._deadline_options:
+            deadline = Endpoint._pop_deadline(dict(self._deadline_options))
+        return deadline
+
+    def __call__(self, **kwargs: Any) -> Any:
+        """Sadece değişen alanlarla endpoint'i çağır (sabit değerleri override edebilir)"""
+        if self._auth_key != (epint._username, epint._password, epint._mode):
+            epint._check_auth()
+            self._refresh()
+
+        endpoint = self._endpoint
+        deadline = self._pop_deadline(kwargs)
+        download = Endpoint._pop_download(kwargs)
+        request_model = RequestModel(self._data, kwargs, self._plan, template=self._template)
+        with Endpoint._deadline_scope(deadline):
+            endpoint._attach_tickets(self._auth, request_model)
+
+            if self._debug:
+                return request_model
+
+            return endpoint._send(self._auth, self._method, self._url, Endpoint._build_request_args(request_model),
+                                  download)
+
+    async def acall(self, **kwargs: Any) -> Any:
+        """__call__'ın asyncio karşılığı (bkz. Endpoint.acall)"""
+        if self._auth_key != (epint._username, epint._password, epint._mode):
+            epint._check_auth()
+            self._refresh()
+
+        deadline = self._pop_deadline(kwargs)
+        download = Endpoint._pop_download(kwargs)
+        request_model = RequestModel(self._data, kwargs, self._plan, template=self._template)
+        return await Endpoint._arun(self._acall(request_model, download), deadline)
+
+    async def _acall(self, request_model: RequestModel, download: Optional[Dict[str, Any]] = None) -> Any:
+        endpoint = self._endpoint
+        auth = endpoint._get_auth(endpoint.aclient)
+        await endpoint._aattach_tickets(auth, request_model)
+
+        if self._debug:
+            return request_model
+
+        return await endpoint._asend(auth, self._method, self._url, Endpoint._build_request_args(request_model),
+                                     download)
+
+    def __repr__(self) -> str:
+        static = ", ".join(f"{key}={value!r}" for key, value in self._static.items())
+        return f"<PreparedEndpoint: {self._endpoint._category}.{self._endpoint._name}({static})>"
+
+
+__all__ = ['PreparedEndpoint']
@@ -13,11 +13,11 @@
 # limitations under the License.
 
 import re
-from typing import Dict, Any, List, Optional, Callable
+from typing import Dict, Any, List, Mapping, Optional, Callable, Sequence
 import epint
-from ..modules.search.find_closest import find_closest_match
-from ..modules.authentication.auth_manager import Authentication
-from ..modules.datetime import DateTimeUtils
+from ..modules.search.find_closest import FuzzyMatcher
+from .request_plan import RequestPlan, compile_request_plan, convert_value, is_service_wrapper
+from .request_validator import RequestValidator
 
 
 class RequestModel:
@@ -32,50 +32,48 @@ class RequestModel:
         'counterRegionCode': lambda: 'TR1'
     }
 
-    def __init__(self, endpoint_data: Dict[str, Any], kwargs: Dict[str, Any]):
+    def __init__(self, endpoint_data: Dict[str, Any], kwargs: Dict[str, Any], plan: Optional[RequestPlan] = None,
+                 template: Optional['RequestModel'] = None, validate: bool = True):
         """
         Request model oluştur
 
         Args:
             endpoint_data: Endpoint model bilgileri (parameters, method, path, vb.)
             kwargs: Kullanıcıdan gelen parametreler
+            plan: Endpoint'in önceden derlenmiş request planı
+                  (None ise endpoint_data'dan derlenir, bkz. EndpointModel.get_request_plan)
+            template: Sabit parametrelerle önceden oluşturulmuş request model
+                      (bkz. Endpoint.prepare). Template'in eşleştirilmiş ve
+                      dönüştürülmüş değerleri kopyalanır, kwargs bunların üzerine yazılır.
+            validate: Oluşan request'i planın doğrulayıcısıyla kontrol et
+
+        Raises:
+            RequestValidationError: Zorunlu alan eksikse veya enum/format uymuyorsa
         """
         self._endpoint_data = endpoint_data
-        self._category = endpoint_data.get('category', '')
+        self._plan = plan if plan is not None else compile_request_plan(endpoint_data)
+        self._category = self._plan.category
+        self._template = template
+        self._validate = validate
         self._kwargs = kwargs.copy()
         self._params = {}
         self._headers = {}
         self._json = None
         self._data = None
+        # Body işlenmeden önceki eşleşmiş body alanları ve body'ye gitmeyen kalan kwargs
+        # (template olarak kullanıldığında sonraki request'lere aktarılır)
+        self._path_params: Dict[str, Any] = {}
+        self._bound_body: Dict[str, Any] = {}
+        self._extra_kwargs: Dict[str, Any] = {}
 
         self._parse_parameters()
 
-        st_service = self._get_st_service_endpoint(epint._mode == "test") + ".epias.com.tr"
-        host_endpoint = self._get_host(epint._mode == "test") + ".epias.com.tr"
-
-
-        self._endpoint_data["host"] = "https://%s"%host_endpoint
-        self.st_service_url = "https://%s"%st_service
-
-
-    def _get_host(self,test_mode: bool) -> str:
-
-        if "seffaflik" in self._category:
-            return "seffaflik"
-        if "gop" == self._category:
-            return "testgop" if test_mode else "gop"
-        if "gunici" == self._category:
-            return "gunici"
-
-        return "epys-prp" if test_mode else "epys"
-
-
-    def _get_st_service_endpoint(self, test_mode: bool) -> str:
-
-        if "gop" == self._category:
-            return "testgop" if test_mode else "gop"
-
-        return "epys"
+        # Host/URL'ler planda runtime moduna göre önceden hesaplanmıştır;
+        # paylaşılan endpoint verisi değiştirilmez
+        mode = epint._mode
+        self.host = self._plan.hosts[mode]
+        self.url = self._plan.urls[mode]
+        self.st_service_url = self._plan.st_service_urls[mode]
 
     def _convert_value_by_format(self, value: Any, param_schema: Dict[str, Any]) -> Any:
         """
@@ -93,58 +91,13 @@ class RequestModel:
 
         format_type = param_schema.get('format', '')
         param_type = param_schema.get('type', '')
-
-        # date-time formatı
-        if format_type == 'date-time':
-            if isinstance(value, str):
-                try:
-                    dt = DateTimeUtils.from_string(value)
-                    # GOP servisi için özel format
-                    if self._category == 'gop':
-                        return DateTimeUtils.to_gop_iso_string(dt)
-                    if self._category == "gunici":
-                        return DateTimeUtils.to_gunici_iso_string(dt)
-                    return DateTimeUtils.to_iso_string(dt)
-                except (ValueError, TypeError):
-                    return value
-            elif hasattr(value, 'strftime'):
-                # GOP servisi için özel format
-                if self._category == 'gop':
-                    return DateTimeUtils.to_gop_iso_string(value)
-                return DateTimeUtils.to_iso_string(value)
-
-        # integer formatları
-        if format_type in ('int64', 'int32') or param_type == 'integer':
-            try:
-                return int(value)
-            except (ValueError, TypeError):
-                return value
-
-        # float formatları
-        if format_type in ('float', 'double') or param_type == 'number':
-            try:
-                return float(value)
-            except (ValueError, TypeError):
-                return value
-
-        return value
-
-    def _get_param_schema(self, param_name: str, parameters: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
-        """
-        Parametre ismine göre schema bilgisini al
-
-        Args:
-            param_name: Parametre ismi
-            parameters: Parametreler listesi
-
-        Returns:
-            Parametre schema bilgisi veya None
-        """
-
-        for param in parameters:
-            if param.get('name') == param_name:
-                return param
-        return None
+        return convert_value(
+            value,
+            date_time=format_type == 'date-time',
+            integer=format_type in ('int64', 'int32') or param_type == 'integer',
+            number=format_type in ('float', 'double') or param_type == 'number',
+            category=self._category,
+        )
 
     def _get_schema_property(self, schema: Dict[str, Any], field_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -253,7 +206,7 @@ class RequestModel:
         return result
 
 
-    def _find_param_match(self, param_name: str, available_params: List[str], threshold: float = 0.5) -> Optional[str]:
+    def _find_param_match(self, param_name: str, available_params: Sequence[str], threshold: float = 0.5) -> Optional[str]:
         """
         Fuzzy matching ile parametre eşleştir
 
@@ -268,11 +221,13 @@ class RequestModel:
         if not param_name or not available_params:
             return None
 
+        matcher = FuzzyMatcher.for_candidates(available_params)
+
         # 1. Önce case-insensitive tam eşleşme kontrolü
         param_lower = param_name.lower()
-        for candidate in available_params:
-            if candidate.lower() == param_lower:
-                return candidate
+        exact = matcher.find_case_insensitive(param_name)
+        if exact is not None:
+            return exact
 
         # 2. Substring eşleşmesi kontrolü (daha kısa isim, daha uzun isimde geçiyor mu?)
         # Örnek: "readingorganizationid" -> "readingOrganizationId" (daha iyi)
@@ -283,7 +238,6 @@ class RequestModel:
 
         for candidate in available_params:
             candidate_lower = candidate.lower()
-            candidate_words = self._split_camel_case(candidate_lower)
 
             # Önce tam substring kontrolü (param candidate'ın başında veya sonunda mı?)
             if param_lower in candidate_lower:
@@ -309,7 +263,7 @@ class RequestModel:
             return best_substring_match
 
         # 3. Fuzzy matching (SequenceMatcher ile)
-        match = find_closest_match(param_name, available_params, threshold=threshold)
+        match = matcher.find(param_name, threshold=threshold)
         return match
 
     def _split_camel_case(self, name: str) -> List[str]:
@@ -348,197 +302,24 @@ class RequestModel:
         return result
 
     def _is_service_wrapper(self, schema: Dict[str, Any]) -> bool:
-        """
-        Service wrapper yapısını tespit et (GOP kategorisi için)
-
-        Service wrapper yapısı:
-        {
-          "properties": {
-            "header": { "type": "array", ... },
-            "body": { "$ref": "...", ... }  // veya çözülmüş properties
-          }
-        }
-        """
-        if not isinstance(schema, dict) or 'properties' not in schema:
-            return False
-
-        properties = schema['properties']
-        # Service wrapper: hem 'header' hem 'body' property'si var
-        return 'header' in properties and 'body' in properties
-
-    def _get_array_field_mapping(self, schema: Dict[str, Any]) -> Dict[str, str]:
-        """
-        Array field'ları ve hangi array'e ait olduklarını döndür
-
-        Returns:
-            Dict[str, str]: {field_name: array_name} mapping'i
-            Örnek: {'deliveryDay': 'contracts', 'regionCode': 'contracts'}
-        """
-        mapping = {}
-
-        if not isinstance(schema, dict) or 'properties' not in schema:
-            return mapping
-
-        # Service wrapper ise body'yi al
-        if self._is_service_wrapper(schema):
-            body_prop = schema['properties'].get('body', {})
-            if isinstance(body_prop, dict) and 'properties' in body_prop:
-                schema = body_prop
-
-        # Her property'yi kontrol et
-        for prop_name, prop_value in schema.get('properties', {}).items():
-            if isinstance(prop_value, dict) and prop_value.get('type') == 'array':
-                # Array property'si bulundu, items içindeki field'ları al
-                items = prop_value.get('items', {})
-                if isinstance(items, dict) and 'properties' in items:
-                    # Items içindeki field'ları array_name ile eşleştir
-                    for nested_field in items['properties'].keys():
-                        mapping[nested_field] = prop_name
-
-        return mapping
-
-    def _extract_nested_array_fields(self, prop_value: Dict[str, Any]) -> List[str]:
-        """
-        Array property'sinin items'ındaki field'ları çıkar
-
-        Örnek:
-        {
-          "contracts": {
-            "type": "array",
-            "items": {
-              "$ref": "#/definitions/QueryContractRequest"  // çözülmüş olmalı
-            }
-          }
-        }
-        """
-        fields = []
-        if isinstance(prop_value, dict):
-            # Array type'ı kontrol et
-            if prop_value.get('type') == 'array' and 'items' in prop_value:
-                items = prop_value['items']
-                if isinstance(items, dict):
-                    # Items içindeki properties'leri çıkar ($ref zaten çözülmüş olmalı)
-                    if 'properties' in items:
-                        fields.extend(items['properties'].keys())
-        return fields
-
-    def _extract_schema_fields(self, schema: Dict[str, Any]) -> List[str]:
-        """
-        Schema'dan field isimlerini çıkar (schema zaten SwaggerModel tarafından çözülmüş olmalı)
-
-        İki tip yapı desteklenir:
-        1. Normal DTO: Direkt properties içindeki field'lar
-        2. Service wrapper (GOP): body property'si içindeki field'lar
-
-        Ayrıca nested array içindeki field'lar da çıkarılır (örn: contracts[].deliveryDay)
-        """
-        fields = []
-
-        if not isinstance(schema, dict):
-            return fields
-
-        # Properties yoksa boş döndür
-        if 'properties' not in schema:
-            return fields
-
-        # Service wrapper yapısını kontrol et (GOP kategorisi için)
-        if self._is_service_wrapper(schema):
-            # Service wrapper: sadece 'body' içindeki field'ları çıkar
-            body_prop = schema['properties'].get('body', {})
-            if isinstance(body_prop, dict):
-                # Body içindeki properties'leri al ($ref zaten SwaggerModel tarafından çözülmüş olmalı)
-                if 'properties' in body_prop:
-                    # Body'nin properties'lerini ekle
-                    for prop_name, prop_value in body_prop['properties'].items():
-                        fields.append(prop_name)
-                        # Nested object varsa içindeki field'ları da prefix ile ekle
-                        if isinstance(prop_value, dict) and 'properties' in prop_value:
-                            for inner_key in prop_value['properties'].keys():
-                                fields.append(f"{prop_name}.{inner_key}")
-                        # Eğer array ise, items içindeki field'ları da ekle
-                        nested_fields = self._extract_nested_array_fields(prop_value)
-                        fields.extend(nested_fields)
-                # Eğer body direkt çözülmüş schema ise (type: object olmadan da gelebilir)
-                # body_prop'un kendisi zaten çözülmüş schema olabilir
-                elif not body_prop or (isinstance(body_prop, dict) and '$ref' not in body_prop):
-                    # Body boş dict veya $ref içermiyorsa, recursive olarak içindeki properties'leri kontrol et
-                    # Bu durumda body_prop zaten çözülmüş schema olabilir
-                    if 'properties' in body_prop:
-                        for prop_name, prop_value in body_prop['properties'].items():
-                            fields.append(prop_name)
-                            # Nested object varsa içindeki field'ları da prefix ile ekle
-                            if isinstance(prop_value, dict) and 'properties' in prop_value:
-                                for inner_key in prop_value['properties'].keys():
-                                    fields.append(f"{prop_name}.{inner_key}")
-                            nested_fields = self._extract_nested_array_fields(prop_value)
-                            fields.extend(nested_fields)
-            # 'header' property'sini ignore et (kullanıcıdan gelmez)
-            return fields
-
-        # Normal DTO yapısı: direkt properties içindeki field'ları çıkar
-        for prop_name, prop_value in schema['properties'].items():
-            # 'body' property'si özel durum: içindeki field'ları çıkar (body. prefix'i olmadan)
-            if prop_name == 'body' and isinstance(prop_value, dict):
-                # Body içindeki properties'leri al (zaten çözülmüş olmalı)
-                if 'properties' in prop_value:
-                    for nested_prop_name, nested_prop_value in prop_value['properties'].items():
-                        fields.append(nested_prop_name)
-                        # Nested object varsa içindeki field'ları da prefix ile ekle
-                        if isinstance(nested_prop_value, dict) and 'properties' in nested_prop_value:
-                            for inner_key in nested_prop_value['properties'].keys():
-                                fields.append(f"{nested_prop_name}.{inner_key}")
-                        # Array field'ları da ekle
-                        nested_fields = self._extract_nested_array_fields(nested_prop_value)
-                        fields.extend(nested_fields)
-                continue
-
-            # Diğer property'ler için normal işlem
-            if isinstance(prop_value, dict):
-                if 'properties' in prop_value:
-                    # Nested object varsa hem objeyi hem de içindeki field'ları ekle
-                    # Önce objeyi ekle (kullanıcı page={...} şeklinde gönderebilir)
-                    fields.append(prop_name)
-                    # Sonra içindeki field'ları da ekle (kullanıcı page.number şeklinde de gönderebilir)
-                    for nested_key in prop_value['properties'].keys():
-                        fields.append(f"{prop_name}.{nested_key}")
-                else:
-                    # Normal property
-                    fields.append(prop_name)
-                    # Array ise nested field'ları da ekle
-                    nested_fields = self._extract_nested_array_fields(prop_value)
-                    fields.extend(nested_fields)
-            else:
-                # Normal property
-                fields.append(prop_name)
-
-        return fields
-
-    def _categorize_parameters(self, parameters: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
-        """Parametreleri tipine göre kategorize et"""
-        categorized = {
-            'body': [],
-            'query': [],
-            'header': [],
-            'path': []
-        }
-
-        for param in parameters:
-            param_in = param.get('in', '')
-            if param_in in categorized:
-                categorized[param_in].append(param)
-
-        return categorized
+        """Service wrapper yapısını tespit et (GOP kategorisi için, bkz. request_plan.is_service_wrapper)"""
+        return is_service_wrapper(schema)
 
     def _match_and_extract_params(
         self,
-        param_names: List[str],
+        location: str,
+        param_names: Sequence[str],
         target_dict: Dict[str, Any],
         remove_from_kwargs: bool = True
     ) -> Dict[str, Any]:
         """
         Parametreleri fuzzy matching ile eşleştir ve çıkar
 
+        Eşleştirme sonuçları planın binding tablosunda cache'lenir; aynı
+        kwarg yazımı için fuzzy matching tekrar yapılmaz.
+
         Args:
+            location: Parametre konumu ('query', 'header', 'path', 'body')
             param_names: Eşleştirilecek parametre isimleri listesi
             target_dict: Eşleşen parametrelerin ekleneceği dict
             remove_from_kwargs: Eşleşen parametreleri kwargs'tan çıkar mı
@@ -553,8 +334,11 @@ class RequestModel:
         if not param_names:
             return matched
 
+        bindings = self._plan.bindings
+        resolver = lambda kwarg_name: self._find_param_match(kwarg_name, param_names)
+
         for kwarg_name, kwarg_value in list(self._kwargs.items()):
-            matched_name = self._find_param_match(kwarg_name, param_names)
+            matched_name = bindings.resolve(location, kwarg_name, resolver)
             if matched_name:
                 matched[matched_name] = kwarg_value
                 target_dict[matched_name] = kwarg_value
@@ -566,7 +350,7 @@ class RequestModel:
 
         return matched
 
-    def _apply_default_params(self, target_dict: Dict[str, Any], param_names: List[str]):
+    def _apply_default_params(self, target_dict: Dict[str, Any], param_names: Sequence[str]):
         """
         Eksik zorunlu parametrelere default değerleri uygula
 
@@ -595,64 +379,95 @@ class RequestModel:
                         if default_key not in target_dict[param_name]:
                             target_dict[param_name][default_key] = default_val
 
-    def _process_query_params(self, query_params: List[Dict[str, Any]]):
+    def _process_query_params(self, plan: RequestPlan):
         """Query parametrelerini işle"""
-        query_param_names = [p.get('name', '') for p in query_params]
-        self._match_and_extract_params(query_param_names, self._params)
+        if self._template is not None:
+            self._merge_template_params('query', plan.query_names, self._params,
+                                        self._template.params, plan.query_converters)
+            return
+        self._match_and_extract_params('query', plan.query_names, self._params)
         # Default parametreleri uygula
-        self._apply_default_params(self._params, query_param_names)
+        self._apply_default_params(self._params, plan.query_names)
         # Format dönüşümlerini uygula
-        for param_name, param_value in list(self._params.items()):
-            param_schema = self._get_param_schema(param_name, query_params)
-            if param_schema:
-                self._params[param_name] = self._convert_value_by_format(param_value, param_schema)
+        self._apply_converters(self._params, plan.query_converters)
 
-    def _process_header_params(self, header_params: List[Dict[str, Any]]):
+    def _process_header_params(self, plan: RequestPlan):
         """Header parametrelerini işle"""
-        header_param_names = [p.get('name', '') for p in header_params]
-        self._match_and_extract_params(header_param_names, self._headers)
+        if self._template is not None:
+            self._merge_template_params('header', plan.header_names, self._headers,
+                                        self._template.headers, plan.header_converters)
+            return
+        self._match_and_extract_params('header', plan.header_names, self._headers)
         # Default parametreleri uygula
-        self._apply_default_params(self._headers, header_param_names)
+        self._apply_default_params(self._headers, plan.header_names)
         # Format dönüşümlerini uygula
-        for param_name, param_value in list(self._headers.items()):
-            param_schema = self._get_param_schema(param_name, header_params)
-            if param_schema:
-                self._headers[param_name] = self._convert_value_by_format(param_value, param_schema)
+        self._apply_converters(self._headers, plan.header_converters)
 
-    def _process_path_params(self, path_params: List[Dict[str, Any]]):
-        """Path parametrelerini işle (şimdilik sadece kwargs'tan çıkar)"""
-        path_param_names = [p.get('name', '') for p in path_params]
-        self._match_and_extract_params(path_param_names, {}, remove_from_kwargs=True)
+    def _merge_template_params(
+        self,
+        location: str,
+        param_names: Sequence[str],
+        target_dict: Dict[str, Any],
+        template_values: Mapping[str, Any],
+        converters: Mapping[str, Callable[[Any], Any]]
+    ):
+        """
+        Template'in hazır değerlerini kopyala, sadece yeni kwargs'ları eşleştirip dönüştür
 
-    def _process_body_params(self, body_params: List[Dict[str, Any]]):
+        Template değerleri zaten default'ları ve format dönüşümleri uygulanmış
+        olduğu için tekrar işlenmez; default'lar yalnızca kwargs'tan gelen
+        (ör. kısmi page dict'i) değerlerin eksik alanlarını doldurur.
+        """
+        matched = self._match_and_extract_params(location, param_names, {})
+        self._apply_converters(matched, converters)
+        target_dict.update(template_values)
+        target_dict.update(matched)
+        self._apply_default_params(target_dict, list(matched))
+
+    def _apply_converters(self, target_dict: Dict[str, Any], converters: Mapping[str, Callable[[Any], Any]]):
+        """Planın field bazlı dönüştürücülerini uygula"""
+        for param_name, param_value in target_dict.items():
+            converter = converters.get(param_name)
+            if converter is not None:
+                target_dict[param_name] = converter(param_value)
+
+    def _process_path_params(self, plan: RequestPlan):
+        """Path parametrelerini işle (şimdilik sadece kwargs'tan çıkar, doğrulama için saklanır)"""
+        if self._template is not None:
+            self._path_params.update(self._template._path_params)
+        self._match_and_extract_params('path', plan.path_names, self._path_params, remove_from_kwargs=True)
+
+    def _process_body_params(self, plan: RequestPlan):
         """Body parametrelerini işle"""
-        if not body_params:
+        template = self._template
+        if not plan.has_body:
             # Body parametresi yoksa ama kwargs varsa, json olarak ekle
-            if self._kwargs:
-                self._json = self._kwargs.copy()
+            self._extra_kwargs = self._kwargs.copy()
+            if template is not None and template._extra_kwargs:
+                self._extra_kwargs = {**template._extra_kwargs, **self._extra_kwargs}
+            if self._extra_kwargs:
+                self._json = self._extra_kwargs.copy()
             return
 
-
-
-        body_param = body_params[0]  # Genelde tek body parametresi var
-        schema = body_param.get('schema', {})
-
-        # Schema'dan field'ları çıkar (schema zaten SwaggerModel tarafından çözülmüş)
-        body_field_names = self._extract_schema_fields(schema)
-
-        # Array field mapping'i al (hangi field hangi array'e ait)
-        array_field_mapping = self._get_array_field_mapping(schema)
+        schema = plan.body_schema
+        body_field_names = plan.body_field_names
+        array_field_mapping = plan.array_field_mapping
 
         # Body field'ları için fuzzy matching yap
         matched_body = {}
         if body_field_names:
             # Schema field'ları varsa fuzzy matching yap
-            matched_body = self._match_and_extract_params(body_field_names, matched_body, remove_from_kwargs=True)
+            matched_body = self._match_and_extract_params('body', body_field_names, matched_body, remove_from_kwargs=True)
         else:
             # Schema field'ları yoksa kalan kwargs'ları direkt kullan
             matched_body = self._kwargs.copy()
             self._kwargs.clear()
 
+        # Template'in eşleşmiş body alanları; kwargs bunların üzerine yazılır
+        if template is not None and template._bound_body:
+            matched_body = {**template._bound_body, **matched_body}
+        self._bound_body = dict(matched_body)
+
         # Default parametreleri body'ye uygula
         if body_field_names:
             self._apply_default_params(matched_body, body_field_names)
@@ -670,25 +485,27 @@ class RequestModel:
                     array_data[array_name][field_name] = matched_body.pop(field_name)
 
             # Array'leri matched_body'ye ekle
+            # (kullanıcının/template'in listesi yerinde değiştirilmez)
             for array_name, array_fields in array_data.items():
-                if array_name not in matched_body:
-                    matched_body[array_name] = []
                 # Array içine object olarak ekle
-                matched_body[array_name].append(array_fields)
-
-        # GOP kategorisi için service wrapper yapısı kontrolü
-        is_service_wrapper = self._category == 'gop' and self._is_service_wrapper(schema)
-
-        if is_service_wrapper:
+                existing = matched_body.get(array_name)
+                if existing is None:
+                    existing = []
+                elif not isinstance(existing, (list, tuple)):
+                    # String gibi değerler karakterlerine bölünmemeli
+                    raise TypeError(
+                        f"'{array_name}' bir liste olmalı, {type(existing).__name__} verildi"
+                    )
+                matched_body[array_name] = list(existing) + [array_fields]
+
+        # GOP kategorisi için service wrapper yapısı
+        if plan.service_wrapper:
             # Service wrapper yapısı: header ve body ayrı
-            wrapper_body = {}
-
             # Header'ı ayır (varsa)
-            header_array = matched_body.pop('header', [])
-            if not header_array:
-                header_array = []
+            header_array = list(matched_body.pop('header', None) or [])
 
             # Header default değerlerini ekle
+            from ..modules.authentication.auth_manager import Authentication
             header_array.append({'key': 'transactionId', 'value': Authentication.create_transaction_id()})
             header_array.append({'key': 'application', 'value': epint.__fullname__})
 
@@ -702,53 +519,33 @@ class RequestModel:
             }
 
         # Format dönüşümlerini uygula
-        if matched_body and body_params:
-            body_param = body_params[0]
-            schema = body_param.get('schema', {})
+        if matched_body:
             matched_body = self._convert_dict_by_schema(matched_body, schema)
 
         # Body'yi ayarla
         if matched_body:
-            consumes = self._endpoint_data.get('consumes', [])
-            produces = self._endpoint_data.get('produces', [])
-            # Hem consumes hem de produces kontrol et
-            if 'application/json' in consumes or ('application/json' in produces and not consumes):
+            if plan.body_as_json:
                 self._json = matched_body
             else:
                 self._data = matched_body
 
     def _parse_parameters(self):
         """Endpoint parametrelerine göre kwargs'ları parse et"""
-        parameters = self._endpoint_data.get('parameters', [])
-
-        # Parametreleri kategorize et
-        categorized = self._categorize_parameters(parameters)
+        plan = self._plan
 
         # Her parametre tipini sırayla işle
-        self._process_query_params(categorized['query'])
-        self._process_header_params(categorized['header'])
-        self._process_path_params(categorized['path'])
-        self._process_body_params(categorized['body'])
-
-        # Content-Type header'ı ekle
-        consumes = self._endpoint_data.get('consumes', [])
-        produces = self._endpoint_data.get('produces', [])
-        if consumes:
-            if 'application/json' in consumes:
-                self._headers['Content-Type'] = 'application/json'
-            else:
-                self._headers['Content-Type'] = consumes[0]
-        elif produces and 'application/json' in produces:
-            # consumes boşsa produces'a bak
-            self._headers['Content-Type'] = 'application/json'
-
-        # Accept header'ı ekle
-        produces = self._endpoint_data.get('produces', [])
-        if produces:
-            if 'application/json' in produces:
-                self._headers['Accept'] = 'application/json'
-            else:
-                self._headers['Accept'] = produces[0]
+        self._process_query_params(plan)
+        self._process_header_params(plan)
+        self._process_path_params(plan)
+        self._process_body_params(plan)
+
+        # Ticket alınmadan önce required/enum/format kontrolü
+        if self._validate and plan.validator is not None and RequestValidator.enabled:
+            body = self._json if self._json is not None else self._data
+            plan.validator.validate(self._params, self._headers, self._path_params, body)
+
+        # Content-Type ve Accept header'larını ekle
+        self._headers.update(plan.content_headers)
 
     @property
     def params(self) -> Dict[str, Any]:
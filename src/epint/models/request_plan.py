@@ -0,0 +1,476 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from dataclasses import dataclass, field
+from functools import partial
+from types import MappingProxyType
+from typing import Dict, Any, Callable, List, Mapping, Optional, Tuple
+
+from ..modules.datetime import DateTimeUtils
+from .request_validator import RequestValidator, compile_validator
+
+
+class ParamBindingTable:
+    """
+    Endpoint başına (konum, kwarg ismi) -> parametre ismi çözümleme cache'i
+
+    Aynı kwarg yazımları tekrar tekrar kullanıldığından fuzzy matching her
+    yazım için bir kez yapılır. Tablo sınırlıdır; dolduğunda en eski kayıt
+    atılır. Sayaçlar istatistik amaçlıdır ve thread'ler arasında yaklaşık
+    olabilir.
+    """
+
+    def __init__(self, maxsize: int = 256):
+        self.maxsize = maxsize
+        self._table: Dict[Tuple[str, str], Optional[str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, location: str, kwarg_name: str, resolver: Callable[[str], Optional[str]]) -> Optional[str]:
+        """
+        Kwarg'ın bağlandığı parametre ismini döndür (bulunamazsa None)
+
+        Args:
+            location: Parametre konumu ('query', 'header', 'path', 'body')
+            kwarg_name: Kullanıcının verdiği isim
+            resolver: Cache'te yoksa çağrılacak eşleştirme fonksiyonu
+        """
+        key = (location, kwarg_name)
+        try:
+            matched = self._table[key]
+        except KeyError:
+            pass
+        else:
+            self.hits += 1
+            return matched
+
+        self.misses += 1
+        matched = resolver(kwarg_name)
+        if len(self._table) >= self.maxsize:
+            # En eski kaydı at
+            self._table.pop(next(iter(self._table)), None)
+        self._table[key] = matched
+        return matched
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Cache istatistikleri
+
+        Returns:
+            hits/misses/hit_rate, tablo boyutu, fuzzy çözülen yazımlar
+            ({konum: {kwarg: parametre}}) ve eşleşmeyen yazımlar ({konum: [kwarg]})
+        """
+        fuzzy: Dict[str, Dict[str, str]] = {}
+        unmatched: Dict[str, List[str]] = {}
+        for (location, kwarg_name), matched in list(self._table.items()):
+            if matched is None:
+                unmatched.setdefault(location, []).append(kwarg_name)
+            elif matched != kwarg_name:
+                fuzzy.setdefault(location, {})[kwarg_name] = matched
+
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / total if total else 0.0,
+            'size': len(self._table),
+            'maxsize': self.maxsize,
+            'fuzzy': fuzzy,
+            'unmatched': unmatched,
+        }
+
+    def clear(self):
+        self._table.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self) -> str:
+        return f"<ParamBindingTable: size={len(self._table)}, hits={self.hits}, misses={self.misses}>"
+
+
+# epint.set_mode ile seçilebilen runtime modları
+RUNTIME_MODES = ('prod', 'test')
+
+
+@dataclass(frozen=True)
+class RequestPlan:
+    """
+    Bir endpoint için kullanıcı girdisinden bağımsız, önceden derlenmiş request yapısı
+
+    Parametre kategorileri, body field listesi, array field eşlemesi, service
+    wrapper düzeni, field bazlı format dönüştürücüleri ve content-type
+    header'ları, her runtime modu için host/URL/CAS service URL'leri ve
+    required/enum/format doğrulayıcısı endpoint başına bir kez hesaplanır. RequestModel her çağrıda
+    sadece kwargs'ı bu plana bağlar ve dönüştürücüleri çalıştırır.
+    """
+
+    category: str
+    query_names: Tuple[str, ...]
+    header_names: Tuple[str, ...]
+    path_names: Tuple[str, ...]
+    query_converters: Mapping[str, Callable[[Any], Any]]
+    header_converters: Mapping[str, Callable[[Any], Any]]
+    has_body: bool
+    body_schema: Mapping[str, Any]
+    body_field_names: Tuple[str, ...]
+    array_field_mapping: Mapping[str, str]
+    service_wrapper: bool
+    body_as_json: bool
+    content_headers: Tuple[Tuple[str, str], ...]
+    # Runtime moduna ('prod'/'test') göre host, tam URL ve CAS service URL'leri
+    hosts: Mapping[str, str] = field(default_factory=dict)
+    urls: Mapping[str, str] = field(default_factory=dict)
+    st_service_urls: Mapping[str, str] = field(default_factory=dict)
+    # required/enum/format kontrolleri (kontrol edilecek alan yoksa None)
+    validator: Optional[RequestValidator] = None
+    # Kwarg -> parametre çözümlemeleri (planın tek değişebilir parçası)
+    bindings: ParamBindingTable = field(default_factory=ParamBindingTable, compare=False, repr=False)
+
+
+def compile_request_plan(endpoint_data: Dict[str, Any]) -> RequestPlan:
+    """Endpoint verisinden RequestPlan oluştur"""
+    category = endpoint_data.get('category', '')
+    categorized: Dict[str, List[Dict[str, Any]]] = {'body': [], 'query': [], 'header': [], 'path': []}
+    for param in endpoint_data.get('parameters', []):
+        param_in = param.get('in', '')
+        if param_in in categorized:
+            categorized[param_in].append(param)
+
+    query_names = tuple(p.get('name', '') for p in categorized['query'])
+    header_names = tuple(p.get('name', '') for p in categorized['header'])
+    path_names = tuple(p.get('name', '') for p in categorized['path'])
+
+    consumes = endpoint_data.get('consumes', [])
+    produces = endpoint_data.get('produces', [])
+
+    body_schema: Dict[str, Any] = {}
+    body_field_names: Tuple[str, ...] = ()
+    array_field_mapping: Dict[str, str] = {}
+    if categorized['body']:
+        # Genelde tek body parametresi var
+        body_schema = categorized['body'][0].get('schema', {})
+        # Schema zaten SwaggerModel tarafından çözülmüş
+        body_field_names = tuple(extract_schema_fields(body_schema))
+        array_field_mapping = get_array_field_mapping(body_schema)
+
+    hosts = {
+        mode: f"https://{get_host_name(category, mode == 'test')}.epias.com.tr"
+        for mode in RUNTIME_MODES
+    }
+
+    return RequestPlan(
+        category=category,
+        query_names=query_names,
+        header_names=header_names,
+        path_names=path_names,
+        query_converters=_converters_for(categorized['query'], category),
+        header_converters=_converters_for(categorized['header'], category),
+        has_body=bool(categorized['body']),
+        body_schema=body_schema,
+        body_field_names=body_field_names,
+        array_field_mapping=MappingProxyType(array_field_mapping),
+        service_wrapper=category == 'gop' and is_service_wrapper(body_schema),
+        # Hem consumes hem de produces kontrol et
+        body_as_json='application/json' in consumes or ('application/json' in produces and not consumes),
+        content_headers=_content_headers(consumes, produces),
+        hosts=MappingProxyType(hosts),
+        urls=MappingProxyType({
+            mode: build_url(host, endpoint_data.get('basePath'), endpoint_data.get('path'))
+            for mode, host in hosts.items()
+        }),
+        st_service_urls=MappingProxyType({
+            mode: f"https://{get_st_service_name(category, mode == 'test')}.epias.com.tr"
+            for mode in RUNTIME_MODES
+        }),
+        validator=compile_validator(endpoint_data, categorized),
+    )
+
+
+def get_host_name(category: str, test_mode: bool) -> str:
+    """Kategori ve runtime moduna göre API host'unun alt alan adı"""
+    if "seffaflik" in category:
+        return "seffaflik"
+    if "gop" == category:
+        return "testgop" if test_mode else "gop"
+    if "gunici" == category:
+        return "gunici"
+
+    return "epys-prp" if test_mode else "epys"
+
+
+def get_st_service_name(category: str, test_mode: bool) -> str:
+    """Kategori ve runtime moduna göre ST alınacak CAS service'inin alt alan adı"""
+    if "gop" == category:
+        return "testgop" if test_mode else "gop"
+
+    return "epys"
+
+
+def build_url(*parts: Optional[str]) -> str:
+    """
+    URL parçalarını birleştir; ilk parçadaki protokol korunur
+
+    HTTPClient.buildurl ile aynı kuralları uygular, fakat network katmanını
+    import etmeden plan derlenirken kullanılabilir.
+    """
+    cleaned = [str(part).strip("/") for part in parts if part]
+    if not cleaned:
+        return ""
+    if "://" in cleaned[0]:
+        protocol, rest = cleaned[0].split("://", 1)
+        return protocol + "://" + "/".join([rest] + cleaned[1:])
+    return "/".join(cleaned)
+
+
+def _converters_for(params: List[Dict[str, Any]], category: str) -> Mapping[str, Callable[[Any], Any]]:
+    """Dönüşüm gerektiren parametreler için {isim: dönüştürücü}; aynı isimde ilk tanım geçerli"""
+    converters = {}
+    for param in params:
+        name = param.get('name', '')
+        if name in converters:
+            continue
+        converters[name] = build_converter(param, category)
+    return MappingProxyType({name: converter for name, converter in converters.items() if converter is not None})
+
+
+def _content_headers(consumes: List[str], produces: List[str]) -> Tuple[Tuple[str, str], ...]:
+    headers = []
+    if consumes:
+        headers.append(('Content-Type', 'application/json' if 'application/json' in consumes else consumes[0]))
+    elif produces and 'application/json' in produces:
+        # consumes boşsa produces'a bak
+        headers.append(('Content-Type', 'application/json'))
+
+    if produces:
+        headers.append(('Accept', 'application/json' if 'application/json' in produces else produces[0]))
+    return tuple(headers)
+
+
+def build_converter(param_schema: Dict[str, Any], category: str) -> Optional[Callable[[Any], Any]]:
+    """Schema'nın format/type bilgisine göre dönüştürücü oluştur (dönüşüm yoksa None)"""
+    format_type = param_schema.get('format', '')
+    param_type = param_schema.get('type', '')
+
+    date_time = format_type == 'date-time'
+    integer = format_type in ('int64', 'int32') or param_type == 'integer'
+    number = format_type in ('float', 'double') or param_type == 'number'
+    if not (date_time or integer or number):
+        return None
+    return partial(convert_value, date_time=date_time, integer=integer, number=number, category=category)
+
+
+def convert_value(value: Any, date_time: bool, integer: bool, number: bool, category: str) -> Any:
+    """
+    Format tipine göre değeri dönüştür
+
+    Args:
+        value: Dönüştürülecek değer
+        date_time: date-time formatı mı
+        integer: int32/int64 formatı veya integer tipi mi
+        number: float/double formatı veya number tipi mi
+        category: Endpoint kategorisi (tarih formatını belirler)
+
+    Returns:
+        Dönüştürülmüş değer
+    """
+    if value is None:
+        return value
+
+    # date-time formatı
+    if date_time:
+        if isinstance(value, str):
+            try:
+                dt = DateTimeUtils.from_string(value)
+                # GOP servisi için özel format
+                if category == 'gop':
+                    return DateTimeUtils.to_gop_iso_string(dt)
+                if category == "gunici":
+                    return DateTimeUtils.to_gunici_iso_string(dt)
+                return DateTimeUtils.to_iso_string(dt)
+            except (ValueError, TypeError):
+                return value
+        elif hasattr(value, 'strftime'):
+            # GOP servisi için özel format
+            if category == 'gop':
+                return DateTimeUtils.to_gop_iso_string(value)
+            return DateTimeUtils.to_iso_string(value)
+
+    # integer formatları
+    if integer:
+        try:
+            return int(value)
+        except (ValueError, TypeError):
+            return value
+
+    # float formatları
+    if number:
+        try:
+            return float(value)
+        except (ValueError, TypeError):
+            return value
+
+    return value
+
+
+def is_service_wrapper(schema: Dict[str, Any]) -> bool:
+    """
+    Service wrapper yapısını tespit et (GOP kategorisi için)
+
+    Service wrapper yapısı:
+    {
+      "properties": {
+        "header": { "type": "array", ... },
+        "body": { "$ref": "...", ... }  // veya çözülmüş properties
+      }
+    }
+    """
+    if not isinstance(schema, dict) or 'properties' not in schema:
+        return False
+
+    properties = schema['properties']
+    # Service wrapper: hem 'header' hem 'body' property'si var
+    return 'header' in properties and 'body' in properties
+
+
+def get_array_field_mapping(schema: Dict[str, Any]) -> Dict[str, str]:
+    """
+    Array field'ları ve hangi array'e ait olduklarını döndür
+
+    Returns:
+        Dict[str, str]: {field_name: array_name} mapping'i
+        Örnek: {'deliveryDay': 'contracts', 'regionCode': 'contracts'}
+    """
+    mapping = {}
+
+    if not isinstance(schema, dict) or 'properties' not in schema:
+        return mapping
+
+    # Service wrapper ise body'yi al
+    if is_service_wrapper(schema):
+        body_prop = schema['properties'].get('body', {})
+        if isinstance(body_prop, dict) and 'properties' in body_prop:
+            schema = body_prop
+
+    # Her property'yi kontrol et
+    for prop_name, prop_value in schema.get('properties', {}).items():
+        if isinstance(prop_value, dict) and prop_value.get('type') == 'array':
+            # Array property'si bulundu, items içindeki field'ları al
+            items = prop_value.get('items', {})
+            if isinstance(items, dict) and 'properties' in items:
+                # Items içindeki field'ları array_name ile eşleştir
+                for nested_field in items['properties'].keys():
+                    mapping[nested_field] = prop_name
+
+    return mapping
+
+
+def _extract_nested_array_fields(prop_value: Dict[str, Any]) -> List[str]:
+    """
+    Array property'sinin items'ındaki field'ları çıkar
+
+    Örnek:
+    {
+      "contracts": {
+        "type": "array",
+        "items": {
+          "$ref": "#/definitions/QueryContractRequest"  // çözülmüş olmalı
+        }
+      }
+    }
+    """
+    fields = []
+    if isinstance(prop_value, dict):
+        # Array type'ı kontrol et
+        if prop_value.get('type') == 'array' and 'items' in prop_value:
+            items = prop_value['items']
+            if isinstance(items, dict):
+                # Items içindeki properties'leri çıkar ($ref zaten çözülmüş olmalı)
+                if 'properties' in items:
+                    fields.extend(items['properties'].keys())
+    return fields
+
+
+def _extract_body_fields(body_prop: Dict[str, Any]) -> List[str]:
+    """Body property'sinin field'larını, nested object ve array field'larıyla birlikte çıkar"""
+    fields = []
+    for prop_name, prop_value in body_prop['properties'].items():
+        fields.append(prop_name)
+        # Nested object varsa içindeki field'ları da prefix ile ekle
+        if isinstance(prop_value, dict) and 'properties' in prop_value:
+            for inner_key in prop_value['properties'].keys():
+                fields.append(f"{prop_name}.{inner_key}")
+        # Eğer array ise, items içindeki field'ları da ekle
+        fields.extend(_extract_nested_array_fields(prop_value))
+    return fields
+
+
+def extract_schema_fields(schema: Dict[str, Any]) -> List[str]:
+    """
+    Schema'dan field isimlerini çıkar (schema zaten SwaggerModel tarafından çözülmüş olmalı)
+
+    İki tip yapı desteklenir:
+    1. Normal DTO: Direkt properties içindeki field'lar
+    2. Service wrapper (GOP): body property'si içindeki field'lar
+
+    Ayrıca nested array içindeki field'lar da çıkarılır (örn: contracts[].deliveryDay)
+    """
+    fields = []
+
+    if not isinstance(schema, dict):
+        return fields
+
+    # Properties yoksa boş döndür
+    if 'properties' not in schema:
+        return fields
+
+    # Service wrapper yapısını kontrol et (GOP kategorisi için)
+    if is_service_wrapper(schema):
+        # Service wrapper: sadece 'body' içindeki field'ları çıkar,
+        # 'header' property'sini ignore et (kullanıcıdan gelmez)
+        body_prop = schema['properties'].get('body', {})
+        if isinstance(body_prop, dict) and 'properties' in body_prop:
+            fields.extend(_extract_body_fields(body_prop))
+        return fields
+
+    # Normal DTO yapısı: direkt properties içindeki field'ları çıkar
+    for prop_name, prop_value in schema['properties'].items():
+        # 'body' property'si özel durum: içindeki field'ları çıkar (body. prefix'i olmadan)
+        if prop_name == 'body' and isinstance(prop_value, dict):
+            # Body içindeki properties'leri al (zaten çözülmüş olmalı)
+            if 'properties' in prop_value:
+                fields.extend(_extract_body_fields(prop_value))
+            continue
+
+        # Diğer property'ler için normal işlem
+        if isinstance(prop_value, dict):
+            if 'properties' in prop_value:
+                # Nested object varsa hem objeyi hem de içindeki field'ları ekle
+                # Önce objeyi ekle (kullanıcı page={...} şeklinde gönderebilir)
+                fields.append(prop_name)
+                # Sonra içindeki field'ları da ekle (kullanıcı page.number şeklinde de gönderebilir)
+                for nested_key in prop_value['properties'].keys():
+                    fields.append(f"{prop_name}.{nested_key}")
+            else:
+                # Normal property
+                fields.append(prop_name)
+                # Array ise nested field'ları da ekle
+                fields.extend(_extract_nested_array_fields(prop_value))
+        else:
+            # Normal property
+            fields.append(prop_name)
+
+    return fields
+
+
+__all__ = ['ParamBindingTable', 'RequestPlan', 'compile_request_plan']
@@ -0,0 +1,272 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Swagger tanımlarındaki required, enum ve format bilgilerinden derlenen
+yerel request doğrulaması.
+
+Doğrulama, default'lar ve format dönüşümleri uygulandıktan sonra oluşan
+son request üzerinde ve ticket alınmadan önce çalışır; eksik veya hatalı
+bir alan CAS/EPİAŞ'a gidilmeden RequestValidationError olarak bildirilir.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import Dict, Any, Callable, List, Mapping, Optional, Tuple
+
+
+# Ticket header'ları request oluşturulduktan sonra eklenir, doğrulanmaz
+TICKET_HEADERS = frozenset({'TGT', 'ST', 'gop-service-ticket'})
+
+_DATE_TIME_PATTERN = re.compile(
+    r"\d{4}-\d{2}-\d{2}(?:[T ]\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:?\d{2})?)?"
+)
+_DATE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _is_date_time(value: Any) -> bool:
+    if isinstance(value, str):
+        return _DATE_TIME_PATTERN.fullmatch(value) is not None
+    return hasattr(value, 'strftime')
+
+
+def _is_date(value: Any) -> bool:
+    if isinstance(value, str):
+        return _DATE_PATTERN.fullmatch(value) is not None
+    return hasattr(value, 'strftime')
+
+
+def _is_integer(value: Any) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _is_number(value: Any) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+# format ismi -> (kontrol fonksiyonu, hata mesajındaki beklenen tip)
+_FORMAT_CHECKS: Dict[str, Tuple[Callable[[Any], bool], str]] = {
+    'date-time': (_is_date_time, "date-time (ör. '2024-01-01' veya '2024-01-01T00:00:00+03:00')"),
+    'date': (_is_date, "date (ör. '2024-01-01')"),
+    'integer': (_is_integer, 'integer'),
+    'number': (_is_number, 'number'),
+}
+
+
+class RequestValidationError(ValueError):
+    """Request, endpoint'in swagger tanımına uymuyor (istek gönderilmeden tespit edildi)"""
+
+    def __init__(self, endpoint: str, errors: List[Tuple[str, str]]):
+        """
+        Args:
+            endpoint: Endpoint'in tanımı (kategori ve path)
+            errors: [(alan yolu, hata mesajı)] listesi
+        """
+        self.endpoint = endpoint
+        self.errors = errors
+        lines = "\n".join(f"  - {path}: {message}" for path, message in errors)
+        super().__init__(f"{endpoint} için geçersiz request ({len(errors)} hata):\n{lines}")
+
+
+@dataclass(frozen=True)
+class FieldRule:
+    """Tek bir parametre/field için derlenmiş kontroller"""
+
+    name: str
+    required: bool = False
+    enum: Optional[Tuple[Any, ...]] = None
+    format: Optional[str] = None
+    properties: Tuple['FieldRule', ...] = ()
+    items: Optional['FieldRule'] = None
+
+    def check(self, value: Any, path: str, errors: List[Tuple[str, str]]) -> None:
+        """Mevcut (None olmayan) değeri doğrula, hataları errors'a ekle"""
+        if self.enum is not None and not isinstance(value, (dict, list)) and value not in self.enum:
+            allowed = ", ".join(repr(option) for option in self.enum)
+            message = f"geçersiz değer {value!r}; izin verilen değerler: {allowed}"
+            suggestion = _case_insensitive_option(value, self.enum)
+            if suggestion is not None:
+                message += f" ({suggestion!r} mi demek istediniz?)"
+            errors.append((path, message))
+            return
+
+        if self.format is not None:
+            is_valid, expected = _FORMAT_CHECKS[self.format]
+            if not is_valid(value):
+                errors.append((path, f"{expected} bekleniyordu, {value!r} verildi"))
+                return
+
+        if self.properties and isinstance(value, Mapping):
+            check_fields(self.properties, value, path, errors)
+        elif self.items is not None and isinstance(value, list):
+            for index, item in enumerate(value):
+                if item is not None:
+                    self.items.check(item, f"{path}[{index}]", errors)
+
+
+def check_fields(rules: Tuple[FieldRule, ...], values: Mapping[str, Any], prefix: str,
+                 errors: List[Tuple[str, str]]) -> None:
+    """Kurallardaki alanları values içinde kontrol et (eksik zorunlu alanlar dahil)"""
+    for rule in rules:
+        path = f"{prefix}.{rule.name}" if prefix else rule.name
+        value = values.get(rule.name)
+        if value is None:
+            if rule.required:
+                errors.append((path, "zorunlu alan eksik"))
+            continue
+        rule.check(value, path, errors)
+
+
+def _case_insensitive_option(value: Any, options: Tuple[Any, ...]) -> Optional[Any]:
+    if not isinstance(value, str):
+        return None
+    lowered = value.lower()
+    for option in options:
+        if isinstance(option, str) and option.lower() == lowered:
+            return option
+    return None
+
+
+def _format_of(schema: Mapping[str, Any]) -> Optional[str]:
+    format_type = schema.get('format', '')
+    schema_type = schema.get('type', '')
+    if format_type in ('date-time', 'date'):
+        return format_type
+    if format_type in ('int64', 'int32') or schema_type == 'integer':
+        return 'integer'
+    if format_type in ('float', 'double') or schema_type == 'number':
+        return 'number'
+    return None
+
+
+def compile_rule(name: str, schema: Mapping[str, Any], required: bool = False) -> Optional[FieldRule]:
+    """
+    Schema'dan FieldRule derle
+
+    Kontrol edilecek bir şey yoksa (zorunlu değil, enum/format yok, alt
+    alanlarda da kural yok) None döner.
+    """
+    if not isinstance(schema, Mapping):
+        return FieldRule(name, required=True) if required else None
+
+    enum = schema.get('enum')
+    properties = compile_properties(schema)
+    items = None
+    items_schema = schema.get('items')
+    if schema.get('type') == 'array' and isinstance(items_schema, Mapping):
+        items = compile_rule('[]', items_schema)
+
+    rule = FieldRule(
+        name=name,
+        required=required,
+        enum=tuple(enum) if enum else None,
+        format=_format_of(schema),
+        properties=properties,
+        items=items,
+    )
+    if not (rule.required or rule.enum or rule.format or rule.properties or rule.items):
+        return None
+    return rule
+
+
+def compile_properties(schema: Mapping[str, Any]) -> Tuple[FieldRule, ...]:
+    """Object schema'sının property'leri için kurallar"""
+    properties = schema.get('properties')
+    if not isinstance(properties, Mapping):
+        return ()
+    required = set(schema.get('required') or ())
+    rules = []
+    for name, prop_schema in properties.items():
+        rule = compile_rule(name, prop_schema, name in required)
+        if rule is not None:
+            rules.append(rule)
+    return tuple(rules)
+
+
+class RequestValidator:
+    """Bir endpoint için derlenmiş request doğrulayıcı (bkz. compile_validator)"""
+
+    # epint.set_request_validation ile kapatılabilir
+    enabled: bool = True
+
+    def __init__(self, endpoint: str, query: Tuple[FieldRule, ...], header: Tuple[FieldRule, ...],
+                 path: Tuple[FieldRule, ...], body: Tuple[FieldRule, ...]):
+        self.endpoint = endpoint
+        self.query = query
+        self.header = header
+        self.path = path
+        self.body = body
+
+    @classmethod
+    def set_enabled(cls, enabled: bool = True):
+        """Yerel request doğrulamasını aç/kapat"""
+        cls.enabled = bool(enabled)
+
+    def validate(self, params: Mapping[str, Any], headers: Mapping[str, Any], path_params: Mapping[str, Any],
+                 body: Optional[Mapping[str, Any]]) -> None:
+        """
+        Oluşturulmuş request'i doğrula
+
+        Raises:
+            RequestValidationError: En az bir alan tanıma uymuyorsa (tüm hatalar birlikte)
+        """
+        errors: List[Tuple[str, str]] = []
+        check_fields(self.query, params, 'query', errors)
+        check_fields(self.header, headers, 'header', errors)
+        check_fields(self.path, path_params, 'path', errors)
+        if self.body:
+            check_fields(self.body, body if isinstance(body, Mapping) else {}, 'body', errors)
+        if errors:
+            raise RequestValidationError(self.endpoint, errors)
+
+    def __repr__(self) -> str:
+        counts = ", ".join(f"{name}={len(getattr(self, name))}" for name in ('query', 'header', 'path', 'body'))
+        return f"<RequestValidator: {self.endpoint}, {counts}>"
+
+
+def compile_validator(endpoint_data: Mapping[str, Any],
+                      categorized: Mapping[str, List[Mapping[str, Any]]]) -> Optional[RequestValidator]:
+    """
+    Endpoint parametrelerinden doğrulayıcı derle (kontrol edilecek bir şey yoksa None)
+
+    Args:
+        endpoint_data: Endpoint verisi
+        categorized: {'query'|'header'|'path'|'body': [parametre]} (bkz. compile_request_plan)
+    """
+    def parameter_rules(params: List[Mapping[str, Any]], skip=frozenset()) -> Tuple[FieldRule, ...]:
+        rules = []
+        for param in params:
+            name = param.get('name', '')
+            if name in skip:
+                continue
+            rule = compile_rule(name, param, bool(param.get('required')))
+            if rule is not None:
+                rules.append(rule)
+        return tuple(rules)
+
+    body: Tuple[FieldRule, ...] = ()
+    if categorized['body']:
+        body = compile_properties(categorized['body'][0].get('schema') or {})
+
+    query = parameter_rules(categorized['query'])
+    header = parameter_rules(categorized['header'], TICKET_HEADERS)
+    path = parameter_rules(categorized['path'])
+    if not (query or header or path or body):
+        return None
+
+    endpoint = f"{endpoint_data.get('category', '')} {endpoint_data.get('method', '')} {endpoint_data.get('path', '')}"
+    return RequestValidator(endpoint.strip(), query, header, path, body)
+
+
+__all__ = ['RequestValidationError', 'RequestValidator', 'FieldRule', 'compile_validator']
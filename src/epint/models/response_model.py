@@ -12,10 +12,15 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from __future__ import annotations
+
 import io
-from typing import Dict, Any, List, Optional, Union
-from requests import Response
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Union
 from ..modules.datetime import DateTimeUtils
+from ..modules.json_codec import JsonCodec
+
+if TYPE_CHECKING:
+    from requests import Response
 
 
 class ResponseModel:
@@ -70,14 +75,16 @@ class ResponseModel:
         """Response'u parse et ve schema'ya göre dönüştür"""
         # Binary içerik kontrolü
         if self._is_binary_content():
-            # Binary ise BytesIO olarak döndür
+            # Binary ise BytesIO olarak döndür; content bytes olduğundan BytesIO yazılmadığı
+            # sürece aynı objeyi kullanır (kopya yok). Büyük export'lar için to= ile
+            # akışlı indirme kullanılmalı (bkz. download_response)
             self._raw_data = self._response.content
-            self._parsed_data = io.BytesIO(self._response.content)
+            self._parsed_data = io.BytesIO(self._raw_data)
             return
         
         # JSON response
         try:
-            self._raw_data = self._response.json()
+            self._raw_data = JsonCodec.decode_response(self._response)
         except (ValueError, AttributeError):
             # JSON değilse text olarak al
             self._raw_data = self._response.text
@@ -13,16 +13,98 @@
 # limitations under the License.
 
 import json
-from typing import Dict, Any, List, Optional
+import sys
+from collections.abc import MutableMapping
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, Callable, Iterator, Tuple
+
+# Çözülen değer hiçbir circular referans kesimine bağlı değil
+_NO_CYCLE = sys.maxsize
+
+
+def freeze_endpoint(endpoint: Mapping[str, Any]) -> Mapping[str, Any]:
+    """
+    Endpoint verisinin salt-okunur görünümü
+
+    Registry'deki endpoint verileri thread'ler ve runtime modları arasında
+    paylaşılır; çağrı sırasında değiştirilmemeleri için üst seviye alanlar
+    salt-okunur döndürülür.
+    """
+    if isinstance(endpoint, MappingProxyType):
+        return endpoint
+    return MappingProxyType(endpoint)
+
+
+class LazyEndpointTable(MutableMapping):
+    """
+    Endpoint isimlerinden endpoint verisine lazy mapping
+
+    Kategori yüklenirken sadece operation listesi okunur; parametre ve
+    response schema'ları bir endpoint'e ilk erişildiğinde çözülür ve
+    memoize edilir. Anahtarlar (dir(), fuzzy matching) çözümleme
+    gerektirmez. Değerler salt-okunur döndürülür (bkz. freeze_endpoint).
+    """
+
+    def __init__(self, resolver: Callable[..., Dict[str, Any]], operations: Dict[str, Tuple[str, str, Dict[str, Any]]]):
+        """
+        Args:
+            resolver: (path, method, method_data) -> endpoint verisi
+            operations: {endpoint_ismi: (path, method, method_data)}
+        """
+        self._resolver = resolver
+        self._operations = operations
+        self._resolved: Dict[str, Mapping[str, Any]] = {}
+
+    def __getitem__(self, name: str) -> Mapping[str, Any]:
+        resolved = self._resolved.get(name)
+        if resolved is not None:
+            return resolved
+
+        operation = self._operations[name]
+        # Aynı anda iki thread çözümlerse ilk yazılan paylaşılsın
+        return self._resolved.setdefault(name, freeze_endpoint(self._resolver(*operation)))
+
+    def __setitem__(self, name: str, data: Mapping[str, Any]) -> None:
+        self._operations[name] = None
+        self._resolved[name] = freeze_endpoint(data)
+
+    def __delitem__(self, name: str) -> None:
+        del self._operations[name]
+        self._resolved.pop(name, None)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._operations
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._operations)
+
+    def __len__(self) -> int:
+        return len(self._operations)
+
+    def is_resolved(self, name: str) -> bool:
+        """Endpoint verisi çözülmüş mü?"""
+        return name in self._resolved
+
+    def __repr__(self) -> str:
+        return f"<LazyEndpointTable: endpoints={len(self._operations)}, resolved={len(self._resolved)}>"
+
 
 class SwaggerModel:
     """Swagger JSON modeli - tüm swagger verilerini tutar"""
     
-    def __init__(self, swagger_path: str):
-        """Swagger dosyasını yükle ve parse et"""
+    def __init__(self, swagger_path: str, category: Optional[str] = None):
+        """
+        Swagger dosyasını yükle ve parse et
+
+        Args:
+            swagger_path: swagger.json yolu
+            category: Verilirse her endpoint verisine 'category' olarak eklenir
+        """
         with open(swagger_path, 'r', encoding='utf-8') as f:
             self._data = json.load(f)
-        
+
+        self.category = category
+        self._resolved_definitions: Dict[str, Any] = {}
         self._parse()
     
     def _parse(self):
@@ -35,9 +117,9 @@ class SwaggerModel:
         self.tags = self._data.get('tags', [])
         self.endpoints = self._parse_endpoints()
     
-    def _parse_endpoints(self) -> Dict[str, Dict[str, Any]]:
-        """Path'leri endpoint'lere çevir"""
-        endpoints = {}
+    def _parse_endpoints(self) -> LazyEndpointTable:
+        """Path'leri endpoint'lere çevir (schema'lar ilk erişimde çözülür)"""
+        operations = {}
         
         for path, path_item in self.paths.items():
             for method, method_data in path_item.items():
@@ -49,23 +131,29 @@ class SwaggerModel:
                     continue
                 
                 method_name = operation_id.replace('-', '_')
-                
-                endpoints[method_name] = {
-                    'host':self.host,
-                    'basePath':self.base_path,
-                    'path': path,
-                    'method': method.upper(),
-                    'operation_id': operation_id,
-                    'summary': method_data.get('summary', ''),
-                    'description': method_data.get('description', ''),
-                    'tags': method_data.get('tags', []),
-                    'consumes': method_data.get('consumes', []),
-                    'produces': method_data.get('produces', []),
-                    'parameters': self._parse_parameters(method_data.get('parameters', [])),
-                    'responses': self._parse_responses(method_data.get('responses', {})),
-                }
+                operations[method_name] = (path, method, method_data)
         
-        return endpoints
+        return LazyEndpointTable(self._parse_operation, operations)
+
+    def _parse_operation(self, path: str, method: str, method_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Tek bir operation'ı parametre ve response schema'ları çözülmüş endpoint verisine çevir"""
+        endpoint = {
+            'host':self.host,
+            'basePath':self.base_path,
+            'path': path,
+            'method': method.upper(),
+            'operation_id': method_data.get('operationId', ''),
+            'summary': method_data.get('summary', ''),
+            'description': method_data.get('description', ''),
+            'tags': method_data.get('tags', []),
+            'consumes': method_data.get('consumes', []),
+            'produces': method_data.get('produces', []),
+            'parameters': self._parse_parameters(method_data.get('parameters', [])),
+            'responses': self._parse_responses(method_data.get('responses', {})),
+        }
+        if self.category is not None:
+            endpoint['category'] = self.category
+        return endpoint
     
     def _parse_parameters(self, parameters: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Parametreleri parse et"""
@@ -84,12 +172,8 @@ class SwaggerModel:
             if 'schema' in param:
                 schema = param['schema']
                 if '$ref' in schema:
-                    resolved_schema = self._resolve_ref_recursive(schema['$ref'])
-                    if resolved_schema:
-                        # Resolved schema'yı da tamamen çöz (nested $ref'ler ve properties içindeki $ref'ler için)
-                        param_data['schema'] = self._resolve_all_refs(resolved_schema)
-                    else:
-                        param_data['schema'] = None
+                    # Çözülmüş definition nested $ref'leri de çözülmüş halde (paylaşımlı) döner
+                    param_data['schema'] = self._resolve_ref_recursive(schema['$ref']) or None
                 else:
                     # Schema içindeki tüm $ref'leri recursive olarak çöz
                     param_data['schema'] = self._resolve_all_refs(schema)
@@ -120,59 +204,161 @@ class SwaggerModel:
         
         return parsed
     
-    def _resolve_ref_recursive(self, ref: str, visited: set = None) -> Optional[Dict[str, Any]]:
+    def _resolve_ref_recursive(self, ref: str, stack: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
         """Definition referansını recursive olarak çöz"""
-        if visited is None:
-            visited = set()
-        
-        if ref.startswith('#/definitions/'):
-            def_name = ref.replace('#/definitions/', '')
-            
-            # Circular reference kontrolü
-            if def_name in visited:
-                return None
-            
-            visited.add(def_name)
-            definition = self.definitions.get(def_name)
-            
-            if definition:
-                # Definition içindeki tüm referansları çöz
-                return self._resolve_all_refs(definition, visited)
-        
-        return None
+        resolved, _ = self._resolve_ref(ref, [] if stack is None else stack)
+        return resolved
     
-    def _resolve_all_refs(self, obj: Any, visited: set = None) -> Any:
+    def _resolve_all_refs(self, obj: Any, stack: Optional[List[str]] = None) -> Any:
         """Objedeki tüm $ref referanslarını recursive olarak çöz"""
-        if visited is None:
-            visited = set()
-        
+        resolved, _ = self._resolve_value(obj, [] if stack is None else stack)
+        return resolved
+
+    def _resolve_ref(self, ref: str, stack: List[str]) -> Tuple[Optional[Dict[str, Any]], int]:
+        """
+        Definition referansını çöz ve memoize et
+
+        Tamamen çözülmüş definition'lar isimleriyle saklanır; aynı definition'a
+        yapılan her referans aynı objeyi paylaşır. Bu objeler salt-okunur
+        kabul edilir, değiştirilmemelidir.
+
+        Circular referanslar, çözülmekte olan definition'a geri dönen noktada
+        None ile kesilir. Dolaylı bir döngünün parçası olan definition'ların
+        sonucu hangi definition'dan çözülmeye başlandığına göre değiştiği için
+        bunlar memoize edilmez; doğrudan kendine referanslar bağlamdan
+        bağımsızdır.
+
+        Args:
+            ref: '#/definitions/X' formatında referans
+            stack: Şu an çözülmekte olan definition isimleri (en dıştaki başta)
+
+        Returns:
+            (çözülmüş definition veya None, sonucun bağlı olduğu en sığ stack derinliği)
+        """
+        if not ref.startswith('#/definitions/'):
+            return None, _NO_CYCLE
+
+        def_name = ref.replace('#/definitions/', '')
+
+        resolved = self._resolved_definitions.get(def_name)
+        if resolved is not None:
+            return resolved, _NO_CYCLE
+
+        # Circular reference kontrolü
+        if def_name in stack:
+            if stack[-1] == def_name:
+                # Doğrudan kendine referans her bağlamda aynı şekilde kesilir
+                return None, _NO_CYCLE
+            return None, stack.index(def_name)
+
+        definition = self.definitions.get(def_name)
+        if not definition:
+            return None, _NO_CYCLE
+
+        depth = len(stack)
+        stack.append(def_name)
+        try:
+            # Definition içindeki tüm referansları çöz
+            resolved, cycle_depth = self._resolve_value(definition, stack)
+        finally:
+            stack.pop()
+
+        if cycle_depth > depth:
+            # Kesimler (varsa) yalnızca alt definition'ların kendi döngülerinde:
+            # bu definition hiçbir döngünün parçası değil, sonuç bağlamdan bağımsız
+            self._resolved_definitions[def_name] = resolved
+            cycle_depth = _NO_CYCLE
+
+        return resolved, cycle_depth
+
+    def _resolve_value(self, obj: Any, stack: List[str]) -> Tuple[Any, int]:
+        """Objedeki tüm $ref referanslarını çöz, bağlı olunan en sığ stack derinliğini de döndür"""
         if isinstance(obj, dict):
             # $ref varsa çöz
             if '$ref' in obj and len(obj) == 1:
-                return self._resolve_ref_recursive(obj['$ref'], visited)
+                return self._resolve_ref(obj['$ref'], stack)
             
             # Dict içindeki tüm değerleri recursive olarak işle
             resolved = {}
+            cycle_depth = _NO_CYCLE
             for key, value in obj.items():
                 if key == '$ref':
                     # $ref'i çöz ama diğer key'lerle birlikte varsa koru
-                    ref_value = self._resolve_ref_recursive(value, visited)
+                    ref_value, value_depth = self._resolve_ref(value, stack)
                     if ref_value:
                         resolved.update(ref_value)
                 else:
-                    resolved[key] = self._resolve_all_refs(value, visited)
-            return resolved
+                    resolved[key], value_depth = self._resolve_value(value, stack)
+                cycle_depth = min(cycle_depth, value_depth)
+            return resolved, cycle_depth
         
         elif isinstance(obj, list):
             # List içindeki tüm elemanları recursive olarak işle
-            return [self._resolve_all_refs(item, visited) for item in obj]
+            resolved = []
+            cycle_depth = _NO_CYCLE
+            for item in obj:
+                resolved_item, item_depth = self._resolve_value(item, stack)
+                resolved.append(resolved_item)
+                cycle_depth = min(cycle_depth, item_depth)
+            return resolved, cycle_depth
         
-        return obj
+        return obj, _NO_CYCLE
     
     def get_endpoint(self, name: str) -> Optional[Dict[str, Any]]:
         """Endpoint al"""
         return self.endpoints.get(name)
     
-    def get_all_endpoints(self) -> Dict[str, Dict[str, Any]]:
-        """Tüm endpoint'leri al"""
+    def get_all_endpoints(self) -> LazyEndpointTable:
+        """Tüm endpoint'leri al (değerler ilk erişimde çözülür)"""
         return self.endpoints
+
+
+# Sadece repr/dokümantasyon için kullanılan, request/response işlemede gerekmeyen alanlar
+DOCUMENTATION_KEYS = frozenset({'summary', 'description', 'example', 'title', 'xml', 'tags', 'externalDocs'})
+
+
+def to_lean_endpoint(endpoint: Dict[str, Any], memo: Optional[Dict[int, Tuple[Any, Any]]] = None) -> Dict[str, Any]:
+    """
+    Endpoint verisinin dokümantasyon alanları atılmış (lean) kopyasını oluştur
+
+    Tip, format, isim, konum ve host bilgileri korunur; summary, description,
+    example gibi alanlar atılır. 'properties' altındaki field isimleri
+    (örn. 'description' isimli bir field) korunur. Aynı memo ile çağrıldığında
+    paylaşılan definition objeleri lean kopyada da paylaşılır. Memo kaynak
+    objeleri de tuttuğu için id'leri memo yaşadığı sürece başka bir objeye
+    verilemez.
+
+    Args:
+        endpoint: SwaggerModel tarafından çözülmüş endpoint verisi
+        memo: id(obj) -> (obj, lean kopya) (kategori genelinde paylaşım için)
+
+    Returns:
+        Lean endpoint verisi ('lean': True işaretli)
+    """
+    lean = _strip_documentation(dict(endpoint), {} if memo is None else memo, False)
+    lean['lean'] = True
+    return lean
+
+
+def _strip_documentation(obj: Any, memo: Dict[int, Tuple[Any, Any]], is_property_map: bool) -> Any:
+    if isinstance(obj, (dict, list)):
+        # Kayıt kaynak objeyi de tutar; kimlik kontrolü id tekrarına karşı ikinci güvence
+        entry = memo.get(id(obj))
+        if entry is not None and entry[0] is obj:
+            return entry[1]
+
+    if isinstance(obj, dict):
+        lean = {}
+        for key, value in obj.items():
+            if not is_property_map and key in DOCUMENTATION_KEYS:
+                continue
+            lean[key] = _strip_documentation(value, memo, key == 'properties' and not is_property_map)
+        memo[id(obj)] = (obj, lean)
+        return lean
+
+    if isinstance(obj, list):
+        lean = [_strip_documentation(item, memo, False) for item in obj]
+        memo[id(obj)] = (obj, lean)
+        return lean
+
+    return obj
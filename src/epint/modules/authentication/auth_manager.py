@@ -17,15 +17,32 @@ from __future__ import annotations
 import os
 import tempfile
 import datetime
+import weakref
 from typing import Dict, Tuple, Optional
 from dataclasses import dataclass
 
 from ..http_client import HTTPClient
+from ..http_client.deadline import Deadline
 from ..datetime import DateTimeUtils
 import random
 import time
 
 
+# event loop -> {(ticket tipi, kullanıcı, CAS root): asyncio.Lock}
+_async_ticket_locks: 'weakref.WeakKeyDictionary' = weakref.WeakKeyDictionary()
+
+
+def _async_ticket_lock(key: Tuple[str, ...]):
+    """Çalışan event loop'a ait, anahtar bazında paylaşılan asyncio.Lock"""
+    import asyncio
+
+    locks = _async_ticket_locks.setdefault(asyncio.get_running_loop(), {})
+    lock = locks.get(key)
+    if lock is None:
+        lock = locks[key] = asyncio.Lock()
+    return lock
+
+
 @dataclass
 class TicketInfo:
     code: str
@@ -341,7 +358,12 @@ class Authentication:
 
         return DateTimeUtils.to_string(DateTimeUtils.now() + delta)
 
-    def get_tgt(self) -> Tuple[str, str]:
+    def get_tgt(self, deadline: Optional[Deadline] = None) -> Tuple[str, str]:
+        if deadline is not None:
+            # Deadline, TGT oluşturma isteğine context üzerinden taşınır
+            with deadline.activate():
+                return self.get_tgt()
+
         existing_tgt = self._find_valid_tgt()
         if existing_tgt:
             # EPYS servisleri için TGT her kullanışta 45 dk uzar
@@ -349,8 +371,16 @@ class Authentication:
                 return self._extend_tgt_expiry(existing_tgt[0], existing_tgt[1])
             return existing_tgt
 
+        self._check_deadline("TGT alma")
         return self._create_new_tgt()
 
+    @staticmethod
+    def _check_deadline(stage: str) -> None:
+        """Çalışan çağrının deadline'ı dolduysa ticket isteği göndermeden DeadlineExceeded fırlat"""
+        deadline = Deadline.current()
+        if deadline is not None:
+            deadline.check(stage)
+
     def _find_valid_tgt(self) -> Optional[Tuple[str, str]]:
         if not os.path.exists(self.tgt_dir):
             return None
@@ -428,14 +458,49 @@ class Authentication:
         self._store_ticket("tgt", tgt_code, expire_date)
         return tgt_code, expire_date
 
-    def get_st(self, service: str, find_valid: bool = False) -> Tuple[str, str]:
+    def get_st(self, service: str, find_valid: bool = False, deadline: Optional[Deadline] = None) -> Tuple[str, str]:
+        if deadline is not None:
+            with deadline.activate():
+                return self.get_st(service, find_valid)
+
         if find_valid:
             existing_st = self._find_valid_st(service)
             if existing_st:
                 return existing_st
 
+        self._check_deadline("ST alma")
         return self._create_new_st(service)
 
+    async def aget_tgt(self, deadline: Optional[Deadline] = None) -> Tuple[str, str]:
+        """
+        get_tgt'nin asyncio karşılığı
+
+        Aynı kullanıcı ve CAS root için eşzamanlı task'lar kilit altında
+        sıraya girer; geçerli TGT yoksa yalnızca ilk task yeni TGT oluşturur,
+        diğerleri dosyadaki TGT'yi kullanır. Dosya/HTTP işlemleri thread'de
+        çalışır, event loop bloklanmaz.
+        """
+        import asyncio
+
+        if deadline is not None:
+            with deadline.activate():
+                return await self.aget_tgt()
+
+        async with _async_ticket_lock(("tgt", self.username, self.root)):
+            return await asyncio.to_thread(self.get_tgt)
+
+    async def aget_st(self, service: str, find_valid: bool = False,
+                      deadline: Optional[Deadline] = None) -> Tuple[str, str]:
+        """get_st'nin asyncio karşılığı (TGT kilit altında alınır, ST'ler paralel oluşturulur)"""
+        import asyncio
+
+        if deadline is not None:
+            with deadline.activate():
+                return await self.aget_st(service, find_valid)
+
+        await self.aget_tgt()
+        return await asyncio.to_thread(self.get_st, service, find_valid)
+
     def _find_valid_st(self, service: str) -> Optional[Tuple[str, str]]:
         if not os.path.exists(self.st_dir):
             return None
@@ -18,7 +18,6 @@ import epint
 from ...models.endpoint_registry import EndpointModel
 from ...models.endpoint_callable import Endpoint
 from ..search.method_name_decorator import to_python_method_name
-from ..search.find_closest import find_closest_match
 
 
 class CategoryProxy:
@@ -26,10 +25,10 @@ class CategoryProxy:
 
     def __init__(self, category: str):
         self._category = category
+        self._endpoints: Dict[str, Endpoint] = {}
 
     def __dir__(self) -> Iterable[str]:
-        endpoints = set([to_python_method_name(method) for method in EndpointModel.get_category_endpoints(self._category).keys()])
-        return sorted(endpoints)
+        return sorted(EndpointModel.get_method_names(self._category).keys())
 
     def __getattr__(self, name):
         """Method ismine erişim - epint.category.method_name"""
@@ -51,14 +50,14 @@ class CategoryProxy:
             endpoint_name = name
         else:
             # 3. Normalize edilmiş isimlerle fuzzy matching
-            normalized_endpoints = {to_python_method_name(ep_name): ep_name for ep_name in endpoints.keys()}
-            closest_normalized = find_closest_match(normalized_name, list(normalized_endpoints.keys()), threshold=0.7)
+            normalized_endpoints = EndpointModel.get_method_names(self._category)
+            closest_normalized = EndpointModel.get_name_matcher(self._category).find(normalized_name, threshold=0.7)
             if closest_normalized:
                 endpoint_name = normalized_endpoints[closest_normalized]
                 endpoint_data = endpoints[endpoint_name]
             else:
                 # 4. Orijinal endpoint isimleriyle fuzzy matching (düşük threshold)
-                closest = find_closest_match(name, list(endpoints.keys()), threshold=0.6)
+                closest = EndpointModel.get_name_matcher(self._category, normalized=False).find(name, threshold=0.6)
                 if closest:
                     endpoint_name = closest
                     endpoint_data = endpoints[closest]
@@ -70,6 +69,12 @@ class CategoryProxy:
                 f"Available endpoints: {available}"
             )
 
-        # EndpointModel.Endpoint objesi döndür
-        return Endpoint(self._category, endpoint_name or name, endpoint_data)
+        # Aynı endpoint'e farklı yazımlarla erişilse de tek Endpoint objesi kullanılır.
+        # Instance __dict__'ine yazıldığı için sonraki erişimler __getattr__'a uğramaz.
+        endpoint_name = endpoint_name or name
+        endpoint = self._endpoints.get(endpoint_name)
+        if endpoint is None:
+            endpoint = self._endpoints.setdefault(endpoint_name, Endpoint(self._category, endpoint_name, endpoint_data))
+        self.__dict__[name] = endpoint
+        return endpoint
 
@@ -15,6 +15,7 @@
 from __future__ import annotations
 
 import datetime as _dt
+import re
 from zoneinfo import ZoneInfo
 from typing import Optional, Union, Tuple
 from calendar import monthrange
@@ -24,6 +25,9 @@ class DateTimeUtils:
 
     DEFAULT_TIMEZONE = ZoneInfo("Europe/Istanbul")
 
+    # 'YYYY-MM-DD', 'YYYY-MM-DD HH:MM' ve 'YYYY-MM-DD HH:MM:SS' için strptime denemeleri yerine fromisoformat
+    _ISO_LIKE_PATTERN = re.compile(r"\d{4}-\d{2}-\d{2}(?: \d{2}:\d{2}(?::\d{2})?)?")
+
     DATE_FORMAT = "%Y-%m-%d"
     DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
     ISO_FORMAT = "%Y-%m-%dT%H:%M:%S%z"
@@ -206,6 +210,12 @@ class DateTimeUtils:
     @classmethod
     def _try_other_formats(cls, date_string: str) -> Optional[_dt.datetime]:
 
+        if cls._ISO_LIKE_PATTERN.fullmatch(date_string):
+            try:
+                return _dt.datetime.fromisoformat(date_string).replace(tzinfo=cls.DEFAULT_TIMEZONE)
+            except ValueError:
+                pass
+
         formats = [
             "%Y-%m-%d %H:%M:%S",
             "%Y-%m-%d %H:%M",
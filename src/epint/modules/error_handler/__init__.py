@@ -14,6 +14,7 @@
 
 from typing import Dict, Any, Optional, Callable, List
 from ..authentication.auth_manager import Authentication
+from ..json_codec import JsonCodec
 
 
 class ErrorHandler:
@@ -73,7 +74,7 @@ class ErrorHandler:
 
         # Response body'den hata kodlarını al ve işle
         try:
-            response_body = response.json()
+            response_body = JsonCodec.decode_response(response)
             errors = response_body.get('errors', [])
             for error in errors:
                 error_code = error.get('errorCode', '')
@@ -92,7 +93,7 @@ class ErrorHandler:
     def _handle_401(self, response: Any) -> None:
         """401 Unauthorized hatası"""
         try:
-            response_body = response.json()
+            response_body = JsonCodec.decode_response(response)
             errors = response_body.get('errors', [])
 
             for error in errors:
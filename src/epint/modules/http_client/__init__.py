@@ -14,12 +14,27 @@
 
 from __future__ import annotations
 
-from typing import Dict, Optional, Tuple, Union, Any
-from urllib3.util.retry import Retry
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait as wait_futures
+from typing import Dict, List, Optional, Tuple, Union, Any
+from urllib.parse import urlsplit
 from requests.adapters import HTTPAdapter
 from requests import Session, Response
-from requests.exceptions import RequestException, RetryError, Timeout, HTTPError
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import RequestException, Timeout, HTTPError
 from ..version import __fullname__
+from ..json_codec import JsonCodec
+from .circuit_breaker import CircuitBreaker, CircuitOpenError
+from .compression import IDENTITY, accept_encoding
+from .deadline import Deadline, DeadlineExceeded
+from .hedging import HedgePolicy, LatencyTracker, is_hedgeable_url
+from .http_cache import CachePolicy
+from .rate_limiter import RateLimiter
+from .retry_policy import (
+    RetryPolicy, RetryCall, RetryReport,
+    OK, SERVER_ERROR, CONNECT_ERROR, TIMEOUT, RATE_LIMITED, TICKET_INVALID, ERROR,
+)
+import os
+import threading
 import time
 
 
@@ -27,8 +42,18 @@ class HTTPClient:
     """
     Retry mekanizması olan gelişmiş HTTP client.
     Context manager olarak kullanılabilir.
+
+    Varsayılan olarak session'lar process genelinde host (ve client ayarları)
+    bazında paylaşılır; böylece farklı endpoint'ler ve çağrılar aynı
+    keep-alive bağlantı havuzunu kullanır.
     """
 
+    # (pid, host, ayarlar) -> Session; fork sonrası çocuk process kendi havuzunu kurar
+    _shared_sessions: Dict[Tuple[Any, ...], Session] = {}
+    _shared_lock = threading.Lock()
+    # Hedged request'lerin çalıştığı process geneli thread havuzu
+    _hedge_executor: Optional[ThreadPoolExecutor] = None
+
     def __init__(
         self,
         retries: int = 3,
@@ -40,19 +65,42 @@ class HTTPClient:
         verify: bool = True,
         allow_redirects: bool = True,
         auth: Optional[Any] = None,
+        share_session: bool = True,
+        pool_maxsize: int = 20,
+        rate_limit: bool = True,
+        retry_policy: Optional[RetryPolicy] = None,
+        hedge: Optional[HedgePolicy] = None,
+        circuit_breaker: bool = True,
+        compress: bool = True,
+        cache: Optional[CachePolicy] = None,
     ):
         """
         HTTP Client oluştur
 
         Args:
-            retries: Toplam retry sayısı
-            backoff_factor: Retry arasındaki bekleme çarpanı
+            retries: Toplam retry sayısı (ilk deneme hariç)
+            backoff_factor: Full-jitter üstel beklemenin taban süresi (saniye)
             status_forcelist: Retry yapılacak HTTP status kodları
-            allowed_methods: Retry yapılacak HTTP metodları (None ise tüm metodlar)
+            allowed_methods: 5xx/timeout sonrası retry yapılacak HTTP metodları (None ise tüm metodlar)
             timeout: Request timeout süresi (saniye) veya (connect_timeout, read_timeout) tuple
             headers: Varsayılan header'lar
             verify: SSL sertifika doğrulaması
             allow_redirects: Redirect'lere izin ver (default: True)
+            share_session: Host bazında process genelindeki paylaşılan session'ı kullan
+                           (False ise client kendi session'ını açar ve kapatır)
+            pool_maxsize: Host başına açık tutulacak en fazla bağlantı sayısı
+            rate_limit: İstekleri host/kullanıcı bazında paylaşılan RateLimiter ile
+                        RateLimit-* header'larına göre önceden yavaşlat
+            retry_policy: Retry kuralları (verilirse retries, backoff_factor,
+                          status_forcelist ve allowed_methods yerine kullanılır)
+            hedge: Tüm istekler için hedging kuralları (sadece şeffaflık host'una
+                   giden istekler hedge edilir; istek bazında hedge= ile de verilebilir)
+            circuit_breaker: Host bazında paylaşılan CircuitBreaker'ı kullan (art arda
+                             hata veren host'a devre açıkken istek göndermeden hata ver)
+            compress: Sıkıştırılmış transfer iste (gzip/deflate, kuruluysa br/zstd);
+                      False ise Accept-Encoding: identity
+            cache: Tüm istekler için ETag/Last-Modified cache kuralları (istek
+                   bazında cache= ile de verilebilir, cache=None kapatır)
         """
         self.retries = retries
         self.backoff_factor = backoff_factor
@@ -63,29 +111,31 @@ class HTTPClient:
         self.verify = verify
         self.allow_redirects = allow_redirects
         self.auth = auth
+        self.share_session = share_session
+        self.pool_maxsize = pool_maxsize
+        self.rate_limit = rate_limit
+        self.retry_policy = retry_policy or RetryPolicy(
+            max_attempts=retries + 1,
+            base_delay=backoff_factor,
+            retry_statuses=tuple(status_forcelist),
+            retry_methods=tuple(method.upper() for method in self.allowed_methods),
+        )
+        self.hedge = hedge
+        self.circuit_breaker = circuit_breaker
+        self.compress = compress
+        self.cache = cache
 
         self._session: Optional[Session] = None
 
     def _create_session(self) -> Session:
-        """Retry mekanizması ile session oluştur"""
+        """Bağlantı havuzlu session oluştur (retry'lar RetryPolicy ile _make_request'te yapılır)"""
         session = Session()
 
-        # Retry stratejisi
-        retry_strategy = Retry(
-            total=self.retries,
-            read=self.retries,
-            connect=self.retries,
-            backoff_factor=self.backoff_factor,
-            status_forcelist=list(self.status_forcelist),
-            allowed_methods=list(self.allowed_methods),
-            raise_on_status=False,
-        )
-
         # HTTP adapter'ları mount et
         adapter = HTTPAdapter(
-            max_retries=retry_strategy,
+            max_retries=0,
             pool_connections=10,
-            pool_maxsize=20,
+            pool_maxsize=self.pool_maxsize,
         )
 
         session.mount("http://", adapter)
@@ -96,12 +146,14 @@ class HTTPClient:
             session.headers.update(self.headers)
 
         session.headers.update({"User-Agent":__fullname__, "Accept-Language":"tr-TR"})
+        session.headers["Accept-Encoding"] = accept_encoding() if self.compress else IDENTITY
 
         return session
 
     def __enter__(self) -> HTTPClient:
         """Context manager giriş"""
-        self._session = self._create_session()
+        if not self.share_session:
+            self._session = self._create_session()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
@@ -110,12 +162,48 @@ class HTTPClient:
             self._session.close()
             self._session = None
 
-    def _get_session(self) -> Session:
-        """Session'ı al veya oluştur"""
-        if self._session is None:
-            self._session = self._create_session()
+    def _get_session(self, url: Optional[str] = None) -> Session:
+        """Session'ı al veya oluştur (paylaşımlı modda URL'in host'una ait session)"""
+        if self._session is not None:
+            return self._session
+        if self.share_session and url:
+            return self._get_shared_session(urlsplit(url).netloc)
+        self._session = self._create_session()
         return self._session
 
+    def _session_key(self, host: str) -> Tuple[Any, ...]:
+        """Paylaşılan session anahtarı: session'ı etkileyen tüm ayarlar dahil"""
+        return (
+            os.getpid(),
+            host,
+            tuple(sorted(self.headers.items())),
+            self.pool_maxsize,
+            self.compress,
+        )
+
+    def _get_shared_session(self, host: str) -> Session:
+        key = self._session_key(host)
+        session = HTTPClient._shared_sessions.get(key)
+        if session is None:
+            with HTTPClient._shared_lock:
+                session = HTTPClient._shared_sessions.get(key)
+                if session is None:
+                    session = self._create_session()
+                    HTTPClient._shared_sessions[key] = session
+        return session
+
+    @classmethod
+    def close_shared_sessions(cls) -> None:
+        """Process genelindeki paylaşılan session'ları kapat"""
+        with cls._shared_lock:
+            sessions = list(cls._shared_sessions.items())
+            cls._shared_sessions.clear()
+        pid = os.getpid()
+        for key, session in sessions:
+            # Fork öncesi parent'tan kalan session'ların soketlerine dokunma
+            if key[0] == pid:
+                session.close()
+
     def _check_rate_limit(self, response: Response) -> Optional[float]:
         """
         Rate limit header'larını kontrol et ve gerekirse bekleme süresi döndür
@@ -198,7 +286,7 @@ class HTTPClient:
         **kwargs: Any
     ) -> Response:
         """
-        HTTP request yap
+        HTTP request yap (retry kuralları için bkz. RetryPolicy)
 
         Args:
             method: HTTP metodu (GET, POST, vb.)
@@ -206,15 +294,263 @@ class HTTPClient:
             **kwargs: requests.Session.request() için ek parametreler
 
         Returns:
-            Response objesi
+            Response objesi (denemeler response.retry_report'ta)
 
         Raises:
-            RequestException: Request başarısız olduğunda
-            Timeout: Timeout olduğunda
-            RetryError: Retry limiti aşıldığında
+            DeadlineExceeded: Çağrının deadline'ı dolduğunda (bkz. Deadline)
+            CircuitOpenError: Host'un devresi açıkken (bkz. CircuitBreaker)
+            RequestException: Request başarısız olduğunda (denemeler exception.retry_report'ta)
+        """
+        cache = kwargs.pop('cache', self.cache)
+        if cache is not None and not kwargs.get('stream'):
+            return self._cached_request(cache, method, url, kwargs)
+
+        session = self._get_session(url)
+        limiter = self._get_rate_limiter(url)
+        breaker = self._get_circuit_breaker(url)
+        deadline = kwargs.pop('deadline', None) or Deadline.current()
+        hedge = self._hedge_for(url, kwargs.pop('hedge', None))
+        kwargs = self._prepare_request_kwargs(kwargs)
+        timeout = kwargs.get('timeout')
+        call = self.retry_policy.start(method, deadline=deadline)
+
+        while True:
+            response: Optional[Response] = None
+            error: Optional[RequestException] = None
+            call.begin_attempt()
+            try:
+                self._apply_deadline(deadline, kwargs, timeout)
+                if breaker is not None:
+                    breaker.allow()
+                if hedge is not None:
+                    response = self._send_hedged(session, limiter, method.upper(), url, kwargs, deadline, hedge, call)
+                else:
+                    response = self._send_limited(session, limiter, method.upper(), url, kwargs, deadline)
+            except (DeadlineExceeded, CircuitOpenError) as e:
+                e.retry_report = call.report
+                raise
+            except RequestException as e:
+                error = e
+
+            outcome = self._classify(response, error)
+            if breaker is not None:
+                breaker.record(outcome)
+            delay = call.next_delay(outcome, getattr(response, 'status_code', None),
+                                    self._server_wait(outcome, response))
+            if delay is None:
+                return self._finish(call, method, url, kwargs, response, error)
+            if kwargs.get('stream'):
+                # Tekrar denenecek akışlı cevabın bağlantısını havuza geri ver
+                self._close_response(response)
+
+            if outcome == TICKET_INVALID:
+                url = self._refresh_tgt(url, kwargs)
+            elif outcome == RATE_LIMITED and limiter is not None:
+                # Bekleme paylaşılan limiter üzerinden (bir sonraki reserve bekler)
+                limiter.block(delay)
+            elif delay > 0:
+                time.sleep(delay)
+
+    def _cached_request(self, cache: CachePolicy, method: str, url: str, kwargs: Dict[str, Any]) -> Response:
+        """Taze kaydı döndür, yoksa validator'larla istek gönderip cevabı sakla (bkz. HTTPCache)"""
+        store = cache.get_store()
+        key = store.key(method, url, kwargs, getattr(self.auth, 'username', None))
+        entry = store.lookup(key, kwargs)
+        if entry is not None:
+            return entry.to_response(url)
+        return store.store(key, self._make_request(method, url, cache=None, **kwargs), cache.ttl)
+
+    @staticmethod
+    def _apply_deadline(deadline: Optional[Deadline], kwargs: Dict[str, Any],
+                        timeout: Optional[Union[float, Tuple[float, float]]]) -> None:
+        """Deneme öncesi deadline'ı kontrol et ve timeout'u kalan süre ile sınırla"""
+        if deadline is not None:
+            deadline.check('HTTP isteği')
+            kwargs['timeout'] = deadline.cap_timeout(timeout)
+
+    def _classify(self, response: Optional[Response], error: Optional[Exception]) -> str:
+        """Denemenin sonucunu sınıflandır (bkz. retry_policy)"""
+        if error is not None:
+            if isinstance(error, RequestsConnectionError):
+                return CONNECT_ERROR
+            if isinstance(error, Timeout):
+                return TIMEOUT
+            return ERROR
+        status = response.status_code
+        if status < 400:
+            return OK
+        if status == 429:
+            return RATE_LIMITED
+        if status == 404 and self.auth and self._is_tgt_invalid(response):
+            return TICKET_INVALID
+        if status in self.retry_policy.retry_statuses:
+            return SERVER_ERROR
+        return ERROR
+
+    def _server_wait(self, outcome: str, response: Optional[Response]) -> Optional[float]:
+        """429 için sunucunun bildirdiği bekleme süresi"""
+        if outcome == RATE_LIMITED and response is not None:
+            return self._rate_limit_wait(response)
+        return None
+
+    def _refresh_tgt(self, url: str, kwargs: Dict[str, Any]) -> str:
+        """Geçersiz TGT'yi sil, yenisini al ve URL/TGT header'ında değiştir; yeni URL'i döndür"""
+        self.auth.clear_tickets()
+        try:
+            tgt_code, _ = self.auth.get_tgt()
+        except Exception:
+            return url
+        return self._apply_tgt(url, kwargs, tgt_code)
+
+    def _apply_tgt(self, url: str, kwargs: Dict[str, Any], tgt_code: str) -> str:
+        headers = kwargs.get('headers')
+        if headers and 'TGT' in headers:
+            headers = dict(headers)
+            headers['TGT'] = tgt_code
+            kwargs['headers'] = headers
+        if '/cas/v1/tickets/' in url or '/v1/tickets/' in url:
+            url = self._replace_tgt(url, tgt_code)
+        return url
+
+    def _finish(self, call: RetryCall, method: str, url: str, kwargs: Dict[str, Any],
+                response: Optional[Response], error: Optional[Exception]) -> Response:
+        """Son denemenin sonucunu döndür veya detaylı exception fırlat (retry raporu eklenerek)"""
+        if error is None:
+            try:
+                self._raise_for_status(response)
+            except HTTPError as e:
+                error = e
+            else:
+                self._attach_report(response, call.report)
+                return response
+
+        if call.report.gave_up == 'deadline':
+            exception = DeadlineExceeded(call.deadline, f"{call.report.attempts[-1].outcome} sonrası retry",
+                                         response=response)
+        else:
+            exception = self._request_error(error, method, url, kwargs, response)
+        exception.retry_report = call.report
+        raise exception from error
+
+    @staticmethod
+    def _attach_report(response: Any, report: RetryReport) -> None:
+        try:
+            response.retry_report = report
+        except AttributeError:
+            pass
+
+    @staticmethod
+    def _raise_for_status(response: Any) -> None:
+        """requests ve httpx response'ları için ortak HTTPError"""
+        if response is not None and response.status_code >= 400:
+            reason = getattr(response, 'reason', None) or getattr(response, 'reason_phrase', '')
+            raise HTTPError(f"{response.status_code} Error: {reason} for url: {getattr(response, 'url', '')}",
+                            response=response)
+
+    def _get_rate_limiter(self, url: str) -> Optional[RateLimiter]:
+        """URL'in host'u ve auth kullanıcısı için paylaşılan limiter (rate_limit kapalıysa None)"""
+        if not self.rate_limit:
+            return None
+        return RateLimiter.for_host(urlsplit(url).netloc, getattr(self.auth, 'username', None))
+
+    def _get_circuit_breaker(self, url: str) -> Optional[CircuitBreaker]:
+        """URL'in host'u (CAS istekleri için CAS root) için paylaşılan breaker (kapalıysa None)"""
+        if not self.circuit_breaker:
+            return None
+        return CircuitBreaker.for_url(url)
+
+    def _send_limited(self, session: Session, limiter: Optional[RateLimiter], method: str, url: str,
+                      kwargs: Dict[str, Any], deadline: Optional[Deadline] = None,
+                      reserved: bool = False) -> Response:
+        """Limiter'dan token alıp (gerekirse bekleyerek) tek bir istek gönder (reserved: token zaten alındı)"""
+        if limiter is None:
+            return session.request(method=method, url=url, **kwargs)
+
+        response = None
+        try:
+            wait = 0.0 if reserved else limiter.reserve()
+            if wait > 0:
+                if deadline is not None:
+                    deadline.check('rate limit beklemesi', wait)
+                    kwargs['timeout'] = deadline.cap_timeout(kwargs.get('timeout'))
+                time.sleep(wait)
+            response = session.request(method=method, url=url, **kwargs)
+            return response
+        finally:
+            limiter.update(response.headers if response is not None else None)
+
+    @staticmethod
+    def _latency_tracker(url: str) -> LatencyTracker:
+        parts = urlsplit(url)
+        return LatencyTracker.for_key((parts.netloc, parts.path))
+
+    def _hedge_for(self, url: str, hedge: Optional[HedgePolicy]) -> Optional[HedgePolicy]:
+        """İsteğin hedging kuralları; şeffaflık dışı host'lar hiçbir zaman hedge edilmez"""
+        hedge = hedge or self.hedge
+        if hedge is None or not is_hedgeable_url(url):
+            return None
+        return hedge
+
+    @staticmethod
+    def _get_hedge_executor() -> ThreadPoolExecutor:
+        if HTTPClient._hedge_executor is None:
+            with HTTPClient._shared_lock:
+                if HTTPClient._hedge_executor is None:
+                    HTTPClient._hedge_executor = ThreadPoolExecutor(32, thread_name_prefix='epint-hedge')
+        return HTTPClient._hedge_executor
+
+    def _send_hedged(self, session: Session, limiter: Optional[RateLimiter], method: str, url: str,
+                     kwargs: Dict[str, Any], deadline: Optional[Deadline], hedge: HedgePolicy,
+                     call: RetryCall) -> Response:
         """
-        session = self._get_session()
+        İsteği gönder; hedge gecikmesi içinde cevap gelmezse ikinci kopyayı gönder ve önce geleni döndür
 
+        İkinci kopya sadece limiter'dan beklemeden token alınabiliyorsa gönderilir.
+        Kaybeden istek henüz başlamadıysa iptal edilir, başladıysa cevabı kapatılır.
+        """
+        tracker = self._latency_tracker(url)
+        executor = self._get_hedge_executor()
+
+        def timed_send(reserved: bool) -> Response:
+            started = time.monotonic()
+            response = self._send_limited(session, limiter, method, url, dict(kwargs), deadline, reserved)
+            tracker.record(time.monotonic() - started)
+            return response
+
+        futures: List[Future] = [executor.submit(timed_send, False)]
+        done, _ = wait_futures(futures, timeout=hedge.delay(tracker))
+        if not done and (limiter is None or limiter.try_reserve()):
+            call.report.hedges += 1
+            futures.append(executor.submit(timed_send, True))
+
+        winner: Optional[Future] = None
+        pending = set(futures)
+        while pending and winner is None:
+            done, pending = wait_futures(pending, return_when=FIRST_COMPLETED)
+            # İlk cevap veren kazanır; exception fırlatan kopya için diğeri beklenir
+            winner = next((future for future in done if future.exception() is None), None)
+
+        for future in pending:
+            if not future.cancel():
+                future.add_done_callback(self._discard_response)
+        if winner is None:
+            raise futures[0].exception()
+        return winner.result()
+
+    @staticmethod
+    def _close_response(response: Any) -> None:
+        close = getattr(response, 'close', None)
+        if close is not None:
+            close()
+
+    @staticmethod
+    def _discard_response(future: Future) -> None:
+        """Kaybeden hedge isteğinin bağlantısını havuza geri ver"""
+        if not future.cancelled() and future.exception() is None:
+            HTTPClient._close_response(future.result())
+
+    def _prepare_request_kwargs(self, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        """Client varsayılanlarını (timeout, verify, redirect) uygula ve JSON body'yi encode et"""
         # Timeout ayarla
         if self.timeout is not None and 'timeout' not in kwargs:
             kwargs['timeout'] = self.timeout
@@ -227,152 +563,99 @@ class HTTPClient:
         if 'allow_redirects' not in kwargs:
             kwargs['allow_redirects'] = self.allow_redirects
 
-        response: Optional[Response] = None
-        max_retries = 3
-        retry_count = 0
-        tgt_retry_count = 0
-        max_tgt_retries = 3
-
-        while retry_count <= max_retries:
+        # JSON body'yi requests'e bırakmadan doğrudan bytes'a encode et (bkz. JsonCodec)
+        if kwargs.get('json') is not None and kwargs.get('data') is None:
+            kwargs['data'] = JsonCodec.dumps(kwargs.pop('json'))
+            headers = dict(kwargs.get('headers') or {})
+            if not any(key.lower() == 'content-type' for key in headers):
+                headers['Content-Type'] = 'application/json'
+            kwargs['headers'] = headers
+        return kwargs
+
+    def _rate_limit_wait(self, response: Response) -> float:
+        """429 sonrası bekleme süresi (RateLimit header'ları, yoksa RateLimit-Reset, o da yoksa 60 sn)"""
+        wait_time = self._check_rate_limit(response)
+        if wait_time is not None:
+            return wait_time
+        # 429 durumunda reset süresini header'dan al
+        reset = response.headers.get('RateLimit-Reset')
+        if reset is not None:
             try:
-                response = session.request(method=method.upper(), url=url, **kwargs)
-
-                # 404 hatası ve TGT geçersizliği kontrolü
-                if response.status_code == 404 and self._is_tgt_invalid(response):
-                    if self.auth and tgt_retry_count < max_tgt_retries:
-                        # TGT geçersiz, ticket'ları temizle
-                        self.auth.clear_tickets()
-
-                        # URL'de TGT kodu varsa yeni TGT ile güncelle
-                        if '/cas/v1/tickets/' in url or '/v1/tickets/' in url:
-                            try:
-                                # Yeni TGT al
-                                new_tgt_code, _ = self.auth.get_tgt()
-                                # URL'deki eski TGT kodunu yeni ile değiştir
-                                import re
-                                # TGT- ile başlayan kodu bul ve değiştir
-                                url = re.sub(r'TGT-[^/]+', new_tgt_code, url)
-                            except Exception:
-                                pass
-
-                        tgt_retry_count += 1
-                        retry_count += 1
-                        continue
-                    else:
-                        # Max TGT retry aşıldı, exception fırlat
-                        response.raise_for_status()
-
-                # 429 hatası kontrolü
-                if response.status_code == 429:
-                    wait_time = self._check_rate_limit(response)
-                    if wait_time is None:
-                        # 429 durumunda reset süresini header'dan al
-                        reset = response.headers.get('RateLimit-Reset')
-                        if reset is not None:
-                            try:
-                                wait_time = float(reset)
-                            except (ValueError, TypeError):
-                                wait_time = 60.0
-                        else:
-                            wait_time = 60.0
-
-                    if retry_count < max_retries:
-                        time.sleep(wait_time)
-                        retry_count += 1
-                        continue
-                    else:
-                        # Max retry aşıldı, exception fırlat
-                        response.raise_for_status()
-
-                response.raise_for_status()
-                return response
+                return float(reset)
+            except (ValueError, TypeError):
+                pass
+        return 60.0
+
+    @staticmethod
+    def _replace_tgt(url: str, tgt_code: str) -> str:
+        """URL'deki eski TGT kodunu yenisiyle değiştir"""
+        import re
+        # TGT- ile başlayan kodu bul ve değiştir
+        return re.sub(r'TGT-[^/]+', tgt_code, url)
+
+    def _request_error(self, e: Exception, method: str, url: str, kwargs: Dict[str, Any],
+                       response: Optional[Response]) -> Exception:
+        """Request/response detaylarını içeren, orijinal tipte yeni bir exception oluştur"""
+        # Response varsa detaylı hata mesajı oluştur
+        error_msg = str(e)
+
+        # Request bilgilerini ekle
+        error_msg += f"\nRequest Method: {method.upper()}"
+        error_msg += f"\nRequest URL: {url}"
+        # print(f"Request Method: {method.upper()}")
+        # print(f"Request URL: {url}")
+
+        # Request headers
+        request_headers = kwargs.get('headers', {})
+        if request_headers:
+            error_msg += f"\nRequest Headers: {dict(request_headers)}"
+            # print(f"Request Headers: {dict(request_headers)}")
+
+        # Request body
+        request_data = kwargs.get('data')
+        request_json = kwargs.get('json')
+        if request_json is not None:
+            try:
+                import json
+                body_str = json.dumps(request_json, ensure_ascii=False, indent=2)
+                error_msg += f"\nRequest Body (JSON): {body_str[:2000]}"
+                # print(f"Request Body (JSON): {body_str}")
+            except Exception:
+                body_str = str(request_json)
+                error_msg += f"\nRequest Body (JSON): {body_str[:1000]}"
+                # print(f"Request Body (JSON): {body_str}")
+        elif request_data is not None:
+            if isinstance(request_data, (str, bytes)):
+                body_str = request_data if isinstance(request_data, str) else request_data.decode('utf-8', errors='ignore')
+                error_msg += f"\nRequest Body: {body_str[:2000]}"
+                # print(f"Request Body: {body_str}")
+            else:
+                body_str = str(request_data)
+                error_msg += f"\nRequest Body: {body_str[:1000]}"
+                # print(f"Request Body: {body_str}")
 
-            except (RequestException, RetryError, Timeout) as e:
-                # Response varsa rate limit kontrolü yap
-                if response is not None:
-                    # 429 durumunda retry yap
-                    if response.status_code == 429:
-                        wait_time = self._check_rate_limit(response)
-                        if wait_time is None:
-                            reset = response.headers.get('RateLimit-Reset')
-                            if reset is not None:
-                                try:
-                                    wait_time = float(reset)
-                                except (ValueError, TypeError):
-                                    wait_time = 60.0
-                            else:
-                                wait_time = 60.0
-
-                        if retry_count < max_retries:
-                            time.sleep(wait_time)
-                            retry_count += 1
-                            continue
-
-                # Response varsa detaylı hata mesajı oluştur
-                error_msg = str(e)
-
-                # Request bilgilerini ekle
-                error_msg += f"\nRequest Method: {method.upper()}"
-                error_msg += f"\nRequest URL: {url}"
-                # print(f"Request Method: {method.upper()}")
-                # print(f"Request URL: {url}")
-
-                # Request headers
-                request_headers = kwargs.get('headers', {})
-                if request_headers:
-                    error_msg += f"\nRequest Headers: {dict(request_headers)}"
-                    # print(f"Request Headers: {dict(request_headers)}")
-
-                # Request body
-                request_data = kwargs.get('data')
-                request_json = kwargs.get('json')
-                if request_json is not None:
-                    try:
-                        import json
-                        body_str = json.dumps(request_json, ensure_ascii=False, indent=2)
-                        error_msg += f"\nRequest Body (JSON): {body_str[:2000]}"
-                        # print(f"Request Body (JSON): {body_str}")
-                    except Exception:
-                        body_str = str(request_json)
-                        error_msg += f"\nRequest Body (JSON): {body_str[:1000]}"
-                        # print(f"Request Body (JSON): {body_str}")
-                elif request_data is not None:
-                    if isinstance(request_data, (str, bytes)):
-                        body_str = request_data if isinstance(request_data, str) else request_data.decode('utf-8', errors='ignore')
-                        error_msg += f"\nRequest Body: {body_str[:2000]}"
-                        # print(f"Request Body: {body_str}")
-                    else:
-                        body_str = str(request_data)
-                        error_msg += f"\nRequest Body: {body_str[:1000]}"
-                        # print(f"Request Body: {body_str}")
-
-                if response is not None:
-                    try:
-                        response_text = response.text[:1000]  # İlk 1000 karakter
-                        error_msg += f"\nResponse Status: {response.status_code}"
-                        error_msg += f"\nResponse Headers: {dict(response.headers)}"
-                        # print(f"Response Status: {response.status_code}")
-                        # print(f"Response Headers: {dict(response.headers)}")
-                        if response_text:
-                            error_msg += f"\nResponse Body: {response_text}"
-                            # print(f"Response Body: {response_text}")
-                    except Exception:
-                        # Response okunamazsa sadece status code'u ekle
-                        error_msg += f"\nResponse Status: {response.status_code}"
-                        # print(f"Response Status: {response.status_code}")
-
-                # Yeni exception oluştur (orijinal exception'ı preserve et)
-                new_exception = type(e)(error_msg)
-                new_exception.__cause__ = e
-                # Response'u exception'a ekle
-                if response is not None:
-                    new_exception.response = response
-                raise new_exception from e
-
-        # Buraya gelmemeli ama güvenlik için
         if response is not None:
-            response.raise_for_status()
-        raise RequestException("Max retry limit reached for rate limit")
+            try:
+                response_text = response.text[:1000]  # İlk 1000 karakter
+                error_msg += f"\nResponse Status: {response.status_code}"
+                error_msg += f"\nResponse Headers: {dict(response.headers)}"
+                # print(f"Response Status: {response.status_code}")
+                # print(f"Response Headers: {dict(response.headers)}")
+                if response_text:
+                    error_msg += f"\nResponse Body: {response_text}"
+                    # print(f"Response Body: {response_text}")
+            except Exception:
+                # Response okunamazsa sadece status code'u ekle
+                error_msg += f"\nResponse Status: {response.status_code}"
+                # print(f"Response Status: {response.status_code}")
+
+        # Yeni exception oluştur (orijinal exception'ı preserve et)
+        new_exception = type(e)(error_msg)
+        new_exception.__cause__ = e
+        # Response'u exception'a ekle
+        if response is not None:
+            new_exception.response = response
+        return new_exception
 
     def get(self, url: str, **kwargs: Any) -> Response:
         """GET request"""
@@ -416,7 +699,7 @@ class HTTPClient:
         return url
 
     def close(self) -> None:
-        """Session'ı kapat"""
+        """Session'ı kapat (paylaşılan session'lar açık kalır)"""
         if self._session:
             self._session.close()
             self._session = None
@@ -0,0 +1,318 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+asyncio ile çalışan HTTP client.
+
+httpx kuruluysa istekler httpx.AsyncClient'ın bağlantı havuzu üzerinden
+gönderilir. Kurulu değilse her deneme, paylaşılan requests session'ları
+ile ayrı bir thread havuzunda çalıştırılır. Her iki durumda da retry
+döngüsü (RetryPolicy) ve bekleme (asyncio.sleep) event loop üzerinde
+çalışır; bekleyen bir çağrı iptal edildiğinde (task.cancel) retry'lar da
+durur.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Dict, Any, Optional, Tuple
+
+from requests.exceptions import ConnectionError as RequestsConnectionError
+from requests.exceptions import RequestException, Timeout
+
+from . import HTTPClient
+from .circuit_breaker import CircuitOpenError
+from .deadline import Deadline, DeadlineExceeded
+from .hedging import HedgePolicy
+from .rate_limiter import RateLimiter
+from .retry_policy import RATE_LIMITED, TICKET_INVALID, RetryCall
+from ..version import __fullname__
+
+
+def _has_httpx() -> bool:
+    try:
+        import httpx  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class AsyncHTTPClient(HTTPClient):
+    """
+    HTTPClient'ın asyncio karşılığı
+
+    get/post/... metodları coroutine döndürür. Ayarlar, TGT geçersizliği,
+    429 davranışı ve paylaşılan RateLimiter HTTPClient ile aynıdır; bekleme
+    event loop'u bloklamaz.
+    """
+
+    # Thread transport'u için process genelinde paylaşılan executor'lar (max_connections -> executor)
+    _executors: Dict[int, ThreadPoolExecutor] = {}
+    # event loop -> {ayarlar: httpx.AsyncClient}; loop kapanınca client'lar da bırakılır
+    _httpx_clients: 'weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Tuple[Any, ...], Any]]' = \
+        weakref.WeakKeyDictionary()
+
+    def __init__(self, *args: Any, max_connections: int = 100, use_httpx: Optional[bool] = None, **kwargs: Any):
+        """
+        Args:
+            max_connections: Aynı anda açık tutulacak en fazla bağlantı/istek sayısı
+            use_httpx: httpx kullanılsın mı (None ise kuruluysa kullanılır)
+            *args, **kwargs: HTTPClient parametreleri
+        """
+        kwargs.setdefault('pool_maxsize', max_connections)
+        super().__init__(*args, **kwargs)
+        self.max_connections = max_connections
+        self.use_httpx = _has_httpx() if use_httpx is None else use_httpx
+
+    @property
+    def transport(self) -> str:
+        """Kullanılan transport: 'httpx' veya 'thread'"""
+        return 'httpx' if self.use_httpx else 'thread'
+
+    async def __aenter__(self) -> AsyncHTTPClient:
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    async def _make_request(self, method: str, url: str, **kwargs: Any) -> Any:
+        """
+        HTTP request yap (HTTPClient._make_request ile aynı RetryPolicy kuralları)
+
+        Raises:
+            RequestException: Request başarısız olduğunda
+            asyncio.CancelledError: Çağrı iptal edildiğinde
+        """
+        cache = kwargs.pop('cache', self.cache)
+        if cache is not None and not kwargs.get('stream'):
+            store = cache.get_store()
+            key = store.key(method, url, kwargs, getattr(self.auth, 'username', None))
+            entry = store.lookup(key, kwargs)
+            if entry is not None:
+                return entry.to_response(url)
+            return store.store(key, await self._make_request(method, url, cache=None, **kwargs), cache.ttl)
+
+        limiter = self._get_rate_limiter(url)
+        breaker = self._get_circuit_breaker(url)
+        deadline = kwargs.pop('deadline', None) or Deadline.current()
+        hedge = self._hedge_for(url, kwargs.pop('hedge', None))
+        kwargs = self._prepare_request_kwargs(kwargs)
+        timeout = kwargs.get('timeout')
+        call = self.retry_policy.start(method, deadline=deadline)
+
+        while True:
+            response = None
+            error: Optional[RequestException] = None
+            call.begin_attempt()
+            try:
+                self._apply_deadline(deadline, kwargs, timeout)
+                if breaker is not None:
+                    breaker.allow()
+                if hedge is not None:
+                    response = await self._send_hedged_async(limiter, method.upper(), url, kwargs, deadline, hedge, call)
+                else:
+                    response = await self._send_limited_async(limiter, method.upper(), url, kwargs, deadline)
+            except (DeadlineExceeded, CircuitOpenError) as e:
+                e.retry_report = call.report
+                raise
+            except RequestException as e:
+                error = e
+
+            outcome = self._classify(response, error)
+            if breaker is not None:
+                breaker.record(outcome)
+            delay = call.next_delay(outcome, getattr(response, 'status_code', None),
+                                    self._server_wait(outcome, response))
+            if delay is None:
+                return self._finish(call, method, url, kwargs, response, error)
+            if kwargs.get('stream'):
+                # Tekrar denenecek akışlı cevabın bağlantısını havuza geri ver
+                await self._aclose_response(response)
+
+            if outcome == TICKET_INVALID:
+                url = await self._arefresh_tgt(url, kwargs)
+            elif outcome == RATE_LIMITED and limiter is not None:
+                limiter.block(delay)
+            elif delay > 0:
+                await asyncio.sleep(delay)
+
+    async def _arefresh_tgt(self, url: str, kwargs: Dict[str, Any]) -> str:
+        """HTTPClient._refresh_tgt'nin asyncio karşılığı"""
+        self.auth.clear_tickets()
+        try:
+            tgt_code, _ = await self.auth.aget_tgt()
+        except Exception:
+            return url
+        return self._apply_tgt(url, kwargs, tgt_code)
+
+    async def _send_limited_async(self, limiter: Optional[RateLimiter], method: str, url: str,
+                                  kwargs: Dict[str, Any], deadline: Optional[Deadline] = None,
+                                  reserved: bool = False) -> Any:
+        """HTTPClient._send_limited'in asyncio karşılığı (bekleme event loop'u bloklamaz)"""
+        if limiter is None:
+            return await self._send(method, url, kwargs)
+
+        response = None
+        try:
+            wait = 0.0 if reserved else limiter.reserve()
+            if wait > 0:
+                if deadline is not None:
+                    deadline.check('rate limit beklemesi', wait)
+                    kwargs['timeout'] = deadline.cap_timeout(kwargs.get('timeout'))
+                await asyncio.sleep(wait)
+            response = await self._send(method, url, kwargs)
+            return response
+        finally:
+            limiter.update(getattr(response, 'headers', None))
+
+    async def _send_hedged_async(self, limiter: Optional[RateLimiter], method: str, url: str,
+                                 kwargs: Dict[str, Any], deadline: Optional[Deadline], hedge: HedgePolicy,
+                                 call: RetryCall) -> Any:
+        """HTTPClient._send_hedged'in asyncio karşılığı (kaybeden task iptal edilir)"""
+        tracker = self._latency_tracker(url)
+
+        async def timed_send(reserved: bool) -> Any:
+            started = time.monotonic()
+            response = await self._send_limited_async(limiter, method, url, dict(kwargs), deadline, reserved)
+            tracker.record(time.monotonic() - started)
+            return response
+
+        tasks = [asyncio.ensure_future(timed_send(False))]
+        pending = set(tasks)
+        winner = None
+        try:
+            done, _ = await asyncio.wait(pending, timeout=hedge.delay(tracker))
+            if not done and (limiter is None or limiter.try_reserve()):
+                call.report.hedges += 1
+                tasks.append(asyncio.ensure_future(timed_send(True)))
+                pending.add(tasks[-1])
+
+            while pending and winner is None:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                winner = next((task for task in done if task.exception() is None), None)
+        finally:
+            for task in pending:
+                task.cancel()
+
+        if winner is None:
+            raise tasks[0].exception()
+        return winner.result()
+
+    async def _send(self, method: str, url: str, kwargs: Dict[str, Any]) -> Any:
+        """Tek bir HTTP denemesi"""
+        if self.use_httpx:
+            return await self._send_httpx(method, url, kwargs)
+
+        session = self._get_session(url)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._get_executor(), partial(session.request, method=method, url=url, **kwargs)
+        )
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        executor = AsyncHTTPClient._executors.get(self.max_connections)
+        if executor is None:
+            with HTTPClient._shared_lock:
+                executor = AsyncHTTPClient._executors.get(self.max_connections)
+                if executor is None:
+                    executor = ThreadPoolExecutor(self.max_connections, thread_name_prefix='epint-async')
+                    AsyncHTTPClient._executors[self.max_connections] = executor
+        return executor
+
+    def _httpx_key(self) -> Tuple[Any, ...]:
+        return (self.max_connections, str(self.timeout), self.verify, tuple(sorted(self.headers.items())))
+
+    @staticmethod
+    def _httpx_timeout(timeout: Any) -> Any:
+        """requests timeout'unu httpx.Timeout'a çevir (None: süre sınırı yok, httpx'in 5 sn varsayılanı değil)"""
+        import httpx
+
+        if isinstance(timeout, tuple):
+            return httpx.Timeout(timeout[1], connect=timeout[0])
+        return httpx.Timeout(timeout)
+
+    def _get_httpx_client(self) -> Any:
+        """Çalışan event loop'a ait paylaşılan httpx.AsyncClient"""
+        import httpx
+
+        loop = asyncio.get_running_loop()
+        clients = AsyncHTTPClient._httpx_clients.setdefault(loop, {})
+        key = self._httpx_key()
+        client = clients.get(key)
+        if client is None:
+            headers = dict(self.headers)
+            headers.update({"User-Agent": __fullname__, "Accept-Language": "tr-TR"})
+            client = httpx.AsyncClient(
+                verify=self.verify,
+                headers=headers,
+                timeout=self._httpx_timeout(self.timeout),
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections,
+                ),
+            )
+            clients[key] = client
+        return client
+
+    async def _send_httpx(self, method: str, url: str, kwargs: Dict[str, Any]) -> Any:
+        import httpx
+
+        request_kwargs: Dict[str, Any] = {
+            'params': kwargs.get('params'),
+            'headers': kwargs.get('headers'),
+        }
+        data = kwargs.get('data')
+        if isinstance(data, (bytes, str)):
+            request_kwargs['content'] = data
+        elif data is not None:
+            request_kwargs['data'] = data
+
+        # None da açıkça verilir; senkron yol gibi timeout yoksa süre sınırı yoktur
+        request_kwargs['timeout'] = self._httpx_timeout(kwargs.get('timeout'))
+
+        client = self._get_httpx_client()
+        follow_redirects = kwargs.get('allow_redirects', True)
+        try:
+            if kwargs.get('stream'):
+                # Body okunmadan döner; aiter_bytes ile parça parça okunur (bkz. adownload_response)
+                request = client.build_request(method, url, **request_kwargs)
+                return await client.send(request, stream=True, follow_redirects=follow_redirects)
+            return await client.request(method, url, follow_redirects=follow_redirects, **request_kwargs)
+        except httpx.TimeoutException as e:
+            raise Timeout(str(e)) from e
+        except httpx.HTTPError as e:
+            raise RequestsConnectionError(str(e)) from e
+
+    @staticmethod
+    async def _aclose_response(response: Any) -> None:
+        """Akışlı cevabı kapat (httpx cevapları aclose ile)"""
+        aclose = getattr(response, 'aclose', None)
+        if aclose is not None:
+            await aclose()
+        else:
+            HTTPClient._close_response(response)
+
+    @classmethod
+    async def aclose_shared(cls) -> None:
+        """Çalışan event loop'a ait paylaşılan httpx client'larını kapat"""
+        clients = cls._httpx_clients.pop(asyncio.get_running_loop(), {})
+        for client in clients.values():
+            await client.aclose()
+
+
+__all__ = ['AsyncHTTPClient']
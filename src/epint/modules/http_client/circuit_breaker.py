@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Host (ve CAS root) bazında circuit breaker.
+
+Breaker anahtarı 'https://host' biçimindedir; CAS istekleri için bu
+Authentication.root ile aynıdır. Ardışık hata sayısı veya pencere içindeki
+hata oranı eşiği aşınca devre açılır ve o host'a giden istekler HTTP
+denemesi yapılmadan CircuitOpenError ile sonuçlanır. Bekleme süresi
+dolunca sınırlı sayıda deneme (half-open probe) gönderilir; başarılı olursa
+devre kapanır, başarısız olursa yeniden açılır. Durum, iş planlayıcıların
+toplu işleri erteleyebilmesi için sorgulanabilir (bkz. states, is_available).
+"""
+
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Dict, Any, Callable, Deque, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from requests.exceptions import RequestException
+
+from .retry_policy import CONNECT_ERROR, SERVER_ERROR, TIMEOUT
+
+
+# Host'un sağlıksız olduğunu gösteren deneme sonuçları (4xx/429 host sağlıklı sayılır)
+FAILURE_OUTCOMES = frozenset({SERVER_ERROR, CONNECT_ERROR, TIMEOUT})
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half_open'
+
+
+class CircuitOpenError(RequestException):
+    """Devre açık: host'a istek gönderilmeden başarısız olundu"""
+
+    def __init__(self, breaker: 'CircuitBreaker', retry_after: float):
+        self.breaker = breaker
+        self.retry_after = retry_after
+        super().__init__(
+            f"{breaker.key} için devre açık: son hatalar nedeniyle istekler gönderilmiyor "
+            f"({retry_after:.1f} sn sonra tekrar denenecek)"
+        )
+
+
+@dataclass(frozen=True)
+class BreakerPolicy:
+    """
+    Circuit breaker eşikleri
+
+    Attributes:
+        failure_threshold: Devreyi açan ardışık hata sayısı
+        error_rate: Devreyi açan hata oranı (pencere içinde)
+        min_requests: Hata oranının değerlendirilmesi için pencere içindeki en az deneme
+        window: Hata oranı penceresi (saniye)
+        open_seconds: Açık devrenin half-open'a geçmeden önce beklediği süre
+        half_open_probes: Half-open durumda aynı anda izin verilen deneme sayısı
+    """
+
+    failure_threshold: int = 5
+    error_rate: float = 0.5
+    min_requests: int = 20
+    window: float = 60.0
+    open_seconds: float = 30.0
+    half_open_probes: int = 1
+
+
+def breaker_key(url: str) -> str:
+    """URL'in breaker anahtarı ('https://host')"""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+class CircuitBreaker:
+    """Tek bir host için circuit breaker (bkz. for_url)"""
+
+    _breakers: Dict[str, 'CircuitBreaker'] = {}
+    _registry_lock = threading.Lock()
+    # Yeni oluşturulan breaker'ların eşikleri (bkz. configure)
+    _policy = BreakerPolicy()
+
+    def __init__(self, key: str, policy: Optional[BreakerPolicy] = None, clock: Callable[[], float] = time.monotonic):
+        self.key = key
+        self.policy = policy or CircuitBreaker._policy
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self._state = CLOSED
+        self._changed_at = clock()
+        self._consecutive_failures = 0
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+        self._probes = 0
+
+        # Metrikler
+        self.rejected = 0
+        self.opened = 0
+
+    @classmethod
+    def for_url(cls, url: str) -> 'CircuitBreaker':
+        """URL'in host'u için paylaşılan breaker'ı al veya oluştur"""
+        key = breaker_key(url)
+        breaker = cls._breakers.get(key)
+        if breaker is None:
+            with cls._registry_lock:
+                breaker = cls._breakers.get(key)
+                if breaker is None:
+                    breaker = cls._breakers[key] = cls(key)
+        return breaker
+
+    @classmethod
+    def configure(cls, policy: BreakerPolicy) -> None:
+        """Eşikleri değiştir (mevcut breaker'lar sıfırlanır)"""
+        with cls._registry_lock:
+            cls._policy = policy
+            cls._breakers.clear()
+
+    @classmethod
+    def reset_all(cls) -> None:
+        with cls._registry_lock:
+            cls._breakers.clear()
+
+    @classmethod
+    def states(cls) -> List[Dict[str, Any]]:
+        """Tüm breaker'ların anlık durumu"""
+        with cls._registry_lock:
+            breakers = list(cls._breakers.values())
+        return [breaker.state() for breaker in breakers]
+
+    @classmethod
+    def is_available(cls, url: str) -> bool:
+        """URL'in host'una şu anda istek gönderilebilir mi (devre açık değilse True)"""
+        breaker = cls._breakers.get(breaker_key(url))
+        return breaker is None or breaker.state()['state'] != OPEN
+
+    def _transition(self, state: str, now: float) -> None:
+        self._state = state
+        self._changed_at = now
+        self._probes = 0
+        if state == OPEN:
+            self.opened += 1
+        elif state == CLOSED:
+            self._consecutive_failures = 0
+            self._outcomes.clear()
+
+    def _current_state(self, now: float) -> str:
+        if self._state == OPEN and now - self._changed_at >= self.policy.open_seconds:
+            self._transition(HALF_OPEN, now)
+        elif self._state == HALF_OPEN and now - self._changed_at >= self.policy.open_seconds:
+            # Sonucu bildirilmeyen (iptal edilen) probe'lar devreyi kilitlemesin
+            self._transition(HALF_OPEN, now)
+        return self._state
+
+    def allow(self) -> None:
+        """
+        Deneme öncesi kontrol
+
+        Raises:
+            CircuitOpenError: Devre açıksa veya half-open probe kotası doluysa
+        """
+        with self._lock:
+            now = self._clock()
+            state = self._current_state(now)
+            if state == CLOSED:
+                return
+            if state == HALF_OPEN and self._probes < self.policy.half_open_probes:
+                self._probes += 1
+                return
+            self.rejected += 1
+            retry_after = max(0.0, self._changed_at + self.policy.open_seconds - now)
+            raise CircuitOpenError(self, retry_after)
+
+    def record(self, outcome: str) -> None:
+        """Denemenin sonucunu bildir (bkz. retry_policy sonuçları)"""
+        with self._lock:
+            now = self._clock()
+            failed = outcome in FAILURE_OUTCOMES
+            state = self._current_state(now)
+
+            if state == HALF_OPEN:
+                self._transition(OPEN if failed else CLOSED, now)
+                return
+            if state == OPEN:
+                return
+
+            self._consecutive_failures = self._consecutive_failures + 1 if failed else 0
+            self._outcomes.append((now, failed))
+            while self._outcomes and now - self._outcomes[0][0] > self.policy.window:
+                self._outcomes.popleft()
+
+            failures = sum(1 for _, is_failure in self._outcomes if is_failure)
+            if (self._consecutive_failures >= self.policy.failure_threshold
+                    or (len(self._outcomes) >= self.policy.min_requests
+                        and failures / len(self._outcomes) >= self.policy.error_rate)):
+                self._transition(OPEN, now)
+
+    def state(self) -> Dict[str, Any]:
+        """Breaker'ın anlık durumu"""
+        with self._lock:
+            now = self._clock()
+            state = self._current_state(now)
+            failures = sum(1 for _, is_failure in self._outcomes if is_failure)
+            return {
+                'key': self.key,
+                'state': state,
+                'since': now - self._changed_at,
+                'retry_after': max(0.0, self._changed_at + self.policy.open_seconds - now) if state == OPEN else 0.0,
+                'consecutive_failures': self._consecutive_failures,
+                'window_requests': len(self._outcomes),
+                'window_failures': failures,
+                'rejected': self.rejected,
+                'opened': self.opened,
+            }
+
+    def __repr__(self) -> str:
+        return f"<CircuitBreaker: {self.key} ({self._state})>"
+
+
+__all__ = [
+    'CircuitBreaker', 'CircuitOpenError', 'BreakerPolicy', 'breaker_key',
+    'CLOSED', 'OPEN', 'HALF_OPEN', 'FAILURE_OUTCOMES',
+]
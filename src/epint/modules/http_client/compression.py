@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Sıkıştırılmış transfer müzakeresi.
+
+Session'lar Accept-Encoding'de gzip/deflate'i, urllib3 destekliyorsa (brotli
+/ zstandard kurulu ise) br ve zstd'yi de açıkça ister; requests'in
+varsayılanı sadece gzip/deflate'tir. Body'nin açılması ve okunması
+requests/urllib3'e bırakılır (response.content). HTTPClient(compress=False)
+Accept-Encoding: identity gönderir.
+"""
+
+
+# Sıkıştırma kapalıyken gönderilen Accept-Encoding
+IDENTITY = 'identity'
+
+
+def accept_encoding() -> str:
+    """urllib3'ün açabildiği content-encoding'ler (gzip, deflate ve kuruluysa br, zstd)"""
+    from urllib3 import response as urllib3_response
+
+    encodings = ['gzip', 'deflate']
+    if getattr(urllib3_response, 'brotli', None) is not None:
+        encodings.append('br')
+    if getattr(urllib3_response, 'HAS_ZSTD', False):
+        encodings.append('zstd')
+    return ', '.join(encodings)
+
+
+__all__ = ['accept_encoding', 'IDENTITY']
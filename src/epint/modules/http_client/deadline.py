@@ -0,0 +1,130 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Çağrı başına toplam süre sınırı (deadline).
+
+Endpoint çağrısında verilen deadline= / timeout_total= bir Deadline'a
+dönüştürülür ve çağrı boyunca context'e yerleştirilir (contextvars; thread
+havuzuna ve asyncio task'larına da taşınır). Ticket alma dahil tüm HTTP
+denemeleri timeout'larını kalan süre ile sınırlar; retry ve rate limit
+beklemeleri kalan süreyi aşacaksa beklenmeden DeadlineExceeded fırlatılır.
+"""
+
+import contextvars
+import datetime
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional, Tuple, Union
+
+from requests.exceptions import Timeout
+
+
+_current: 'contextvars.ContextVar[Optional[Deadline]]' = contextvars.ContextVar('epint_deadline', default=None)
+
+
+class DeadlineExceeded(Timeout):
+    """Çağrının toplam süre sınırı doldu"""
+
+    def __init__(self, deadline: 'Deadline', stage: str, *args: Any, **kwargs: Any):
+        self.deadline = deadline
+        self.stage = stage
+        message = (f"Çağrı süre sınırı aşıldı: {stage} sırasında "
+                   f"{deadline.total:.2f} sn'lik bütçe doldu ({deadline.elapsed():.2f} sn geçti)")
+        super().__init__(message, *args, **kwargs)
+
+
+class Deadline:
+    """Monotonic saat ile ölçülen toplam süre sınırı"""
+
+    def __init__(self, seconds: float):
+        """
+        Args:
+            seconds: Şu andan itibaren kullanılabilecek süre (saniye)
+        """
+        self.total = max(0.0, float(seconds))
+        self._started = time.monotonic()
+        self._expires = self._started + self.total
+
+    @classmethod
+    def from_options(cls, deadline: Optional[Union[datetime.datetime, float]] = None,
+                     timeout_total: Optional[float] = None) -> Optional['Deadline']:
+        """
+        deadline= / timeout_total= seçeneklerinden Deadline oluştur (ikisi de yoksa None)
+
+        Args:
+            deadline: Mutlak bitiş zamanı (datetime veya time.time() cinsinden timestamp)
+            timeout_total: Şu andan itibaren toplam süre (saniye)
+
+        İkisi birlikte verilirse önce dolan geçerlidir.
+        """
+        limits = []
+        if timeout_total is not None:
+            limits.append(float(timeout_total))
+        if deadline is not None:
+            if isinstance(deadline, datetime.datetime):
+                now = datetime.datetime.now(deadline.tzinfo)
+                limits.append((deadline - now).total_seconds())
+            else:
+                limits.append(float(deadline) - time.time())
+        if not limits:
+            return None
+        return cls(min(limits))
+
+    @staticmethod
+    def current() -> Optional['Deadline']:
+        """Çalışan çağrının deadline'ı (yoksa None)"""
+        return _current.get()
+
+    @contextmanager
+    def activate(self) -> Iterator['Deadline']:
+        """Bu deadline'ı context boyunca geçerli yap"""
+        token = _current.set(self)
+        try:
+            yield self
+        finally:
+            _current.reset(token)
+
+    def elapsed(self) -> float:
+        return time.monotonic() - self._started
+
+    def remaining(self) -> float:
+        return max(0.0, self._expires - time.monotonic())
+
+    def check(self, stage: str, needed: float = 0.0) -> None:
+        """
+        Kalan süre needed saniyeden azsa (veya süre dolduysa) DeadlineExceeded fırlat
+
+        Args:
+            stage: Hata mesajında gösterilecek aşama (ör. 'TGT alma', '429 beklemesi')
+            needed: Aşamanın gerektirdiği süre
+        """
+        remaining = self.remaining()
+        if remaining <= 0 or needed > remaining:
+            raise DeadlineExceeded(self, stage)
+
+    def cap_timeout(self, timeout: Optional[Union[float, Tuple[float, float]]]) -> Union[float, Tuple[float, float]]:
+        """Request timeout'unu kalan süre ile sınırla"""
+        remaining = self.remaining()
+        if timeout is None:
+            return remaining
+        if isinstance(timeout, tuple):
+            return tuple(remaining if part is None else min(part, remaining) for part in timeout)
+        return min(timeout, remaining)
+
+    def __repr__(self) -> str:
+        return f"<Deadline: {self.remaining():.2f}/{self.total:.2f} sn>"
+
+
+__all__ = ['Deadline', 'DeadlineExceeded']
@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Export endpoint'leri (XLSX, PDF, ...) için akışlı indirme.
+
+Endpoint çağrısında to= verilirse istek stream modunda gönderilir ve body
+iter_content ile chunk_size'lık parçalar halinde doğrudan dosyaya veya
+verilen writer'a (write metodu olan herhangi bir obje) yazılır; bellekte
+en fazla bir parça tutulur. Dosyaya yazarken önce '<path>.part' dosyasına
+yazılır, indirme tamamlanınca yerine taşınır. Çağrı, indirilen byte sayısı
+ve hızı içeren bir DownloadReport döndürür. acall'da httpx cevapları
+aiter_bytes ile event loop üzerinde okunur, requests cevapları thread'de
+indirilir (bkz. adownload_response).
+"""
+
+import asyncio
+import contextvars
+import os
+import time
+from functools import partial
+from dataclasses import dataclass
+from typing import Any, Iterator, Optional
+
+from .deadline import Deadline
+
+
+# iter_content parça boyutu
+CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class DownloadReport:
+    """Akışlı indirmenin sonucu"""
+
+    bytes: int
+    elapsed: float
+    path: Optional[str] = None
+    content_type: Optional[str] = None
+
+    @property
+    def throughput(self) -> float:
+        """Ortalama hız (byte/sn)"""
+        return self.bytes / self.elapsed if self.elapsed > 0 else float(self.bytes)
+
+    def __str__(self) -> str:
+        target = f" -> {self.path}" if self.path else ""
+        return (f"{self.bytes / 2 ** 20:.2f} MB, {self.elapsed:.2f} sn, "
+                f"{self.throughput / 2 ** 20:.2f} MB/sn{target}")
+
+
+def _iter_chunks(response: Any, chunk_size: int) -> Iterator[bytes]:
+    """requests (stream), httpx veya test response'larının body parçaları"""
+    if hasattr(response, 'iter_content'):
+        return response.iter_content(chunk_size)
+    if hasattr(response, 'iter_bytes'):
+        return response.iter_bytes(chunk_size)
+    return iter([response.content])
+
+
+def download_response(response: Any, to: Any, chunk_size: int = CHUNK_SIZE) -> DownloadReport:
+    """
+    Response body'sini parça parça to'ya yaz
+
+    Args:
+        response: stream=True ile açılmış response
+        to: Dosya yolu (str / os.PathLike) veya write metodu olan obje
+        chunk_size: Parça boyutu (byte)
+
+    Returns:
+        DownloadReport
+
+    Raises:
+        DeadlineExceeded: Çağrının deadline'ı indirme sırasında dolarsa
+        RequestException: Bağlantı indirme sırasında koparsa (yarım dosya silinir)
+    """
+    deadline = Deadline.current()
+    content_type = getattr(response, 'headers', {}).get('Content-Type')
+    started = time.monotonic()
+    written = 0
+
+    path = os.fspath(to) if isinstance(to, (str, os.PathLike)) else None
+    partial = f"{path}.part" if path is not None else None
+    writer = open(partial, 'wb') if partial is not None else to
+    try:
+        for chunk in _iter_chunks(response, chunk_size):
+            if deadline is not None:
+                deadline.check('indirme')
+            if chunk:
+                writer.write(chunk)
+                written += len(chunk)
+    except BaseException:
+        if partial is not None:
+            writer.close()
+            os.remove(partial)
+        raise
+    finally:
+        close = getattr(response, 'close', None)
+        if close is not None:
+            close()
+
+    if partial is not None:
+        writer.close()
+        os.replace(partial, path)
+    return DownloadReport(written, time.monotonic() - started, path, content_type)
+
+
+async def adownload_response(response: Any, to: Any, chunk_size: int = CHUNK_SIZE) -> DownloadReport:
+    """
+    download_response'un asyncio karşılığı
+
+    httpx (stream=True) cevapları aiter_bytes ile okunur, parçalar
+    thread'de yazılır; diğer cevaplar download_response ile thread'de
+    indirilir. Her iki durumda da event loop bloklanmaz.
+    """
+    loop = asyncio.get_running_loop()
+    if not hasattr(response, 'aiter_bytes'):
+        write = partial(contextvars.copy_context().run, download_response, response, to, chunk_size)
+        return await loop.run_in_executor(None, write)
+
+    deadline = Deadline.current()
+    content_type = getattr(response, 'headers', {}).get('Content-Type')
+    started = time.monotonic()
+    written = 0
+
+    path = os.fspath(to) if isinstance(to, (str, os.PathLike)) else None
+    partial_path = f"{path}.part" if path is not None else None
+    writer = open(partial_path, 'wb') if partial_path is not None else to
+    try:
+        async for chunk in response.aiter_bytes(chunk_size):
+            if deadline is not None:
+                deadline.check('indirme')
+            if chunk:
+                await loop.run_in_executor(None, writer.write, chunk)
+                written += len(chunk)
+    except BaseException:
+        if partial_path is not None:
+            writer.close()
+            os.remove(partial_path)
+        raise
+    finally:
+        await response.aclose()
+
+    if partial_path is not None:
+        writer.close()
+        os.replace(partial_path, path)
+    return DownloadReport(written, time.monotonic() - started, path, content_type)
+
+
+__all__ = ['DownloadReport', 'download_response', 'adownload_response', 'CHUNK_SIZE']
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Şeffaflık sorguları için hedged request'ler.
+
+Hedging açık bir kategoride istek, endpoint'in gözlenen gecikme
+dağılımından hesaplanan süre (varsayılan p95) içinde cevap vermezse aynı
+istek bir kez daha gönderilir; önce gelen cevap kullanılır, diğeri iptal
+edilir. İkinci istek, paylaşılan RateLimiter'da beklemeden token
+alınabiliyorsa gönderilir. Sadece salt okunur şeffaflık (seffaflik-*)
+kategorilerinde açılabilir; EPYS/GOP çağrıları hiçbir zaman hedge edilmez.
+HTTP katmanı da aynı kuralı host üzerinden uygular: HTTPClient(hedge=...)
+ile verilen kurallar sadece şeffaflık host'una giden isteklerde kullanılır.
+"""
+
+import math
+import threading
+from collections import deque
+from urllib.parse import urlsplit
+from dataclasses import dataclass
+from typing import Dict, Deque, Iterable, List, Optional, Tuple
+
+
+# Hedging'e izin verilen kategori ön eki (salt okunur sorgular)
+HEDGEABLE_PREFIX = 'seffaflik'
+
+
+def is_hedgeable_url(url: str) -> bool:
+    """İstek hedge edilebilir mi (sadece salt okunur şeffaflık host'u)"""
+    return (urlsplit(url).hostname or '').startswith(HEDGEABLE_PREFIX)
+
+
+class LatencyTracker:
+    """Endpoint (host, path) bazında son gecikmeler"""
+
+    _trackers: Dict[Tuple[str, str], 'LatencyTracker'] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, key: Tuple[str, str], size: int = 200):
+        self.key = key
+        self._samples: Deque[float] = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_key(cls, key: Tuple[str, str]) -> 'LatencyTracker':
+        tracker = cls._trackers.get(key)
+        if tracker is None:
+            with cls._registry_lock:
+                tracker = cls._trackers.get(key)
+                if tracker is None:
+                    tracker = cls._trackers[key] = cls(key)
+        return tracker
+
+    @classmethod
+    def reset_all(cls) -> None:
+        with cls._registry_lock:
+            cls._trackers.clear()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+    def percentile(self, q: float) -> Optional[float]:
+        """q (0-1) yüzdelik gecikme (nearest-rank); örnek yoksa None"""
+        with self._lock:
+            samples = sorted(self._samples)
+        if not samples:
+            return None
+        index = min(len(samples) - 1, max(0, math.ceil(q * len(samples)) - 1))
+        return samples[index]
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """
+    Hedging kuralları
+
+    Attributes:
+        percentile: İkinci isteğin gönderileceği gecikme yüzdeliği
+        min_samples: Yüzdelik kullanılmadan önce gereken örnek sayısı
+        initial_delay: Yeterli örnek yokken kullanılan gecikme (saniye)
+        min_delay: Gecikmenin alt sınırı (saniye)
+        max_delay: Gecikmenin üst sınırı (saniye)
+    """
+
+    percentile: float = 0.95
+    min_samples: int = 20
+    initial_delay: float = 2.0
+    min_delay: float = 0.05
+    max_delay: float = 10.0
+
+    def delay(self, tracker: LatencyTracker) -> float:
+        """İkinci istek gönderilmeden önce beklenecek süre"""
+        observed = tracker.percentile(self.percentile) if len(tracker) >= self.min_samples else None
+        delay = self.initial_delay if observed is None else observed
+        return min(self.max_delay, max(self.min_delay, delay))
+
+
+class Hedging:
+    """Kategori bazında hedging ayarları (bkz. epint.set_hedging)"""
+
+    _policies: Dict[str, HedgePolicy] = {}
+
+    @classmethod
+    def enable(cls, categories: Iterable[str], policy: Optional[HedgePolicy] = None) -> None:
+        """
+        Kategoriler için hedging'i aç
+
+        Args:
+            categories: Kategori isimleri ('seffaflik' tüm şeffaflık kategorilerini kapsar)
+            policy: Hedging kuralları (None ise varsayılan)
+
+        Raises:
+            ValueError: Şeffaflık dışı (durum değiştirebilen) bir kategori verilirse
+        """
+        categories = list(categories)
+        for category in categories:
+            if not category.startswith(HEDGEABLE_PREFIX):
+                raise ValueError(
+                    f"Hedging sadece salt okunur şeffaflık kategorilerinde açılabilir: {category!r}"
+                )
+        for category in categories:
+            cls._policies[category] = policy or HedgePolicy()
+
+    @classmethod
+    def disable(cls, categories: Optional[Iterable[str]] = None) -> None:
+        """Kategoriler (None ise tümü) için hedging'i kapat"""
+        if categories is None:
+            cls._policies.clear()
+            return
+        for category in categories:
+            cls._policies.pop(category, None)
+
+    @classmethod
+    def policy_for(cls, category: str) -> Optional[HedgePolicy]:
+        """Kategori için hedging kuralları (kapalıysa None)"""
+        if not cls._policies or not category.startswith(HEDGEABLE_PREFIX):
+            return None
+        policy = cls._policies.get(category)
+        if policy is None:
+            # 'seffaflik' gibi ön ekler alt kategorileri de kapsar
+            for name, candidate in cls._policies.items():
+                if category.startswith(name + '-'):
+                    return candidate
+        return policy
+
+    @classmethod
+    def enabled_categories(cls) -> List[str]:
+        return list(cls._policies)
+
+
+__all__ = ['HedgePolicy', 'Hedging', 'LatencyTracker', 'HEDGEABLE_PREFIX', 'is_hedgeable_url']
@@ -0,0 +1,342 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Nadiren değişen referans listeleri için opt-in HTTP cache.
+
+Cache açık bir istekte 200 cevabının body'si ve validator'ları (ETag,
+Last-Modified) saklanır. Sonraki istekler If-None-Match / If-Modified-Since
+ile gönderilir; 304 gelirse cevap yerel kayıttan oluşturulur. Sunucu
+validator göndermezse endpoint için verilen ttl süresince kayıt taze sayılır
+ve istek hiç gönderilmez (Cache-Control max-age varsa o kullanılır).
+Kayıtlar bellekte ve varsayılan olarak ticket dosyalarının yanındaki
+http-cache dizininde tutulur; böylece ayrı process'lerde çalışan işler de
+aynı kayıtları kullanır.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, Any, Iterable, List, Optional, Union
+
+from requests import Response
+from requests.structures import CaseInsensitiveDict
+
+
+# Body decode edilmiş saklandığı için kayda alınmayan header'lar
+_SKIPPED_HEADERS = frozenset({'content-encoding', 'content-length', 'transfer-encoding', 'connection'})
+
+
+@dataclass
+class CacheEntry:
+    """Saklanan bir cevap"""
+
+    status: int
+    headers: Dict[str, str]
+    content: bytes
+    stored_at: float
+    fresh_for: float = 0.0
+
+    @property
+    def etag(self) -> Optional[str]:
+        return CaseInsensitiveDict(self.headers).get('ETag')
+
+    @property
+    def last_modified(self) -> Optional[str]:
+        return CaseInsensitiveDict(self.headers).get('Last-Modified')
+
+    def is_fresh(self, now: Optional[float] = None) -> bool:
+        """İstek göndermeden kullanılabilir mi"""
+        now = time.time() if now is None else now
+        return now - self.stored_at < self.fresh_for
+
+    def to_response(self, url: str) -> Response:
+        """Kayıttan requests.Response oluştur (response.from_cache = True)"""
+        response = Response()
+        response.status_code = self.status
+        response.reason = 'OK'
+        response.headers = CaseInsensitiveDict(self.headers)
+        response.url = url
+        response._content = self.content
+        response._content_consumed = True
+        response.from_cache = True
+        return response
+
+
+def _freshness(headers: Any, ttl: Optional[float]) -> Optional[float]:
+    """
+    Kaydın taze sayılacağı süre; saklanmaması gerekiyorsa None
+
+    Cache-Control max-age varsa o, yoksa validator yoksa ttl, validator
+    varsa 0 (her istekte koşullu doğrulama).
+    """
+    cache_control = (headers.get('Cache-Control') or '').lower()
+    directives = [part.strip() for part in cache_control.split(',')]
+    if 'no-store' in directives:
+        return None
+    if 'no-cache' not in directives:
+        for directive in directives:
+            if directive.startswith('max-age='):
+                try:
+                    return float(directive.split('=', 1)[1])
+                except ValueError:
+                    break
+    if headers.get('ETag') or headers.get('Last-Modified'):
+        return 0.0
+    return ttl
+
+
+class HTTPCache:
+    """Bellek (LRU) + disk üzerinde cevap deposu"""
+
+    _default: Optional['HTTPCache'] = None
+    _default_lock = threading.Lock()
+
+    def __init__(self, directory: Union[str, os.PathLike, None, bool] = None, max_entries: int = 128):
+        """
+        Args:
+            directory: Kayıtların yazılacağı dizin (None ise geçici dizindeki
+                       epint http-cache dizini, False ise sadece bellek)
+            max_entries: Bellekte tutulacak en fazla kayıt
+        """
+        if directory is None:
+            directory = os.path.join(tempfile.gettempdir(), f"epint-{self._os_user()}", "http-cache")
+        self.directory = os.fspath(directory) if directory is not False else None
+        self.max_entries = max_entries
+        self._entries: 'OrderedDict[str, CacheEntry]' = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Metrikler
+        self.hits = 0
+        self.revalidated = 0
+        self.misses = 0
+
+    @staticmethod
+    def _os_user() -> str:
+        """Paylaşımlı makinelerde dizin OS kullanıcısına göre ayrılır (bkz. Authentication)"""
+        import getpass
+        try:
+            user = getpass.getuser()
+        except Exception:
+            user = str(os.getuid()) if hasattr(os, 'getuid') else 'shared'
+        return hashlib.md5(user.encode('utf-8', errors='ignore')).hexdigest()[:8]
+
+    @classmethod
+    def default(cls) -> 'HTTPCache':
+        """Process genelindeki varsayılan depo"""
+        if cls._default is None:
+            with cls._default_lock:
+                if cls._default is None:
+                    cls._default = cls()
+        return cls._default
+
+    @staticmethod
+    def key(method: str, url: str, kwargs: Dict[str, Any], user: Optional[str] = None) -> str:
+        """Metod, URL, parametreler, body ve kullanıcıdan kayıt anahtarı (ticket header'ları hariç)"""
+        params = kwargs.get('params')
+        body = kwargs.get('json')
+        if body is not None:
+            body = json.dumps(body, sort_keys=True, default=str)
+        else:
+            body = kwargs.get('data')
+            if isinstance(body, (bytes, bytearray)):
+                body = bytes(body).decode('utf-8', errors='replace')
+        material = json.dumps([method.upper(), url, sorted((params or {}).items()) if isinstance(params, dict)
+                               else params, body, user], default=str)
+        return hashlib.sha256(material.encode('utf-8')).hexdigest()
+
+    def _paths(self, key: str):
+        return os.path.join(self.directory, f"{key}.json"), os.path.join(self.directory, f"{key}.body")
+
+    def get(self, key: str) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if self.directory is None:
+            return None
+        meta_path, body_path = self._paths(key)
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            with open(body_path, 'rb') as f:
+                content = f.read()
+        except (OSError, ValueError):
+            return None
+        entry = CacheEntry(meta['status'], meta['headers'], content, meta['stored_at'], meta['fresh_for'])
+        self._remember(key, entry)
+        return entry
+
+    def put(self, key: str, entry: CacheEntry) -> None:
+        self._remember(key, entry)
+        if self.directory is None:
+            return
+        meta_path, body_path = self._paths(key)
+        meta = {'status': entry.status, 'headers': entry.headers,
+                'stored_at': entry.stored_at, 'fresh_for': entry.fresh_for}
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            # Önce body, sonra meta: yarım yazılmış kayıt okunmaz
+            for path, data, mode in ((body_path, entry.content, 'wb'),
+                                     (meta_path, json.dumps(meta), 'w')):
+                partial = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+                with open(partial, mode) as f:
+                    f.write(data)
+                os.replace(partial, path)
+        except OSError:
+            pass
+
+    def _remember(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Bellekteki ve diskteki tüm kayıtları sil"""
+        with self._lock:
+            self._entries.clear()
+        if self.directory is None or not os.path.isdir(self.directory):
+            return
+        for name in os.listdir(self.directory):
+            if name.endswith(('.json', '.body')):
+                try:
+                    os.remove(os.path.join(self.directory, name))
+                except OSError:
+                    pass
+
+    def lookup(self, key: str, kwargs: Dict[str, Any]) -> Optional[CacheEntry]:
+        """
+        Kaydı bul; kayıt bayatsa kwargs header'larına validator'ları ekle
+
+        Returns:
+            Taze kayıt (istek gönderilmemeli), yoksa None
+        """
+        entry = self.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        if entry.is_fresh():
+            self.hits += 1
+            return entry
+
+        headers = dict(kwargs.get('headers') or {})
+        if entry.etag:
+            headers['If-None-Match'] = entry.etag
+        if entry.last_modified:
+            headers['If-Modified-Since'] = entry.last_modified
+        kwargs['headers'] = headers
+        return None
+
+    def store(self, key: str, response: Any, ttl: Optional[float]) -> Any:
+        """
+        Cevabı işle: 304 ise kayıttan cevap oluştur, 200 ise sakla
+
+        Returns:
+            Kullanılacak response
+        """
+        now = time.time()
+        if response.status_code == 304:
+            entry = self.get(key)
+            if entry is None:
+                return response
+            headers = dict(entry.headers)
+            headers.update({name: value for name, value in response.headers.items()
+                            if name.lower() in ('etag', 'last-modified', 'cache-control', 'date')})
+            merged = CacheEntry(entry.status, headers, entry.content, now, 0.0)
+            merged.fresh_for = _freshness(CaseInsensitiveDict(headers), ttl) or 0.0
+            self.put(key, merged)
+            self.revalidated += 1
+            return merged.to_response(getattr(response, 'url', ''))
+
+        if response.status_code != 200 or getattr(response, 'from_cache', False):
+            return response
+        fresh_for = _freshness(response.headers, ttl)
+        if fresh_for is None:
+            return response
+        headers = {name: value for name, value in response.headers.items() if name.lower() not in _SKIPPED_HEADERS}
+        self.put(key, CacheEntry(200, headers, response.content, now, fresh_for))
+        return response
+
+    def state(self) -> Dict[str, Any]:
+        with self._lock:
+            entries = len(self._entries)
+        return {'directory': self.directory, 'entries': entries, 'hits': self.hits,
+                'revalidated': self.revalidated, 'misses': self.misses}
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """
+    Endpoint bazında cache kuralları
+
+    Attributes:
+        ttl: Sunucu validator (ETag/Last-Modified) göndermediğinde kaydın taze
+             sayılacağı süre (saniye; None ise validator'sız cevaplar saklanmaz)
+        store: Kayıtların tutulduğu depo (None ise HTTPCache.default())
+    """
+
+    ttl: Optional[float] = None
+    store: Optional[HTTPCache] = field(default=None, compare=False)
+
+    def get_store(self) -> HTTPCache:
+        return self.store if self.store is not None else HTTPCache.default()
+
+
+class Caching:
+    """Kategori / endpoint bazında cache ayarları (bkz. epint.set_http_cache)"""
+
+    _policies: Dict[str, CachePolicy] = {}
+
+    @classmethod
+    def enable(cls, targets: Iterable[str], policy: Optional[CachePolicy] = None) -> None:
+        """
+        Cache'i aç
+
+        Args:
+            targets: 'kategori' veya 'kategori.endpoint' isimleri
+            policy: Cache kuralları (None ise varsayılan)
+        """
+        for target in targets:
+            cls._policies[target] = policy or CachePolicy()
+
+    @classmethod
+    def disable(cls, targets: Optional[Iterable[str]] = None) -> None:
+        """Hedefler (None ise tümü) için cache'i kapat"""
+        if targets is None:
+            cls._policies.clear()
+            return
+        for target in targets:
+            cls._policies.pop(target, None)
+
+    @classmethod
+    def policy_for(cls, category: str, name: str) -> Optional[CachePolicy]:
+        """Endpoint için cache kuralları (endpoint ayarı kategori ayarından önceliklidir; kapalıysa None)"""
+        if not cls._policies:
+            return None
+        return cls._policies.get(f"{category}.{name}") or cls._policies.get(category)
+
+    @classmethod
+    def enabled_targets(cls) -> List[str]:
+        return list(cls._policies)
+
+
+__all__ = ['HTTPCache', 'CacheEntry', 'CachePolicy', 'Caching']
@@ -0,0 +1,227 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Host ve kullanıcı bazında process genelinde paylaşılan istemci tarafı
+rate limiter.
+
+Token bucket, her response'taki RateLimit-Limit / RateLimit-Remaining /
+RateLimit-Reset header'ları ile beslenir. İstekler gönderilmeden önce
+token ayırır ve gerekirse bekler; aynı host'a giden tüm thread'ler ve
+asyncio task'ları aynı bucket'ı kullandığından limit dolmadan önce
+yavaşlanır. Bekleme süresi reserve() ile hesaplanır, beklemeyi çağıran
+yapar (time.sleep veya asyncio.sleep).
+"""
+
+import math
+import re
+import threading
+import time
+from typing import Dict, Any, Callable, List, Mapping, Optional, Tuple
+
+
+# Remaining 0 olup reset bilgisi gelmediğinde beklenecek süre (eski 429 davranışı ile aynı)
+DEFAULT_BLOCK_SECONDS = 60.0
+
+_NUMBER_PATTERN = re.compile(r"\s*(\d+(?:\.\d+)?)")
+_WINDOW_PATTERN = re.compile(r";\s*w=(\d+(?:\.\d+)?)")
+
+
+def _header_number(headers: Mapping[str, Any], name: str) -> Optional[float]:
+    """Header'ın baştaki sayısal değeri ('100' veya '100, 100;w=60' biçimleri)"""
+    value = headers.get(name)
+    if value is None:
+        return None
+    match = _NUMBER_PATTERN.match(str(value))
+    return float(match.group(1)) if match else None
+
+
+class RateLimiter:
+    """
+    Tek bir (host, kullanıcı) için token bucket
+
+    Header görülene kadar sınırsızdır. Limit ve pencere (RateLimit-Limit'teki
+    w= parametresi, yoksa görülen en büyük RateLimit-Reset) öğrenildikten sonra
+    token'lar limit / pencere hızında dolar. Her response'ta kalan token sayısı
+    sunucunun RateLimit-Remaining değerine (cevabı beklenen istekler düşülerek)
+    eşitlenir; Remaining 0 ise reset süresi dolana kadar yeni istek gönderilmez.
+    """
+
+    _limiters: Dict[Tuple[str, Optional[str]], 'RateLimiter'] = {}
+    _registry_lock = threading.Lock()
+
+    def __init__(self, host: str, user: Optional[str] = None, clock: Callable[[], float] = time.monotonic):
+        self.host = host
+        self.user = user
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        self.limit: Optional[float] = None
+        self.window: Optional[float] = None
+        self._rate = 0.0
+        self._tokens = math.inf
+        self._updated = clock()
+        self._blocked_until = 0.0
+        self._pending = 0
+
+        # Metrikler
+        self.requests = 0
+        self.delayed = 0
+        self.total_wait = 0.0
+        self.rejected = 0
+
+    @classmethod
+    def for_host(cls, host: str, user: Optional[str] = None) -> 'RateLimiter':
+        """(host, kullanıcı) için paylaşılan limiter'ı al veya oluştur"""
+        key = (host, user)
+        limiter = cls._limiters.get(key)
+        if limiter is None:
+            with cls._registry_lock:
+                limiter = cls._limiters.get(key)
+                if limiter is None:
+                    limiter = cls._limiters[key] = cls(host, user)
+        return limiter
+
+    @classmethod
+    def states(cls) -> List[Dict[str, Any]]:
+        """Tüm limiter'ların anlık durumu (metrikler için)"""
+        with cls._registry_lock:
+            limiters = list(cls._limiters.values())
+        return [limiter.state() for limiter in limiters]
+
+    @classmethod
+    def reset_all(cls) -> None:
+        """Öğrenilmiş tüm limitleri unut"""
+        with cls._registry_lock:
+            cls._limiters.clear()
+
+    def _refill(self, now: float) -> None:
+        if self._rate > 0 and self.limit is not None and self._tokens < self.limit:
+            self._tokens = min(self.limit, self._tokens + (now - self._updated) * self._rate)
+        self._updated = now
+
+    def reserve(self) -> float:
+        """
+        Bir istek için token ayır
+
+        Her reserve() çağrısından sonra (istek başarısız olsa bile) update()
+        çağrılmalıdır.
+
+        Returns:
+            İstek gönderilmeden önce beklenecek süre (saniye)
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            self._tokens -= 1
+            self._pending += 1
+            self.requests += 1
+
+            wait = max(0.0, self._blocked_until - now)
+            if self._tokens < 0 and self._rate > 0:
+                wait = max(wait, -self._tokens / self._rate)
+
+            if wait > 0:
+                self.delayed += 1
+                self.total_wait += wait
+            return wait
+
+    def try_reserve(self) -> bool:
+        """
+        Beklemeden token alınabiliyorsa ayır (hedge gibi isteğe bağlı istekler için)
+
+        Returns:
+            Token ayrıldıysa True (sonrasında update() çağrılmalıdır)
+        """
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            if now < self._blocked_until or self._tokens < 1:
+                return False
+            self._tokens -= 1
+            self._pending += 1
+            self.requests += 1
+            return True
+
+    def update(self, headers: Optional[Mapping[str, Any]] = None) -> None:
+        """
+        Response header'ları ile bucket'ı güncelle
+
+        Args:
+            headers: Response header'ları (istek response alınamadan bittiyse None)
+        """
+        with self._lock:
+            now = self._clock()
+            self._pending = max(0, self._pending - 1)
+            if not headers:
+                return
+
+            limit = _header_number(headers, 'RateLimit-Limit')
+            remaining = _header_number(headers, 'RateLimit-Remaining')
+            reset = _header_number(headers, 'RateLimit-Reset')
+            policy = headers.get('RateLimit-Policy') or headers.get('RateLimit-Limit') or ''
+            window_match = _WINDOW_PATTERN.search(str(policy))
+
+            self._refill(now)
+            if limit:
+                self.limit = limit
+            if window_match:
+                self.window = float(window_match.group(1))
+            elif reset:
+                self.window = max(self.window or 0.0, reset)
+            if self.limit and self.window:
+                self._rate = self.limit / self.window
+
+            if remaining is not None:
+                self._tokens = remaining - self._pending
+                if self.limit is not None:
+                    self._tokens = min(self._tokens, self.limit)
+                if remaining <= 0:
+                    block = reset if reset is not None else DEFAULT_BLOCK_SECONDS
+                    self._blocked_until = max(self._blocked_until, now + block)
+
+    def block(self, seconds: float) -> None:
+        """Sunucu isteği reddetti (429): seconds boyunca bu host'a istek gönderme"""
+        with self._lock:
+            now = self._clock()
+            self.rejected += 1
+            self._refill(now)
+            self._tokens = min(self._tokens, 0.0)
+            self._blocked_until = max(self._blocked_until, now + max(0.0, seconds))
+
+    def state(self) -> Dict[str, Any]:
+        """Limiter'ın anlık durumu"""
+        with self._lock:
+            now = self._clock()
+            self._refill(now)
+            return {
+                'host': self.host,
+                'user': self.user,
+                'limit': self.limit,
+                'window': self.window,
+                'rate': self._rate,
+                'tokens': None if math.isinf(self._tokens) else self._tokens,
+                'blocked_for': max(0.0, self._blocked_until - now),
+                'pending': self._pending,
+                'requests': self.requests,
+                'delayed': self.delayed,
+                'total_wait': self.total_wait,
+                'rejected': self.rejected,
+            }
+
+    def __repr__(self) -> str:
+        return f"<RateLimiter: {self.host} ({self.user}), limit={self.limit}, window={self.window}>"
+
+
+__all__ = ['RateLimiter', 'DEFAULT_BLOCK_SECONDS']
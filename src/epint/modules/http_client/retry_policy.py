@@ -0,0 +1,277 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+HTTPClient ve AsyncHTTPClient'ın ortak retry motoru.
+
+Her deneme sonucu sınıflandırılır (5xx, bağlantı hatası, timeout, 429,
+geçersiz ticket). Tekrar denenebilir sonuçlar için full-jitter üstel
+bekleme uygulanır; toplam deneme sayısı ve toplam süre çağrı başına
+sınırlıdır. Process genelindeki RetryBudget, EPİAŞ tarafında bir kesinti
+olduğunda retry'ların normal trafiğin belirli bir oranını aşmasını engeller.
+Her çağrının denemeleri RetryReport olarak response'a (veya exception'a)
+eklenir.
+"""
+
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Dict, Any, Callable, List, Optional, Tuple
+
+
+# Deneme sonuçları
+OK = 'ok'
+SERVER_ERROR = 'server_error'
+CONNECT_ERROR = 'connect_error'
+TIMEOUT = 'timeout'
+RATE_LIMITED = 'rate_limited'
+TICKET_INVALID = 'ticket_invalid'
+ERROR = 'error'
+
+RETRYABLE = frozenset({SERVER_ERROR, CONNECT_ERROR, TIMEOUT, RATE_LIMITED, TICKET_INVALID})
+
+# İstek sunucuya ulaşmış olabileceği için sadece retry_methods'taki metodlarda tekrar denenir
+_METHOD_SENSITIVE = frozenset({SERVER_ERROR, TIMEOUT})
+
+
+class RetryBudget:
+    """
+    Process genelinde paylaşılan retry bütçesi
+
+    Her yeni çağrı bütçeye ratio kadar token ekler, her retry bir token
+    harcar (en fazla capacity token birikir). Kesinti sırasında retry'lar
+    normal trafiğin ratio katını geçemez; token kalmadığında çağrılar ilk
+    hatada sonuçlanır. Ticket yenileme retry'ları bütçeden düşülmez.
+    """
+
+    _shared: Optional['RetryBudget'] = None
+    _shared_lock = threading.Lock()
+
+    def __init__(self, ratio: float = 0.2, capacity: float = 20.0):
+        self.ratio = ratio
+        self.capacity = capacity
+        self._tokens = capacity
+        self._lock = threading.Lock()
+
+        # Metrikler
+        self.calls = 0
+        self.retries = 0
+        self.denied = 0
+
+    @classmethod
+    def shared(cls) -> 'RetryBudget':
+        """Process genelindeki bütçe"""
+        if cls._shared is None:
+            with cls._shared_lock:
+                if cls._shared is None:
+                    cls._shared = cls()
+        return cls._shared
+
+    @classmethod
+    def configure(cls, ratio: float = 0.2, capacity: float = 20.0) -> 'RetryBudget':
+        """Process genelindeki bütçeyi yeni ayarlarla (dolu olarak) değiştir"""
+        with cls._shared_lock:
+            cls._shared = cls(ratio, capacity)
+        return cls._shared
+
+    def deposit(self) -> None:
+        """Yeni bir çağrı başladı"""
+        with self._lock:
+            self.calls += 1
+            self._tokens = min(self.capacity, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Bir retry için token harca; bütçe tükendiyse False"""
+        with self._lock:
+            if self._tokens < 1:
+                self.denied += 1
+                return False
+            self._tokens -= 1
+            self.retries += 1
+            return True
+
+    def state(self) -> Dict[str, Any]:
+        """Bütçenin anlık durumu"""
+        with self._lock:
+            return {
+                'tokens': self._tokens,
+                'capacity': self.capacity,
+                'ratio': self.ratio,
+                'calls': self.calls,
+                'retries': self.retries,
+                'denied': self.denied,
+            }
+
+
+@dataclass
+class Attempt:
+    """Tek bir HTTP denemesi"""
+
+    outcome: str
+    status: Optional[int] = None
+    elapsed: float = 0.0
+    wait: Optional[float] = None
+
+
+@dataclass
+class RetryReport:
+    """Bir çağrının deneme raporu (response.retry_report veya exception.retry_report)"""
+
+    method: str
+    attempts: List[Attempt] = field(default_factory=list)
+    elapsed: float = 0.0
+    gave_up: Optional[str] = None
+    hedges: int = 0
+
+    @property
+    def count(self) -> int:
+        """Toplam HTTP denemesi"""
+        return len(self.attempts)
+
+    @property
+    def retries(self) -> int:
+        return max(0, len(self.attempts) - 1)
+
+    @property
+    def total_wait(self) -> float:
+        return sum(attempt.wait or 0.0 for attempt in self.attempts)
+
+    def __str__(self) -> str:
+        outcomes = ", ".join(attempt.outcome for attempt in self.attempts)
+        hedges = f", {self.hedges} hedge" if self.hedges else ""
+        reason = f", vazgeçildi: {self.gave_up}" if self.gave_up else ""
+        return f"{self.count} deneme ({outcomes}){hedges}, {self.elapsed:.2f} sn{reason}"
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Retry kuralları
+
+    Attributes:
+        max_attempts: Çağrı başına toplam HTTP denemesi (ilk deneme dahil)
+        max_elapsed: Çağrı başına toplam süre (saniye, beklemeler dahil; None ise sınırsız)
+        base_delay: Üstel beklemenin taban süresi (saniye)
+        max_delay: Tek bir beklemenin üst sınırı (saniye)
+        retry_statuses: Tekrar denenecek 5xx status kodları
+        retry_methods: 5xx ve okuma timeout'unda tekrar denenecek HTTP metodları
+        max_ticket_refreshes: Geçersiz TGT için en fazla yenileme sayısı
+    """
+
+    max_attempts: int = 4
+    max_elapsed: Optional[float] = 120.0
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    retry_statuses: Tuple[int, ...] = (500, 502, 503, 504)
+    retry_methods: Tuple[str, ...] = ("GET", "POST", "PUT", "DELETE", "PATCH")
+    max_ticket_refreshes: int = 2
+
+    def backoff(self, retry: int) -> float:
+        """retry'ıncı tekrar için full-jitter bekleme: U(0, min(max_delay, base_delay * 2^retry))"""
+        return random.uniform(0.0, min(self.max_delay, self.base_delay * (2 ** retry)))
+
+    def start(self, method: str, budget: Optional[RetryBudget] = None,
+              clock: Callable[[], float] = time.monotonic, deadline: Optional[Any] = None) -> 'RetryCall':
+        """Yeni bir çağrı için retry durumu oluştur (deadline: çağrının Deadline'ı, varsa)"""
+        return RetryCall(self, method, budget if budget is not None else RetryBudget.shared(), clock, deadline)
+
+
+class RetryCall:
+    """Tek bir mantıksal çağrının retry durumu (bkz. RetryPolicy.start)"""
+
+    def __init__(self, policy: RetryPolicy, method: str, budget: RetryBudget, clock: Callable[[], float],
+                 deadline: Optional[Any] = None):
+        self.policy = policy
+        self.deadline = deadline
+        self.method = method.upper()
+        self.budget = budget
+        self.report = RetryReport(self.method)
+        self._clock = clock
+        self._started = clock()
+        self._attempt_started = self._started
+        self._ticket_refreshes = 0
+        budget.deposit()
+
+    def begin_attempt(self) -> None:
+        """Yeni denemenin başlangıç zamanını kaydet"""
+        self._attempt_started = self._clock()
+
+    def elapsed(self) -> float:
+        return self._clock() - self._started
+
+    def next_delay(self, outcome: str, status: Optional[int] = None,
+                   server_wait: Optional[float] = None) -> Optional[float]:
+        """
+        Denemenin sonucunu kaydet ve bir sonraki denemeden önceki bekleme süresini döndür
+
+        Args:
+            outcome: Deneme sonucu (OK, SERVER_ERROR, ...)
+            status: HTTP status kodu (varsa)
+            server_wait: Sunucunun bildirdiği bekleme süresi (429)
+
+        Returns:
+            Bekleme süresi (saniye) veya tekrar denenmeyecekse None
+        """
+        now = self._clock()
+        attempt = Attempt(outcome, status, now - self._attempt_started)
+        self.report.attempts.append(attempt)
+        self.report.elapsed = now - self._started
+
+        reason = self._stop_reason(outcome)
+        if reason is None:
+            if outcome == TICKET_INVALID:
+                delay = 0.0
+            elif outcome == RATE_LIMITED and server_wait is not None:
+                delay = server_wait
+            else:
+                delay = self.policy.backoff(self.report.retries)
+
+            max_elapsed = self.policy.max_elapsed
+            if self.deadline is not None and delay >= self.deadline.remaining():
+                reason = 'deadline'
+            elif max_elapsed is not None and self.report.elapsed + delay > max_elapsed:
+                reason = 'time budget'
+            elif outcome != TICKET_INVALID and not self.budget.withdraw():
+                reason = 'retry budget'
+            else:
+                if outcome == TICKET_INVALID:
+                    self._ticket_refreshes += 1
+                attempt.wait = delay
+                return delay
+
+        if outcome != OK:
+            self.report.gave_up = reason
+        return None
+
+    def _stop_reason(self, outcome: str) -> Optional[str]:
+        if outcome == OK:
+            return 'ok'
+        if self.deadline is not None and self.deadline.remaining() <= 0:
+            return 'deadline'
+        if outcome not in RETRYABLE:
+            return 'not retryable'
+        if outcome in _METHOD_SENSITIVE and self.method not in self.policy.retry_methods:
+            return 'method not retryable'
+        if outcome == TICKET_INVALID and self._ticket_refreshes >= self.policy.max_ticket_refreshes:
+            return 'ticket refresh limit'
+        if len(self.report.attempts) >= self.policy.max_attempts:
+            return 'attempt limit'
+        return None
+
+
+__all__ = [
+    'RetryPolicy', 'RetryCall', 'RetryBudget', 'RetryReport', 'Attempt',
+    'OK', 'SERVER_ERROR', 'CONNECT_ERROR', 'TIMEOUT', 'RATE_LIMITED', 'TICKET_INVALID', 'ERROR',
+]
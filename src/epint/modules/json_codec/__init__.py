@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Request body encode / response decode için JSON codec'i.
+
+Kurulu ise orjson, değilse ujson, o da yoksa standart kütüphanedeki json
+kullanılır. Body'ler doğrudan bytes olarak encode edilir; response'lar
+response.content üzerinden bir kez decode edilip response objesinde
+saklanır (ResponseModel ve ErrorHandler aynı sonucu kullanır).
+"""
+
+import json
+from typing import Any, Callable, Optional, Tuple, Union
+
+
+# Tercih sırası
+BACKENDS = ('orjson', 'ujson', 'json')
+
+# Decode edilmiş body'nin response objesinde saklandığı attribute
+_RESPONSE_ATTR = '_epint_json'
+
+
+def _stdlib_dumps(obj: Any) -> bytes:
+    # requests'in json= parametresiyle aynı ayarlar
+    return json.dumps(obj, allow_nan=False).encode('utf-8')
+
+
+def _load_backend(name: str) -> Tuple[Callable[[Any], bytes], Callable[[Union[bytes, str]], Any]]:
+    """Backend'in (dumps, loads) fonksiyonlarını döndür; kurulu değilse ImportError"""
+    if name == 'orjson':
+        import orjson
+        option = orjson.OPT_NON_STR_KEYS
+        return (lambda obj: orjson.dumps(obj, option=option)), orjson.loads
+    if name == 'ujson':
+        import ujson
+        return (lambda obj: ujson.dumps(obj, ensure_ascii=False).encode('utf-8')), ujson.loads
+    if name == 'json':
+        return _stdlib_dumps, json.loads
+    raise ValueError(f"Bilinmeyen JSON backend'i: {name!r} (seçenekler: {', '.join(BACKENDS)})")
+
+
+class JsonCodec:
+    """orjson / ujson / json arasında seçim yapan JSON encode-decode katmanı"""
+
+    _backend: Optional[str] = None
+    _dumps: Optional[Callable[[Any], bytes]] = None
+    _loads: Optional[Callable[[Union[bytes, str]], Any]] = None
+
+    @classmethod
+    def set_backend(cls, name: Optional[str] = None) -> str:
+        """
+        JSON backend'ini seç
+
+        Args:
+            name: 'orjson', 'ujson' veya 'json' (None ise kurulu olan ilk backend)
+
+        Returns:
+            Seçilen backend'in ismi
+
+        Raises:
+            ImportError: İstenen backend kurulu değilse
+            ValueError: Backend ismi bilinmiyorsa
+        """
+        candidates = BACKENDS if name is None else (name,)
+        for candidate in candidates:
+            try:
+                cls._dumps, cls._loads = _load_backend(candidate)
+            except ImportError:
+                if name is not None:
+                    raise
+                continue
+            cls._backend = candidate
+            return candidate
+        raise ImportError("JSON backend'i bulunamadı")  # stdlib her zaman mevcut, buraya gelmemeli
+
+    @classmethod
+    def get_backend(cls) -> str:
+        """Kullanılan backend'in ismi (ilk çağrıda seçilir)"""
+        if cls._backend is None:
+            cls.set_backend()
+        return cls._backend
+
+    @classmethod
+    def dumps(cls, obj: Any) -> bytes:
+        """Objeyi UTF-8 JSON bytes'ına encode et"""
+        if cls._dumps is None:
+            cls.set_backend()
+        try:
+            return cls._dumps(obj)
+        except (TypeError, OverflowError):
+            if cls._dumps is _stdlib_dumps:
+                raise
+            # Hızlı backend'in desteklemediği tipler (ör. 64 bit'ten büyük int) için stdlib
+            return _stdlib_dumps(obj)
+
+    @classmethod
+    def loads(cls, data: Union[bytes, bytearray, memoryview, str]) -> Any:
+        """
+        JSON bytes/str'ini decode et
+
+        Raises:
+            ValueError: Veri geçerli JSON değilse
+        """
+        if cls._loads is None:
+            cls.set_backend()
+        try:
+            return cls._loads(data)
+        except (ValueError, OverflowError):
+            if cls._loads is json.loads:
+                raise
+            # Hızlı backend'in reddettiği fakat geçerli JSON (ör. büyük sayılar) için stdlib
+            return json.loads(data)
+
+    @classmethod
+    def decode_response(cls, response: Any) -> Any:
+        """
+        Response body'sini bir kez decode et ve response objesinde sakla
+
+        Body response.content'ten decode edilir; content yoksa response.json()
+        kullanılır. Başarısız decode da saklanır, tekrar denenmez.
+
+        Raises:
+            ValueError: Body geçerli JSON değilse
+        """
+        cached = getattr(response, _RESPONSE_ATTR, None)
+        if cached is None:
+            content = getattr(response, 'content', None)
+            try:
+                if isinstance(content, (bytes, bytearray)) and content:
+                    cached = (True, cls.loads(content))
+                else:
+                    cached = (True, response.json())
+            except ValueError as e:
+                cached = (False, e)
+            try:
+                setattr(response, _RESPONSE_ATTR, cached)
+            except AttributeError:
+                pass
+
+        ok, value = cached
+        if not ok:
+            raise ValueError(str(value)) from value
+        return value
+
+
+__all__ = ['JsonCodec', 'BACKENDS']
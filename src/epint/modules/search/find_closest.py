@@ -12,13 +12,148 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from difflib import SequenceMatcher
-from typing import List, Optional
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class FuzzyMatcher:
+    """
+    Sabit bir aday kümesi için bir kez kurulan fuzzy matching index'i
+
+    Tüm adaylar üzerinde doğrusal SequenceMatcher taramasıyla aynı sonucu
+    verir (ratio'su en yüksek, eşitlikte listede önce gelen aday), ancak her
+    adayla ratio hesaplamak yerine:
+
+    - case-insensitive tam eşleşmeler dict lookup ile bulunur,
+    - (karakter, k) -> "karakteri en az k kez içeren adaylar" ters index'i ile
+      karakter sayımı üst sınırı (quick_ratio) sadece sorguyla karakter
+      paylaşan adaylar için ve C seviyesinde (Counter.update) hesaplanır,
+    - üst sınırı eşiğe ulaşamayan adaylar elenir,
+    - üst sınırı en iyi sonucun altında kalan adaylar için SequenceMatcher
+      çalıştırılmaz,
+    - sorgu sonuçları memoize edilir.
+
+    Trigram / BK-tree gibi edit distance index'leri SequenceMatcher.ratio()
+    sonucunu korumadığı (eşiğe ulaşan ama trigram paylaşmayan adaylar
+    kaçırılabildiği) için kullanılmaz; çağıran yerlerdeki eşikler ratio'ya
+    göre ayarlıdır.
+    """
+
+    _CACHE_SIZE = 1024
+
+    def __init__(self, candidates: Iterable[str]):
+        self._candidates: Tuple[str, ...] = tuple(candidates)
+        self._lower: Dict[str, str] = {}
+        self._postings: Dict[Tuple[str, int], List[int]] = {}
+        for index, candidate in enumerate(self._candidates):
+            self._lower.setdefault(candidate.lower(), candidate)
+            for char, count in Counter(candidate).items():
+                for k in range(1, count + 1):
+                    self._postings.setdefault((char, k), []).append(index)
+
+        self._lengths = [len(candidate) for candidate in self._candidates]
+        self._results: Dict[Tuple[str, float], Optional[str]] = {}
+
+    @classmethod
+    def for_candidates(cls, candidates: Iterable[str]) -> 'FuzzyMatcher':
+        """Aynı aday kümesi için daha önce kurulmuş matcher'ı döndür"""
+        return _matcher_for(tuple(candidates))
+
+    def find(self, target: str, threshold: float = 0.6) -> Optional[str]:
+        """
+        En yakın adayı bul
+
+        Args:
+            target: Aranacak string
+            threshold: Minimum benzerlik oranı (0.0-1.0)
+
+        Returns:
+            En yakın eşleşen aday veya None
+        """
+        if not target or not self._candidates:
+            return None
+
+        lower = self.find_case_insensitive(target)
+        if lower is not None:
+            return lower
+
+        key = (target, threshold)
+        try:
+            return self._results[key]
+        except KeyError:
+            pass
+
+        result = self._find_fuzzy(target, threshold)
+        if len(self._results) >= self._CACHE_SIZE:
+            self._results.clear()
+        self._results[key] = result
+        return result
+
+    def find_case_insensitive(self, target: str) -> Optional[str]:
+        """Case-insensitive tam eşleşen ilk adayı döndür"""
+        return self._lower.get(target.lower())
+
+    def _find_fuzzy(self, target: str, threshold: float) -> Optional[str]:
+        from difflib import SequenceMatcher
+
+        target_length = len(target)
+
+        # overlap[i] = sum(min(target'taki sayı, adaydaki sayı)) = quick_ratio payı
+        overlap: Counter = Counter()
+        postings = self._postings
+        for char, count in Counter(target).items():
+            for k in range(1, count + 1):
+                indexes = postings.get((char, k))
+                if indexes is None:
+                    break
+                overlap.update(indexes)
+
+        # Üst sınır SequenceMatcher.ratio() ile aynı float ifadesiyle (2.0*M/(la+lb))
+        # hesaplanır; M <= common <= min(la, lb) olduğundan eşik sınırında da
+        # doğrusal taramayla aynı adaylar kalır (uzunluk sınırı da bu sınırın içindedir)
+        lengths = self._lengths
+        bounds = []
+        for index, common in overlap.items():
+            bound = 2.0 * common / (target_length + lengths[index])
+            if bound >= threshold:
+                bounds.append((-bound, index))
+        bounds.sort()
+
+        best_ratio = 0.0
+        best_index = -1
+        for negative_bound, index in bounds:
+            if -negative_bound < best_ratio:
+                break
+            ratio = SequenceMatcher(None, target, self._candidates[index]).ratio()
+            # Eşit oranda listede önce gelen aday kazanır
+            if ratio >= threshold and (ratio > best_ratio or (ratio == best_ratio and index < best_index)):
+                best_ratio = ratio
+                best_index = index
+
+        return self._candidates[best_index] if best_index >= 0 else None
+
+    def __contains__(self, candidate: object) -> bool:
+        return candidate in self._candidates
+
+    def __len__(self) -> int:
+        return len(self._candidates)
+
+    def __repr__(self) -> str:
+        return f"<FuzzyMatcher: candidates={len(self._candidates)}>"
+
+
+@lru_cache(maxsize=256)
+def _matcher_for(candidates: Tuple[str, ...]) -> FuzzyMatcher:
+    return FuzzyMatcher(candidates)
+
 
 def find_closest_match(target: str, candidates: List[str], threshold: float = 0.6) -> Optional[str]:
     """
     Fuzzy matching ile en yakın eşleşmeyi bul
 
+    Aynı aday kümesi için kurulan FuzzyMatcher cache'lenir ve tekrar kullanılır.
+
     Args:
         target: Aranacak string
         candidates: Aday string listesi
@@ -30,24 +165,7 @@ def find_closest_match(target: str, candidates: List[str], threshold: float = 0.
     if not target or not candidates:
         return None
 
-    # Önce direkt eşleşme kontrol et (case-insensitive)
-    target_lower = target.lower()
-    for candidate in candidates:
-        if candidate.lower() == target_lower:
-            return candidate
-
-    # Direkt eşleşme yoksa fuzzy matching yap
-    target_norm = target
-
-    best_match = None
-    best_ratio = 0.0
-    for candidate in candidates:
-        cand_norm = candidate
-        ratio = SequenceMatcher(None, target_norm, cand_norm).ratio()
-        if ratio > best_ratio and ratio >= threshold:
-            best_ratio = ratio
-            best_match = candidate
-    return best_match
+    return FuzzyMatcher.for_candidates(candidates).find(target, threshold)
 
 def dict_key_search(search_keys: list, dict_object: dict) -> any:
     # Önce direkt eşleşmeleri kontrol et (case-insensitive)
@@ -59,8 +177,11 @@ def dict_key_search(search_keys: list, dict_object: dict) -> any:
             return dict_object.pop(original_key)
 
     # Direkt eşleşme yoksa fuzzy matching yap (her bir anahtar için)
+    if not dict_object:
+        return None
+    matcher = FuzzyMatcher.for_candidates(dict_object)
     for search_key in search_keys:
-        matched_key = find_closest_match(search_key, list(dict_object.keys()), threshold=0.7)
+        matched_key = matcher.find(search_key, threshold=0.7)
         if matched_key:
             return dict_object.pop(matched_key)
 
@@ -0,0 +1,222 @@
+# -*- coding: utf-8 -*-
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Bağlantı ısınması (warm-up) ve keep-warm.
+
+İlk istek TCP + TLS el sıkışması ve CAS'tan TGT alınması yüzünden
+sonrakilerden belirgin şekilde yavaştır. warmup() kategorilerin API
+host'larına ve CAS köküne, endpoint çağrılarının kullandığı paylaşılan
+session üzerinden eşzamanlı HEAD istekleri göndererek havuzda açık
+bağlantılar bırakır ve TGT'leri önceden alır. KeepWarm arka planda aynı
+işi periyodik olarak tekrarlar; böylece sunucunun idle timeout'u
+bağlantıları kapatmaz ve süresi dolan TGT'ler çağrılardan önce yenilenir.
+Isınma istekleri rate limiter, retry ve circuit breaker sayaçlarına
+uğramaz; hatalar rapora yazılır, exception fırlatılmaz.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+
+
+# Isınma isteklerinin (connect, read) timeout'u
+WARMUP_TIMEOUT: Tuple[float, float] = (5.0, 10.0)
+
+# Keep-warm varsayılan periyodu (saniye); sunucuların keep-alive idle
+# timeout'unun (genelde 60 sn) altında tutulur
+KEEP_WARM_INTERVAL: float = 45.0
+
+
+def _target_service(category: str) -> str:
+    """Kategorinin ticket aldığı CAS servisi (bkz. Endpoint._get_auth)"""
+    return "transparency" if "seffaflik" in category else "epys"
+
+
+def api_hosts(categories: Iterable[str], mode: str = "prod") -> List[str]:
+    """Kategorilerin API host kökleri (bkz. RequestPlan.hosts)"""
+    from ...models.request_plan import get_host_name
+
+    hosts = []
+    for category in categories:
+        host = f"https://{get_host_name(category, mode == 'test')}.epias.com.tr"
+        if host not in hosts:
+            hosts.append(host)
+    return hosts
+
+
+def authentications(categories: Iterable[str]) -> list:
+    """Kategorilerin kullandığı Authentication'lar (CAS kökü başına bir tane; auth yoksa boş)"""
+    import epint
+    from ..authentication.auth_manager import Authentication
+
+    if epint._username is None or epint._password is None:
+        return []
+    auths = {}
+    for category in categories:
+        service = _target_service(category)
+        if service not in auths:
+            auths[service] = Authentication(epint._username, epint._password, service, epint._mode)
+    return list(auths.values())
+
+
+def open_connections(url: str, connections: int = 2, client=None) -> Dict[str, Any]:
+    """
+    Host için paylaşılan session havuzunda bağlantı aç
+
+    Eşzamanlı gönderilen HEAD istekleri her biri ayrı bir bağlantı kurar;
+    body okunduğu için bağlantılar kapanmadan havuza geri döner.
+
+    Args:
+        url: Host kökü (ör. https://seffaflik.epias.com.tr)
+        connections: Açılacak bağlantı sayısı (havuz boyutuyla sınırlı)
+        client: Session'ı sağlayan HTTPClient (None ise endpoint'lerin kullandığı varsayılan)
+
+    Returns:
+        {'connections': açılan bağlantı, 'elapsed': süre, 'error': son hata veya None}
+    """
+    from ..http_client import HTTPClient
+    from ..http_client.circuit_breaker import CircuitBreaker
+
+    if not CircuitBreaker.is_available(url):
+        return {'connections': 0, 'elapsed': 0.0, 'error': 'circuit open'}
+
+    client = client if client is not None else HTTPClient()
+    session = client._get_session(url)
+    connections = max(1, min(connections, client.pool_maxsize))
+    errors = []
+
+    def _head(_):
+        try:
+            response = session.head(url, timeout=WARMUP_TIMEOUT, allow_redirects=False)
+            response.content
+            return True
+        except Exception as e:
+            errors.append(f"{type(e).__name__}: {e}")
+            return False
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=connections, thread_name_prefix='epint-warmup') as executor:
+        opened = sum(executor.map(_head, range(connections)))
+    return {
+        'connections': opened,
+        'elapsed': time.perf_counter() - start,
+        'error': errors[-1] if errors else None,
+    }
+
+
+def fetch_tickets(auths: Iterable[Any]) -> Dict[str, Any]:
+    """CAS kökü başına TGT al (geçerli TGT varsa cache'ten); değer 'ok' veya hata mesajı"""
+    tickets = {}
+    for auth in auths:
+        try:
+            auth.get_tgt()
+            tickets[auth.root] = 'ok'
+        except Exception as e:
+            tickets[auth.root] = f"{type(e).__name__}: {e}"
+    return tickets
+
+
+def warmup(categories: Iterable[str], connections: int = 2, tickets: bool = True) -> Dict[str, Any]:
+    """
+    Kategorilerin host'larına ve CAS köküne bağlantı aç, TGT'leri al
+
+    Args:
+        categories: Kategori isimleri (alias'lar çözülmüş olmalı)
+        connections: Host başına açılacak bağlantı sayısı
+        tickets: False ise TGT alınmaz (CAS köküne bağlantı yine açılır)
+
+    Returns:
+        {'categories', 'hosts': {url: open_connections sonucu}, 'tickets': {cas kökü: durum}, 'elapsed'}
+    """
+    import epint
+
+    categories = list(categories)
+    start = time.perf_counter()
+    auths = authentications(categories)
+    hosts = [auth.root for auth in auths] + api_hosts(categories, epint._mode)
+
+    with ThreadPoolExecutor(max_workers=max(1, len(hosts)), thread_name_prefix='epint-warmup') as executor:
+        results = dict(zip(hosts, executor.map(lambda host: open_connections(host, connections), hosts)))
+
+    return {
+        'categories': categories,
+        'hosts': results,
+        'tickets': fetch_tickets(auths) if tickets else {},
+        'elapsed': time.perf_counter() - start,
+    }
+
+
+class KeepWarm:
+    """Bağlantıları ve ticket'ları arka planda sıcak tutan daemon thread (process başına bir tane)"""
+
+    _current: Optional['KeepWarm'] = None
+    _lock = threading.Lock()
+
+    def __init__(self, categories: Iterable[str], connections: int = 2, tickets: bool = True,
+                 interval: float = KEEP_WARM_INTERVAL):
+        if interval <= 0:
+            raise ValueError("interval pozitif olmalı")
+        self.categories = list(categories)
+        self.connections = connections
+        self.tickets = tickets
+        self.interval = interval
+        self.runs = 0
+        self.last_report: Optional[Dict[str, Any]] = None
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, name='epint-keep-warm', daemon=True)
+
+    @classmethod
+    def start(cls, categories: Iterable[str], connections: int = 2, tickets: bool = True,
+              interval: float = KEEP_WARM_INTERVAL) -> 'KeepWarm':
+        """Keep-warm'ı başlat (çalışan varsa durdurulup yenisiyle değiştirilir)"""
+        keeper = cls(categories, connections, tickets, interval)
+        with cls._lock:
+            previous, cls._current = cls._current, keeper
+        if previous is not None:
+            previous.stop()
+        keeper._thread.start()
+        return keeper
+
+    @classmethod
+    def stop_current(cls) -> None:
+        with cls._lock:
+            keeper, cls._current = cls._current, None
+        if keeper is not None:
+            keeper.stop()
+
+    @classmethod
+    def current(cls) -> Optional['KeepWarm']:
+        return cls._current
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        self._stopped.set()
+        if self._thread.is_alive() and self._thread is not threading.current_thread():
+            self._thread.join(timeout)
+
+    @property
+    def running(self) -> bool:
+        return self._thread.is_alive() and not self._stopped.is_set()
+
+    def _run(self) -> None:
+        while not self._stopped.wait(self.interval):
+            try:
+                self.last_report = warmup(self.categories, self.connections, self.tickets)
+            except Exception as e:
+                self.last_report = {'error': f"{type(e).__name__}: {e}"}
+            self.runs += 1
+
+
+__all__ = ['warmup', 'open_connections', 'fetch_tickets', 'api_hosts', 'KeepWarm']
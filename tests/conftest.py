@@ -19,10 +19,95 @@ def reset_endpoint_registry():
     EndpointModel._endpoints.clear()
     EndpointModel._categories.clear()
     EndpointModel._swagger_models.clear()
+    EndpointModel._swagger_paths.clear()
+    EndpointModel._method_names.clear()
+    EndpointModel._name_matchers.clear()
+    EndpointModel._lean = False
+    EndpointModel._image = None
+    EndpointModel._request_plans.clear()
     yield
     EndpointModel._endpoints.clear()
     EndpointModel._categories.clear()
     EndpointModel._swagger_models.clear()
+    EndpointModel._swagger_paths.clear()
+    EndpointModel._method_names.clear()
+    EndpointModel._name_matchers.clear()
+    EndpointModel._lean = False
+    EndpointModel._image = None
+    EndpointModel._request_plans.clear()
+
+
+@pytest.fixture(autouse=True)
+def reset_request_validation():
+    """Yerel request doğrulamasını testler arasında varsayılan (açık) haline döndür."""
+    from epint.models.request_validator import RequestValidator
+
+    RequestValidator.enabled = True
+    yield
+    RequestValidator.enabled = True
+
+
+@pytest.fixture(autouse=True)
+def reset_rate_limiters():
+    """Host bazında öğrenilen rate limit'leri testler arasında sıfırla."""
+    from epint.modules.http_client.rate_limiter import RateLimiter
+
+    RateLimiter.reset_all()
+    yield
+    RateLimiter.reset_all()
+
+
+@pytest.fixture(autouse=True)
+def reset_hedging():
+    """Hedging ayarlarını ve gözlenen gecikmeleri testler arasında sıfırla."""
+    from epint.modules.http_client.hedging import Hedging, LatencyTracker
+
+    Hedging.disable()
+    LatencyTracker.reset_all()
+    yield
+    Hedging.disable()
+    LatencyTracker.reset_all()
+
+
+@pytest.fixture(autouse=True)
+def reset_circuit_breakers():
+    """Host bazındaki circuit breaker'ları ve eşiklerini testler arasında sıfırla."""
+    from epint.modules.http_client.circuit_breaker import BreakerPolicy, CircuitBreaker
+
+    CircuitBreaker.configure(BreakerPolicy())
+    yield
+    CircuitBreaker.configure(BreakerPolicy())
+
+
+@pytest.fixture(autouse=True)
+def reset_http_cache():
+    """Cache ayarlarını ve varsayılan depoyu testler arasında sıfırla."""
+    from epint.modules.http_client.http_cache import Caching, HTTPCache
+
+    Caching.disable()
+    HTTPCache._default = None
+    yield
+    Caching.disable()
+    HTTPCache._default = None
+
+
+@pytest.fixture(autouse=True)
+def stop_keep_warm():
+    """Testlerde başlatılan keep-warm thread'ini durdur."""
+    from epint.modules.warmup import KeepWarm
+
+    yield
+    KeepWarm.stop_current()
+
+
+@pytest.fixture(autouse=True)
+def reset_retry_budget():
+    """Process genelindeki retry bütçesini testler arasında sıfırla."""
+    from epint.modules.http_client.retry_policy import RetryBudget
+
+    RetryBudget._shared = None
+    yield
+    RetryBudget._shared = None
 
 
 @pytest.fixture(autouse=True)
@@ -34,11 +119,13 @@ def reset_epint_globals():
     epint._password = None
     epint._mode = "prod"
     epint._category_objects.clear()
+    epint._resolved_names.clear()
     yield
     epint._username = None
     epint._password = None
     epint._mode = "prod"
     epint._category_objects.clear()
+    epint._resolved_names.clear()
 
 
 class FakeResponse:
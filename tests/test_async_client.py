@@ -0,0 +1,257 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import sys
+import threading
+import time
+import types
+
+import pytest
+
+import epint
+from epint.models.endpoint_callable import Endpoint
+from epint.modules.authentication.auth_manager import Authentication
+from epint.modules.http_client import async_client
+from epint.modules.http_client.async_client import AsyncHTTPClient
+
+URL = "https://seffaflik.epias.com.tr/electricity-service/v1/markets/dam/data/mcp"
+
+
+class SlowSession:
+    """Her isteği bekleyerek cevaplayan, eşzamanlı istek sayısını ölçen session."""
+
+    def __init__(self, responses, delay=0.0):
+        self._responses = list(responses)
+        self._delay = delay
+        self._lock = threading.Lock()
+        self.calls = []
+        self.active = 0
+        self.max_active = 0
+
+    def request(self, **kwargs):
+        with self._lock:
+            self.calls.append(kwargs)
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            response = (
+                self._responses.pop(0)
+                if len(self._responses) > 1
+                else self._responses[0]
+            )
+        time.sleep(self._delay)
+        with self._lock:
+            self.active -= 1
+        return response
+
+
+def _client(monkeypatch, session, **kwargs):
+    client = AsyncHTTPClient(use_httpx=False, **kwargs)
+    monkeypatch.setattr(client, "_get_session", lambda url: session)
+    return client
+
+
+def test_thread_transport_runs_requests_concurrently(monkeypatch, fake_response):
+    session = SlowSession([fake_response()], delay=0.1)
+    client = _client(monkeypatch, session, max_connections=20)
+
+    async def main():
+        return await asyncio.gather(*(client.get(URL) for _ in range(20)))
+
+    started = time.perf_counter()
+    responses = asyncio.run(main())
+    elapsed = time.perf_counter() - started
+
+    assert len(responses) == 20
+    assert session.max_active > 1
+    assert elapsed < 1.0
+    assert client.transport == "thread"
+
+
+def test_rate_limit_waits_with_asyncio_sleep(monkeypatch, fake_response):
+    session = SlowSession(
+        [
+            fake_response(status_code=429, headers={"RateLimit-Reset": "2"}),
+            fake_response(),
+        ]
+    )
+    client = _client(monkeypatch, session)
+    waits = []
+
+    async def fake_sleep(seconds):
+        waits.append(seconds)
+
+    monkeypatch.setattr(async_client.asyncio, "sleep", fake_sleep)
+
+    response = asyncio.run(client.get(URL))
+
+    assert response.status_code == 200
+    assert waits == [pytest.approx(2, abs=0.1)]
+    assert len(session.calls) == 2
+
+
+def test_cancelled_call_stops_retrying(monkeypatch, fake_response):
+    session = SlowSession(
+        [fake_response(status_code=429, headers={"RateLimit-Reset": "60"})]
+    )
+    client = _client(monkeypatch, session)
+
+    async def main():
+        task = asyncio.ensure_future(client.get(URL))
+        await asyncio.sleep(0.05)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(main())
+
+    assert len(session.calls) == 1
+
+
+def test_concurrent_tasks_share_a_single_tgt(monkeypatch):
+    generated = []
+
+    def generate(self):
+        time.sleep(0.05)
+        generated.append(1)
+        return f"TGT-{len(generated)}-cas"
+
+    monkeypatch.setattr(Authentication, "_generate_tgt", generate)
+    monkeypatch.setattr(
+        Authentication, "_validate_ticket", lambda self, code, kind: True
+    )
+
+    async def main():
+        return await asyncio.gather(
+            *(
+                Authentication("user", "pass", "transparency", "prod").aget_tgt()
+                for _ in range(10)
+            )
+        )
+
+    tickets = asyncio.run(main())
+
+    assert len(generated) == 1
+    assert {code for code, _ in tickets} == {"TGT-1-cas"}
+
+
+class RecordingAsyncClient:
+    """AsyncHTTPClient yerine geçen, gönderilen istekleri kaydeden client."""
+
+    def __init__(self, response):
+        self.auth = None
+        self.calls = []
+        self._response = response
+
+    async def post(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return self._response
+
+
+def _mcp_endpoint():
+    return {
+        "category": "seffaflik-electricity",
+        "method": "POST",
+        "basePath": "/electricity-service",
+        "path": "/v1/markets/dam/data/mcp",
+        "consumes": ["application/json"],
+        "produces": ["application/json"],
+        "parameters": [
+            {
+                "name": "body",
+                "in": "body",
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "startDate": {"type": "string", "format": "date-time"},
+                        "endDate": {"type": "string", "format": "date-time"},
+                    },
+                },
+            }
+        ],
+    }
+
+
+@pytest.fixture
+def authenticated(monkeypatch):
+    epint._username = "user"
+    epint._password = "pass"
+    monkeypatch.setattr(Authentication, "get_tgt", lambda self: ("TGT-1-cas", None))
+
+
+def test_endpoint_acall_sends_request_with_tgt(authenticated, fake_response):
+    endpoint = Endpoint("seffaflik-electricity", "mcp", _mcp_endpoint())
+    client = endpoint.aclient = RecordingAsyncClient(
+        fake_response(content=b'{"items": [{"price": 1.5}]}')
+    )
+
+    async def main():
+        return await asyncio.gather(
+            endpoint.acall(startDate="2026-01-01", endDate="2026-01-01"),
+            endpoint.acall(startDate="2026-01-02", endDate="2026-01-02"),
+        )
+
+    results = asyncio.run(main())
+
+    assert results == [{"items": [{"price": 1.5}]}] * 2
+    url, kwargs = client.calls[0]
+    assert url.endswith("/electricity-service/v1/markets/dam/data/mcp")
+    assert kwargs["headers"]["TGT"] == "TGT-1-cas"
+    assert client.auth is not None
+
+
+def test_prepared_endpoint_acall(authenticated, fake_response):
+    endpoint = Endpoint("seffaflik-electricity", "mcp", _mcp_endpoint())
+    client = endpoint.aclient = RecordingAsyncClient(fake_response(content=b"{}"))
+    prepared = endpoint.prepare(endDate="2026-01-31")
+
+    asyncio.run(prepared.acall(startDate="2026-01-01"))
+
+    body = client.calls[0][1]["json"]
+    assert body["startDate"].startswith("2026-01-01")
+    assert body["endDate"].startswith("2026-01-31")
+
+
+class FakeHttpx(types.ModuleType):
+    """httpx yerine geçen modül; AsyncClient httpx gibi varsayılan 5 sn timeout kullanır."""
+
+    DEFAULT_TIMEOUT = 5.0
+
+    class TimeoutException(Exception):
+        pass
+
+    class HTTPError(Exception):
+        pass
+
+    class Timeout:
+        def __init__(self, timeout, connect=None):
+            self.read, self.connect = timeout, connect
+
+    class Limits:
+        def __init__(self, **kwargs):
+            pass
+
+
+def test_httpx_transport_has_no_default_timeout(monkeypatch, fake_response):
+    """Timeout verilmediyse senkron yol gibi süre sınırı yoktur (httpx'in 5 sn'si değil)."""
+    httpx = FakeHttpx("httpx")
+    seen = []
+
+    class AsyncClient:
+        def __init__(self, timeout=httpx.Timeout(httpx.DEFAULT_TIMEOUT), **kwargs):
+            self.timeout = timeout
+
+        async def request(self, method, url, follow_redirects=True, **kwargs):
+            timeout = kwargs.get("timeout", self.timeout)
+            seen.append((self.timeout.read, timeout.read))
+            # 6 sn süren cevap: 5 sn'lik varsayılan timeout'a takılırdı
+            if timeout.read is not None and timeout.read < 6:
+                raise httpx.TimeoutException("read timeout")
+            return fake_response()
+
+    httpx.AsyncClient = AsyncClient
+    monkeypatch.setitem(sys.modules, "httpx", httpx)
+    client = AsyncHTTPClient(use_httpx=True, rate_limit=False)
+
+    response = asyncio.run(client.get(URL))
+
+    assert response.status_code == 200
+    assert seen == [(None, None)]
@@ -2,6 +2,7 @@
 import pytest
 
 import epint
+import epint.endpoints
 from epint.models.endpoint_registry import EndpointModel
 from epint.modules.category_proxy import CategoryProxy
 
@@ -33,6 +34,65 @@ def test_category_objects_are_cached():
     assert first is second
 
 
+def test_resolutions_are_cached_without_filesystem_access(monkeypatch):
+    assert epint.seffalik._category == "seffaflik-electricity"
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cache'lenmiş çözümleme tekrar hesaplanmamalı")
+
+    monkeypatch.setattr(epint, "list_categories", fail)
+    monkeypatch.setattr(epint, "find_closest_match", fail)
+    monkeypatch.setattr(epint.os.path, "exists", fail)
+
+    assert epint.seffalik._category == "seffaflik-electricity"
+
+
+def test_misses_are_not_cached(monkeypatch):
+    assert not hasattr(epint, "qqqzzz")
+    assert "qqqzzz" not in epint._resolved_names
+
+    # Sonradan eklenen kategori bir önceki başarısız erişime rağmen çözülür
+    categories = epint.list_categories() + ["qqqzzz"]
+    monkeypatch.setattr(epint, "list_categories", lambda: categories)
+    EndpointModel.register_endpoint(
+        "qqqzzz", "sample_method", {"category": "qqqzzz", "parameters": []}
+    )
+    assert epint.qqqzzz._category == "qqqzzz"
+
+
+def test_resolution_cache_is_bounded_and_reset_on_refresh(monkeypatch):
+    monkeypatch.setattr(epint, "_RESOLVED_NAMES_LIMIT", 2)
+    epint.customer
+    epint.transparency
+    epint.invoice
+    assert list(epint._resolved_names) == ["invoice"]
+
+    epint.endpoints.refresh_categories()
+    epint.customer
+    assert list(epint._resolved_names) == ["customer"]
+
+
+def test_list_categories_reads_manifest_once(tmp_path, monkeypatch):
+    manifest = tmp_path / "manifest.json"
+    manifest.write_text('{"categories": ["customer", "gop"]}', encoding="utf-8")
+    monkeypatch.setattr(epint.endpoints, "get_manifest_path", lambda: str(manifest))
+    monkeypatch.setattr(epint.endpoints, "_categories", None)
+
+    assert epint.endpoints.list_categories() == ["customer", "gop"]
+    manifest.unlink()
+    assert epint.endpoints.list_categories() == ["customer", "gop"]
+
+
+def test_manifest_matches_category_directories(tmp_path, monkeypatch):
+    path = epint.endpoints.write_manifest(str(tmp_path / "manifest.json"))
+    monkeypatch.setattr(epint.endpoints, "get_manifest_path", lambda: path)
+    monkeypatch.setattr(epint.endpoints, "_categories", None)
+
+    assert epint.endpoints.list_categories() == sorted(
+        epint.endpoints.scan_categories()
+    )
+
+
 def test_category_proxy_without_auth_raises_runtime_error():
     EndpointModel.register_endpoint(
         "fakecat", "sample_method", {"category": "fakecat", "parameters": []}
@@ -68,3 +128,49 @@ def test_category_proxy_unknown_method_raises_attribute_error():
 
     with pytest.raises(AttributeError):
         proxy.completely_unrelated_endpoint_name
+
+
+def test_category_proxy_caches_resolved_endpoints(monkeypatch):
+    EndpointModel.register_endpoint(
+        "fakecat", "sample_method", {"category": "fakecat", "parameters": []}
+    )
+    epint.set_auth("user", "pass")
+    proxy = CategoryProxy("fakecat")
+
+    endpoint = proxy.sample_method
+    assert proxy.__dict__["sample_method"] is endpoint
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cache'lenmiş endpoint tekrar çözülmemeli")
+
+    monkeypatch.setattr(EndpointModel, "get_category_endpoints", fail)
+    assert proxy.sample_method is endpoint
+
+
+def test_category_proxy_shares_endpoint_across_spellings():
+    EndpointModel.register_endpoint(
+        "fakecat", "sample_method", {"category": "fakecat", "parameters": []}
+    )
+    epint.set_auth("user", "pass")
+    proxy = CategoryProxy("fakecat")
+
+    assert proxy.sampleMethod is proxy.sample_method
+    assert proxy.smaple_method is proxy.sample_method
+
+
+def test_category_proxy_reuses_the_category_matcher():
+    EndpointModel.register_endpoint(
+        "fakecat", "sample_method", {"category": "fakecat", "parameters": []}
+    )
+    epint.set_auth("user", "pass")
+    matcher = EndpointModel.get_name_matcher("fakecat")
+
+    assert CategoryProxy("fakecat").smaple_method._name == "sample_method"
+    assert EndpointModel.get_name_matcher("fakecat") is matcher
+
+    # Yeni endpoint kaydı matcher'ı yeniden kurdurur
+    EndpointModel.register_endpoint(
+        "fakecat", "other_method", {"category": "fakecat", "parameters": []}
+    )
+    assert EndpointModel.get_name_matcher("fakecat") is not matcher
+    assert CategoryProxy("fakecat").othr_method._name == "other_method"
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+import pytest
+from requests.exceptions import ConnectionError
+
+import epint
+from epint.modules.http_client import HTTPClient
+from epint.modules.http_client import time as http_time
+from epint.modules.http_client.circuit_breaker import (
+    BreakerPolicy,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+from epint.modules.http_client.retry_policy import OK, RATE_LIMITED, SERVER_ERROR
+
+URL = "https://seffaflik.epias.com.tr/electricity-service/v1/markets/dam/data/mcp"
+CAS_URL = "https://giris.epias.com.tr/cas/v1/tickets"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class ScriptedSession:
+    def __init__(self, results):
+        self._results = list(results)
+        self.calls = []
+
+    def request(self, **kwargs):
+        self.calls.append(kwargs)
+        result = self._results.pop(0) if len(self._results) > 1 else self._results[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+def _client(monkeypatch, results, **kwargs):
+    monkeypatch.setattr(http_time, "sleep", lambda seconds: None)
+    client = HTTPClient(rate_limit=False, retries=0, **kwargs)
+    session = ScriptedSession(results)
+    monkeypatch.setattr(client, "_get_session", lambda url: session)
+    return client, session
+
+
+def test_consecutive_failures_open_the_circuit():
+    breaker = CircuitBreaker("https://host", BreakerPolicy(failure_threshold=3))
+
+    for _ in range(2):
+        breaker.record(SERVER_ERROR)
+    breaker.record(OK)
+    for _ in range(3):
+        breaker.record(SERVER_ERROR)
+
+    assert breaker.state()["state"] == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+    assert breaker.state()["rejected"] == 1
+
+
+def test_error_rate_opens_the_circuit_and_rate_limits_do_not_count():
+    policy = BreakerPolicy(failure_threshold=3, error_rate=0.4, min_requests=10)
+    breaker = CircuitBreaker("https://host", policy)
+
+    for _ in range(5):
+        breaker.record(RATE_LIMITED)
+    assert breaker.state()["state"] == "closed"
+
+    for outcome in [SERVER_ERROR, SERVER_ERROR, OK] * 2:
+        breaker.record(outcome)
+
+    state = breaker.state()
+    assert state["state"] == "open"
+    assert state["window_requests"] == 10
+    assert state["window_failures"] == 4
+
+
+def test_half_open_allows_limited_probes_and_closes_on_success():
+    clock = FakeClock()
+    policy = BreakerPolicy(failure_threshold=1, open_seconds=30, half_open_probes=1)
+    breaker = CircuitBreaker("https://host", policy, clock=clock)
+    breaker.record(SERVER_ERROR)
+
+    clock.now += 10
+    with pytest.raises(CircuitOpenError) as exc_info:
+        breaker.allow()
+    assert exc_info.value.retry_after == pytest.approx(20)
+
+    clock.now += 20
+    breaker.allow()
+    assert breaker.state()["state"] == "half_open"
+    with pytest.raises(CircuitOpenError):
+        breaker.allow()
+
+    breaker.record(OK)
+    assert breaker.state()["state"] == "closed"
+    breaker.allow()
+
+
+def test_failed_probe_reopens_the_circuit():
+    clock = FakeClock()
+    breaker = CircuitBreaker(
+        "https://host", BreakerPolicy(failure_threshold=1, open_seconds=5), clock=clock
+    )
+    breaker.record(SERVER_ERROR)
+    clock.now += 5
+    breaker.allow()
+
+    breaker.record(SERVER_ERROR)
+
+    assert breaker.state()["state"] == "open"
+    assert breaker.state()["opened"] == 2
+
+
+def test_client_fails_fast_while_open(monkeypatch, fake_response):
+    CircuitBreaker.configure(BreakerPolicy(failure_threshold=2))
+    client, session = _client(monkeypatch, [ConnectionError("down")])
+
+    for _ in range(2):
+        with pytest.raises(ConnectionError):
+            client.get(URL)
+
+    with pytest.raises(CircuitOpenError, match="seffaflik.epias.com.tr") as exc_info:
+        client.get(URL)
+
+    assert len(session.calls) == 2
+    assert exc_info.value.retry_report.count == 0
+    assert not epint.is_host_available(URL)
+    assert epint.is_host_available(CAS_URL)
+
+
+def test_retries_stop_when_the_circuit_opens(monkeypatch, fake_response):
+    CircuitBreaker.configure(BreakerPolicy(failure_threshold=2))
+    client = HTTPClient(rate_limit=False, retries=5)
+    session = ScriptedSession([fake_response(status_code=503)])
+    monkeypatch.setattr(client, "_get_session", lambda url: session)
+    monkeypatch.setattr(http_time, "sleep", lambda seconds: None)
+
+    with pytest.raises(CircuitOpenError) as exc_info:
+        client.get(URL)
+
+    assert len(session.calls) == 2
+    assert exc_info.value.retry_report.count == 2
+
+
+def test_breakers_are_keyed_by_host_and_can_be_disabled(monkeypatch, fake_response):
+    CircuitBreaker.configure(BreakerPolicy(failure_threshold=1))
+    client, session = _client(monkeypatch, [fake_response(status_code=503)])
+    with pytest.raises(Exception):
+        client.get(CAS_URL)
+
+    states = {state["key"]: state for state in epint.get_circuit_breaker_state()}
+    assert states["https://giris.epias.com.tr"]["state"] == "open"
+
+    unguarded, session = _client(monkeypatch, [fake_response()], circuit_breaker=False)
+    assert unguarded.get(CAS_URL).status_code == 200
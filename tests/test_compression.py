@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+import gzip
+import json
+import threading
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from epint.models.response_model import ResponseModel
+from epint.modules.http_client import HTTPClient
+from epint.modules.http_client.compression import accept_encoding
+
+PAYLOAD = json.dumps(
+    {
+        "items": [
+            {"hour": "%02d:00" % (i % 24), "price": 2500.0 + i} for i in range(5000)
+        ]
+    }
+).encode("utf-8")
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """Accept-Encoding'e göre gzip/deflate veya düz JSON döndüren stub."""
+
+    seen = []
+
+    def do_GET(self):
+        encoding = self.headers.get("Accept-Encoding", "")
+        StubHandler.seen.append(encoding)
+        body = PAYLOAD
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if "gzip" in encoding:
+            body = gzip.compress(body)
+            self.send_header("Content-Encoding", "gzip")
+        elif "deflate" in encoding:
+            body = zlib.compress(body)
+            self.send_header("Content-Encoding", "deflate")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_url():
+    StubHandler.seen = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}/v1/markets/dam/data/mcp"
+    server.shutdown()
+    server.server_close()
+
+
+def test_accept_encoding_lists_supported_codecs():
+    encodings = accept_encoding().split(", ")
+    assert encodings[:2] == ["gzip", "deflate"]
+
+
+def test_compressed_body_is_decoded_to_bytes(stub_url):
+    client = HTTPClient(rate_limit=False, share_session=False)
+
+    response = client.get(stub_url)
+
+    assert "gzip" in StubHandler.seen[0]
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert type(response.content) is bytes
+    assert response.content == PAYLOAD
+    model = ResponseModel({"responses": {}}, response)
+    assert len(model.data["items"]) == 5000
+    client.close()
+
+
+def test_compression_can_be_disabled(stub_url):
+    client = HTTPClient(rate_limit=False, share_session=False, compress=False)
+
+    response = client.get(stub_url)
+
+    assert StubHandler.seen == ["identity"]
+    assert "Content-Encoding" not in response.headers
+    assert response.json()["items"][0]["hour"] == "00:00"
+    client.close()
+
+
+def test_stream_requests_leave_the_body_unread(stub_url):
+    client = HTTPClient(rate_limit=False, share_session=False)
+
+    response = client.get(stub_url, stream=True)
+
+    assert not response._content_consumed
+    assert b"".join(response.iter_content(1024)) == PAYLOAD
+    client.close()
@@ -0,0 +1,171 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import datetime
+import time
+
+import pytest
+
+import epint
+from epint.models.endpoint_callable import Endpoint
+from epint.modules.authentication.auth_manager import Authentication
+from epint.modules.http_client import HTTPClient
+from epint.modules.http_client import time as http_time
+from epint.modules.http_client.deadline import Deadline, DeadlineExceeded
+from epint.modules.http_client.rate_limiter import RateLimiter
+
+URL = "https://seffaflik.epias.com.tr/electricity-service/v1/markets/dam/data/mcp"
+
+
+class RecordingSession:
+    def __init__(self, response):
+        self._response = response
+        self.calls = []
+
+    def request(self, **kwargs):
+        self.calls.append(kwargs)
+        return self._response
+
+
+def _client(monkeypatch, response, **kwargs):
+    client = HTTPClient(**kwargs)
+    session = RecordingSession(response)
+    monkeypatch.setattr(client, "_get_session", lambda url: session)
+    return client, session
+
+
+def test_from_options_uses_the_earliest_limit():
+    assert Deadline.from_options() is None
+    assert Deadline.from_options(timeout_total=5).total == 5
+    in_two_seconds = datetime.datetime.now() + datetime.timedelta(seconds=2)
+    assert Deadline.from_options(
+        deadline=in_two_seconds, timeout_total=5
+    ).total == pytest.approx(2, abs=0.1)
+    assert Deadline.from_options(deadline=time.time() + 3).total == pytest.approx(
+        3, abs=0.1
+    )
+
+
+def test_attempt_timeout_is_capped_by_remaining_time(monkeypatch, fake_response):
+    client, session = _client(monkeypatch, fake_response(), timeout=(10, 60))
+
+    with Deadline(5).activate():
+        client.get(URL)
+
+    connect, read = session.calls[0]["timeout"]
+    assert connect <= 5 and read <= 5
+
+
+def test_expired_deadline_fails_before_sending(monkeypatch, fake_response):
+    client, session = _client(monkeypatch, fake_response())
+
+    with pytest.raises(DeadlineExceeded, match="HTTP isteği"):
+        client.get(URL, deadline=Deadline(0))
+
+    assert session.calls == []
+
+
+def test_retry_wait_beyond_deadline_raises_timeout(monkeypatch, fake_response):
+    sleeps = []
+    monkeypatch.setattr(http_time, "sleep", sleeps.append)
+    client, session = _client(
+        monkeypatch,
+        fake_response(status_code=429, headers={"RateLimit-Reset": "30"}),
+        rate_limit=False,
+    )
+
+    with pytest.raises(DeadlineExceeded) as exc_info:
+        client.get(URL, deadline=Deadline(2))
+
+    assert exc_info.value.response.status_code == 429
+    assert exc_info.value.retry_report.gave_up == "deadline"
+    assert sleeps == []
+
+
+def test_rate_limiter_wait_beyond_deadline_is_not_slept(monkeypatch, fake_response):
+    sleeps = []
+    monkeypatch.setattr(http_time, "sleep", sleeps.append)
+    RateLimiter.for_host("seffaflik.epias.com.tr").block(30)
+    client, session = _client(monkeypatch, fake_response())
+
+    with pytest.raises(DeadlineExceeded, match="rate limit"):
+        client.get(URL, deadline=Deadline(2))
+
+    assert sleeps == []
+    assert session.calls == []
+    assert RateLimiter.for_host("seffaflik.epias.com.tr").state()["pending"] == 0
+
+
+def _mcp_endpoint():
+    return {
+        "category": "seffaflik-electricity",
+        "method": "POST",
+        "basePath": "/electricity-service",
+        "path": "/v1/markets/dam/data/mcp",
+        "consumes": ["application/json"],
+        "produces": ["application/json"],
+        "parameters": [
+            {
+                "name": "body",
+                "in": "body",
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "endDate": {"type": "string", "format": "date-time"}
+                    },
+                },
+            }
+        ],
+    }
+
+
+def test_endpoint_deadline_reaches_ticket_requests(monkeypatch, fake_response):
+    epint._username = "user"
+    epint._password = "pass"
+    seen = []
+
+    def generate(self):
+        seen.append(Deadline.current())
+        return "TGT-1-cas"
+
+    monkeypatch.setattr(Authentication, "_generate_tgt", generate)
+    monkeypatch.setattr(
+        Authentication, "_validate_ticket", lambda self, code, kind: True
+    )
+    endpoint = Endpoint("seffaflik-electricity", "mcp", _mcp_endpoint())
+
+    request_model = endpoint(timeout_total=30, endDate="2026-01-01", debug=True)
+
+    assert seen[0] is not None and seen[0].total == 30
+    assert "timeout_total" not in request_model.json
+    assert Deadline.current() is None
+
+
+def test_expired_deadline_stops_ticket_creation(monkeypatch):
+    monkeypatch.setattr(
+        Authentication, "_generate_tgt", lambda self: pytest.fail("TGT istenmemeli")
+    )
+    auth = Authentication("user", "pass", "transparency", "prod")
+
+    with pytest.raises(DeadlineExceeded, match="TGT alma"):
+        auth.get_tgt(deadline=Deadline(0))
+
+
+class SlowAsyncClient:
+    auth = None
+
+    async def post(self, url, **kwargs):
+        await asyncio.sleep(5)
+
+
+def test_acall_is_cancelled_when_deadline_expires(monkeypatch):
+    epint._username = "user"
+    epint._password = "pass"
+    monkeypatch.setattr(Authentication, "get_tgt", lambda self: ("TGT-1-cas", None))
+    endpoint = Endpoint("seffaflik-electricity", "mcp", _mcp_endpoint())
+    endpoint.aclient = SlowAsyncClient()
+
+    started = time.perf_counter()
+    with pytest.raises(DeadlineExceeded, match="asenkron"):
+        asyncio.run(endpoint.acall(endDate="2026-01-01", timeout_total=0.1))
+
+    assert time.perf_counter() - started < 2
@@ -0,0 +1,217 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import io
+import sys
+import types
+
+import pytest
+import requests
+from requests.exceptions import ConnectionError
+
+import epint
+from epint.models.endpoint_callable import Endpoint
+from epint.models.response_model import ResponseModel
+from epint.modules.authentication.auth_manager import Authentication
+from epint.modules.http_client import HTTPClient
+from epint.modules.http_client.async_client import AsyncHTTPClient
+from epint.modules.http_client.download import DownloadReport
+
+XLSX = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+BODY = bytes(range(256)) * 4096  # 1 MB
+
+
+class BrokenRaw(io.BytesIO):
+    """İlk parçadan sonra bağlantısı kopan body."""
+
+    def read(self, size=-1):
+        if self.tell():
+            raise ConnectionError("bağlantı koptu")
+        return super().read(size)
+
+
+def _response(body=BODY, raw=None):
+    response = requests.Response()
+    response.status_code = 200
+    response.headers["Content-Type"] = XLSX
+    response.raw = raw if raw is not None else io.BytesIO(body)
+    return response
+
+
+class StreamSession:
+    def __init__(self, response):
+        self._response = response
+        self.calls = []
+
+    def request(self, **kwargs):
+        self.calls.append(kwargs)
+        return self._response
+
+
+def _export_endpoint():
+    return {
+        "category": "seffaflik-natural-gas",
+        "method": "POST",
+        "basePath": "/natural-gas-service",
+        "path": "/v1/transmission/data/consumer-count-export",
+        "consumes": ["application/json"],
+        "produces": [XLSX],
+        "parameters": [
+            {
+                "name": "body",
+                "in": "body",
+                "schema": {
+                    "type": "object",
+                    "properties": {"period": {"type": "string"}},
+                },
+            }
+        ],
+    }
+
+
+@pytest.fixture
+def endpoint(monkeypatch):
+    epint._username = "user"
+    epint._password = "pass"
+    monkeypatch.setattr(
+        Authentication, "get_tgt", lambda self, deadline=None: ("TGT-1-cas", None)
+    )
+    return Endpoint(
+        "seffaflik-natural-gas", "consumer_count_export", _export_endpoint()
+    )
+
+
+def _attach(monkeypatch, endpoint, response):
+    client = HTTPClient(rate_limit=False)
+    session = StreamSession(response)
+    monkeypatch.setattr(client, "_get_session", lambda url: session)
+    endpoint.client = client
+    return session
+
+
+def test_export_is_streamed_to_a_file(monkeypatch, endpoint, tmp_path):
+    session = _attach(monkeypatch, endpoint, _response())
+    target = tmp_path / "export.xlsx"
+
+    report = endpoint(period="2025-10-01", to=target)
+
+    assert isinstance(report, DownloadReport)
+    assert report.bytes == len(BODY)
+    assert report.path == str(target)
+    assert report.content_type == XLSX
+    assert report.throughput > 0
+    assert target.read_bytes() == BODY
+    assert not (tmp_path / "export.xlsx.part").exists()
+    assert session.calls[0]["stream"] is True
+    assert "to" not in session.calls[0]["data"].decode()
+
+
+def test_export_is_written_in_chunks_to_a_writer(monkeypatch, endpoint):
+    _attach(monkeypatch, endpoint, _response())
+    writes = []
+
+    class Sink:
+        def write(self, chunk):
+            writes.append(len(chunk))
+
+    report = endpoint(period="2025-10-01", to=Sink(), chunk_size=64 * 1024)
+
+    assert report.bytes == len(BODY)
+    assert report.path is None
+    assert max(writes) <= 64 * 1024
+    assert len(writes) == 16
+
+
+def test_interrupted_download_removes_the_partial_file(monkeypatch, endpoint, tmp_path):
+    _attach(monkeypatch, endpoint, _response(raw=BrokenRaw(BODY)))
+    target = tmp_path / "export.xlsx"
+
+    with pytest.raises(ConnectionError):
+        endpoint(period="2025-10-01", to=target, chunk_size=1024)
+
+    assert not target.exists()
+    assert not (tmp_path / "export.xlsx.part").exists()
+
+
+def test_acall_streams_without_blocking_the_loop(monkeypatch, endpoint, tmp_path):
+    client = AsyncHTTPClient(use_httpx=False, rate_limit=False)
+    session = StreamSession(_response())
+    monkeypatch.setattr(client, "_get_session", lambda url: session)
+    endpoint.aclient = client
+    target = tmp_path / "export.xlsx"
+
+    report = asyncio.run(endpoint.acall(period="2025-10-01", to=target))
+
+    assert report.bytes == len(BODY)
+    assert target.read_bytes() == BODY
+
+
+def test_acall_streams_httpx_responses_chunk_by_chunk(monkeypatch, endpoint, tmp_path):
+    class FakeHttpx(types.ModuleType):
+        class TimeoutException(Exception):
+            pass
+
+        class HTTPError(Exception):
+            pass
+
+        class Timeout:
+            def __init__(self, timeout, connect=None):
+                self.read, self.connect = timeout, connect
+
+    class StreamedResponse:
+        status_code = 200
+        headers = {"Content-Type": XLSX}
+
+        def __init__(self):
+            self.closed = False
+            self.chunks = 0
+
+        async def aiter_bytes(self, chunk_size):
+            for start in range(0, len(BODY), chunk_size):
+                self.chunks += 1
+                yield BODY[start : start + chunk_size]
+
+        async def aclose(self):
+            self.closed = True
+
+    class FakeClient:
+        def __init__(self):
+            self.sent = []
+            self.response = StreamedResponse()
+
+        def build_request(self, method, url, **kwargs):
+            return (method, url, kwargs)
+
+        async def send(self, request, stream=False, follow_redirects=True):
+            self.sent.append((request, stream))
+            return self.response
+
+        async def request(self, *args, **kwargs):
+            raise AssertionError("akışlı indirmede body tamponlanmamalı")
+
+    monkeypatch.setitem(sys.modules, "httpx", FakeHttpx("httpx"))
+    client = AsyncHTTPClient(use_httpx=True, rate_limit=False)
+    fake = FakeClient()
+    monkeypatch.setattr(client, "_get_httpx_client", lambda: fake)
+    endpoint.aclient = client
+    target = tmp_path / "export.xlsx"
+
+    report = asyncio.run(
+        endpoint.acall(period="2025-10-01", to=target, chunk_size=64 * 1024)
+    )
+
+    assert report.bytes == len(BODY)
+    assert target.read_bytes() == BODY
+    assert fake.sent[0][1] is True
+    assert fake.response.chunks == 16
+    assert fake.response.closed
+
+
+def test_binary_response_keeps_a_single_copy():
+    response = _response()
+    response._content = BODY
+
+    model = ResponseModel({}, response)
+
+    assert model.raw_data is response.content
+    assert model.data.getvalue() is response.content
+    assert model.data.read() == BODY
@@ -0,0 +1,278 @@
+# -*- coding: utf-8 -*-
+import json
+import os
+
+import pytest
+
+from epint.endpoints import compiler, get_endpoints_dir
+from epint.endpoints.compiler import (
+    INDEX_FILENAME,
+    compile_category,
+    get_index_path,
+    load_index,
+)
+from epint.endpoints.registry_image import build_image, open_image
+from epint.models import endpoint_registry
+from epint.models.endpoint_registry import EndpointModel
+from epint.models.swagger import SwaggerModel, to_lean_endpoint
+from epint.modules.category_proxy import CategoryProxy
+
+
+@pytest.fixture
+def swagger_path(tmp_path):
+    spec = {
+        "host": "example.epias.com.tr",
+        "basePath": "/example-servis/rest",
+        "definitions": {
+            "QueryRequest": {
+                "type": "object",
+                "properties": {
+                    "startDate": {
+                        "type": "string",
+                        "format": "date-time",
+                        "description": "Başlangıç tarihi",
+                        "example": "2026-01-01T00:00:00+03:00",
+                    },
+                    "description": {"type": "string"},
+                },
+            },
+        },
+        "paths": {
+            "/data/mcp-data": {
+                "post": {
+                    "operationId": "mcp-data",
+                    "summary": "PTF verisi",
+                    "consumes": ["application/json"],
+                    "produces": ["application/json"],
+                    "parameters": [
+                        {
+                            "name": "body",
+                            "in": "body",
+                            "schema": {"$ref": "#/definitions/QueryRequest"},
+                        }
+                    ],
+                    "responses": {"200": {"description": "ok"}},
+                }
+            },
+        },
+    }
+    category_dir = tmp_path / "example"
+    category_dir.mkdir()
+    path = category_dir / "swagger.json"
+    path.write_text(json.dumps(spec), encoding="utf-8")
+    return str(path)
+
+
+def test_index_path_is_next_to_swagger(swagger_path):
+    assert get_index_path(swagger_path).endswith(INDEX_FILENAME)
+
+
+def test_compiled_index_matches_swagger_model(swagger_path):
+    index_path = compile_category("example", swagger_path)
+    index = load_index(index_path, swagger_path)
+
+    expected = {
+        **SwaggerModel(swagger_path).get_endpoint("mcp_data"),
+        "category": "example",
+    }
+
+    assert index["host"] == "example.epias.com.tr"
+    assert index["endpoints"]["mcp_data"] == expected
+    assert index["method_names"] == {"mcp_data": "mcp_data"}
+
+
+def test_stale_index_is_ignored(swagger_path):
+    index_path = compile_category("example", swagger_path)
+    with open(swagger_path, "a", encoding="utf-8") as f:
+        f.write("\n")
+
+    assert load_index(index_path, swagger_path) is None
+
+
+def test_same_size_edit_invalidates_index(swagger_path):
+    index_path = compile_category("example", swagger_path)
+    with open(swagger_path, encoding="utf-8") as f:
+        text = f.read()
+    with open(swagger_path, "w", encoding="utf-8") as f:
+        f.write(text.replace("mcp-data", "mcp-date"))
+    stat = os.stat(swagger_path)
+    os.utime(swagger_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert load_index(index_path, swagger_path) is None
+
+
+def test_touched_but_unchanged_source_keeps_index(swagger_path, monkeypatch):
+    index_path = compile_category("example", swagger_path)
+    stat = os.stat(swagger_path)
+    os.utime(swagger_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    assert load_index(index_path, swagger_path) is not None
+
+    # Doğrulanan (boyut, mtime) kaydedilir; sonraki yüklemeler dosyayı hash'lemez
+    def fail(path):
+        raise AssertionError("doğrulanmış kaynak tekrar hash'lenmemeli")
+
+    monkeypatch.setattr(compiler, "_file_digest", fail)
+    assert load_index(index_path, swagger_path) is not None
+
+
+def test_corrupt_index_is_ignored(swagger_path):
+    index_path = get_index_path(swagger_path)
+    with open(index_path, "wb") as f:
+        f.write(b"not a pickle")
+
+    assert load_index(index_path, swagger_path) is None
+
+
+def test_registry_loads_from_index_without_parsing_json(swagger_path, monkeypatch):
+    compile_category("example", swagger_path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("index varken swagger.json parse edilmemeli")
+
+    monkeypatch.setattr(endpoint_registry, "SwaggerModel", fail)
+    EndpointModel.load_swagger("example", swagger_path)
+
+    endpoint = EndpointModel.get_category_endpoints("example")["mcp_data"]
+    assert endpoint["category"] == "example"
+    assert EndpointModel.get_method_names("example") == {"mcp_data": "mcp_data"}
+
+
+def test_registry_falls_back_to_json_without_index(swagger_path):
+    EndpointModel.load_swagger("example", swagger_path)
+
+    assert "mcp_data" in EndpointModel.get_category_endpoints("example")
+    assert EndpointModel.get_swagger_model("example") is not None
+
+
+def test_json_fallback_resolves_only_touched_endpoints(swagger_path):
+    EndpointModel.load_swagger("example", swagger_path)
+    endpoints = EndpointModel.get_category_endpoints("example")
+
+    assert dir(CategoryProxy("example")) == ["mcp_data"]
+    assert not endpoints.is_resolved("mcp_data")
+
+    endpoint = EndpointModel.get_endpoint("example", "mcp_data")
+    assert endpoint._data["category"] == "example"
+    assert endpoints.is_resolved("mcp_data")
+
+
+@pytest.mark.parametrize("compiled", [True, False])
+def test_lean_registry_drops_documentation_and_raw_spec(swagger_path, compiled):
+    if compiled:
+        compile_category("example", swagger_path)
+    EndpointModel.set_lean(True)
+    EndpointModel.load_swagger("example", swagger_path)
+
+    assert "example" not in EndpointModel._swagger_models
+    endpoint = EndpointModel.get_category_endpoints("example")["mcp_data"]
+    assert "summary" not in endpoint
+    properties = endpoint["parameters"][0]["schema"]["properties"]
+    assert properties["startDate"] == {"type": "string", "format": "date-time"}
+    # 'description' isimli field dokümantasyon alanı değil, korunmalı
+    assert properties["description"] == {"type": "string"}
+
+
+def test_lean_memo_is_safe_across_freed_sources():
+    memo = {}
+    for i in range(200):
+        # Her kaynak döngü sonunda serbest kalır; id'ler tekrar kullanılabilir
+        lean = to_lean_endpoint(
+            {"path": f"/p{i}", "schema": {"type": "object", "x": i}}, memo
+        )
+        assert lean["path"] == f"/p{i}"
+        assert lean["schema"]["x"] == i
+
+
+def test_lean_endpoint_repr_loads_documentation_on_demand(swagger_path):
+    EndpointModel.set_lean(True)
+    EndpointModel.load_swagger("example", swagger_path)
+
+    endpoint = EndpointModel.get_endpoint("example", "mcp_data")
+    assert "Summary: PTF verisi" in repr(endpoint)
+
+
+@pytest.fixture
+def image_path(swagger_path, tmp_path):
+    return build_image(
+        str(tmp_path / "registry.image"), swagger_paths={"example": swagger_path}
+    )
+
+
+def test_registry_image_round_trips_endpoints(swagger_path, image_path):
+    image = open_image(image_path)
+
+    expected = SwaggerModel(swagger_path, category="example").get_endpoint("mcp_data")
+    assert image.get_categories() == ["example"]
+    assert image.get_endpoint("example", "mcp_data") == expected
+    assert image.get_method_names("example") == {"mcp_data": "mcp_data"}
+    image.close()
+
+
+def test_invalid_registry_image_is_ignored(tmp_path):
+    path = tmp_path / "registry.image"
+    path.write_bytes(b"not an image")
+
+    assert open_image(str(path)) is None
+    assert open_image(str(tmp_path / "missing.image")) is None
+    assert EndpointModel.use_registry_image(str(path)) is False
+
+
+def test_registry_reads_lazily_from_image(swagger_path, image_path, monkeypatch):
+    assert EndpointModel.use_registry_image(image_path)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("imaj varken swagger.json parse edilmemeli")
+
+    monkeypatch.setattr(endpoint_registry, "SwaggerModel", fail)
+    EndpointModel.load_swagger("example", swagger_path)
+    endpoints = EndpointModel.get_category_endpoints("example")
+
+    assert dir(CategoryProxy("example")) == ["mcp_data"]
+    assert not endpoints.is_resolved("mcp_data")
+
+    endpoint = EndpointModel.get_endpoint("example", "mcp_data")
+    assert endpoint._data["category"] == "example"
+    assert endpoints.is_resolved("mcp_data")
+    assert "Summary: PTF verisi" in repr(endpoint)
+
+
+def test_stale_registry_image_falls_back_to_json(swagger_path, image_path):
+    with open(swagger_path, "a", encoding="utf-8") as f:
+        f.write("\n")
+
+    EndpointModel.use_registry_image(image_path)
+    EndpointModel.load_swagger("example", swagger_path)
+
+    assert EndpointModel.get_swagger_model("example") is not None
+    assert "mcp_data" in EndpointModel.get_category_endpoints("example")
+
+
+def test_lean_registry_image_drops_documentation(swagger_path, image_path):
+    EndpointModel.set_lean(True)
+    EndpointModel.use_registry_image(image_path)
+    EndpointModel.load_swagger("example", swagger_path)
+
+    endpoint = EndpointModel.get_endpoint("example", "mcp_data")
+    assert "summary" not in endpoint._data
+    assert "Summary: PTF verisi" in repr(endpoint)
+
+
+def test_lean_image_keeps_each_endpoint_distinct(tmp_path):
+    categories = ["gunici", "seffaflik-electricity"]
+    image_path = build_image(str(tmp_path / "registry.image"), categories=categories)
+    image = open_image(image_path)
+    EndpointModel.set_lean(True)
+    EndpointModel.use_registry_image(image_path)
+
+    for category in categories:
+        EndpointModel.load_swagger(
+            category, os.path.join(get_endpoints_dir(), category, "swagger.json")
+        )
+        for name in list(EndpointModel.get_category_endpoints(category)):
+            expected = image.get_endpoint(category, name)
+            data = EndpointModel.get_endpoint(category, name)._data
+            assert (data["path"], data["method"]) == (
+                expected["path"],
+                expected["method"],
+            ), f"{category}.{name}"
@@ -1,5 +1,13 @@
 # -*- coding: utf-8 -*-
-from epint.modules.search.find_closest import dict_key_search, find_closest_match
+from difflib import SequenceMatcher
+
+import pytest
+
+from epint.modules.search.find_closest import (
+    FuzzyMatcher,
+    dict_key_search,
+    find_closest_match,
+)
 
 
 def test_exact_case_insensitive_match_wins_over_fuzzy():
@@ -46,3 +54,69 @@ def test_dict_key_search_no_match_returns_none_and_leaves_dict_untouched():
     result = dict_key_search(["debug"], d)
     assert result is None
     assert d == {"foo": 1}
+
+
+def _linear_closest_match(target, candidates, threshold):
+    for candidate in candidates:
+        if candidate.lower() == target.lower():
+            return candidate
+    best_match, best_ratio = None, 0.0
+    for candidate in candidates:
+        ratio = SequenceMatcher(None, target, candidate).ratio()
+        if ratio > best_ratio and ratio >= threshold:
+            best_match, best_ratio = candidate, ratio
+    return best_match
+
+
+CANDIDATES = [
+    "mcp_data",
+    "mcp_data_export",
+    "smp_data",
+    "interim_mcp",
+    "bilateral_contract_buy",
+    "bilateral_contract_sell",
+    "region_code",
+    "organization_list",
+]
+
+
+@pytest.mark.parametrize(
+    "target",
+    ["mcpdata", "smp", "mcp_dta", "bilateralcontract", "regionCod", "org", "zzz"],
+)
+@pytest.mark.parametrize("threshold", [0.5, 0.6, 0.7])
+def test_matcher_agrees_with_linear_scan(target, threshold):
+    matcher = FuzzyMatcher(CANDIDATES)
+    assert matcher.find(target, threshold) == _linear_closest_match(
+        target, CANDIDATES, threshold
+    )
+
+
+@pytest.mark.parametrize(
+    "target, candidates, threshold",
+    [
+        ("segment", ["seg"], 0.6),
+        ("abcd", ["ab"], 2 / 3),
+        ("abcdefghij", ["abc"], 6 / 13),
+    ],
+)
+def test_candidates_exactly_at_the_threshold_are_kept(target, candidates, threshold):
+    expected = _linear_closest_match(target, candidates, threshold)
+    assert expected is not None
+    assert FuzzyMatcher(candidates).find(target, threshold) == expected
+
+
+def test_matcher_prefers_first_candidate_on_ties():
+    assert FuzzyMatcher(["abx", "aby"]).find("abz", 0.5) == "abx"
+
+
+def test_matcher_is_reused_and_results_are_memoized(monkeypatch):
+    matcher = FuzzyMatcher.for_candidates(CANDIDATES)
+    assert FuzzyMatcher.for_candidates(list(CANDIDATES)) is matcher
+    assert matcher.find("mcp_dta", 0.6) == "mcp_data"
+
+    def fail(*args, **kwargs):
+        raise AssertionError("memoize edilmiş sorgu tekrar hesaplanmamalı")
+
+    monkeypatch.setattr(matcher, "_find_fuzzy", fail)
+    assert matcher.find("mcp_dta", 0.6) == "mcp_data"
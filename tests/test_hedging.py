@@ -0,0 +1,170 @@
+# -*- coding: utf-8 -*-
+import asyncio
+import threading
+import time
+
+import pytest
+
+import epint
+from epint.models.endpoint_callable import Endpoint
+from epint.modules.authentication.auth_manager import Authentication
+from epint.modules.http_client import HTTPClient
+from epint.modules.http_client.async_client import AsyncHTTPClient
+from epint.modules.http_client.hedging import HedgePolicy, Hedging, LatencyTracker
+from epint.modules.http_client.rate_limiter import RateLimiter
+
+URL = "https://seffaflik.epias.com.tr/electricity-service/v1/markets/dam/data/mcp"
+FAST_HEDGE = HedgePolicy(initial_delay=0.05, min_delay=0.01)
+
+
+class SlowFirstSession:
+    """İlk isteği geciktiren, sonrakileri hemen cevaplayan session."""
+
+    def __init__(self, first_delay, responses):
+        self._first_delay = first_delay
+        self._responses = list(responses)
+        self._lock = threading.Lock()
+        self.calls = 0
+
+    def request(self, **kwargs):
+        with self._lock:
+            index = self.calls
+            self.calls += 1
+        if index == 0:
+            time.sleep(self._first_delay)
+        return self._responses[min(index, len(self._responses) - 1)]
+
+
+def _client(monkeypatch, session, cls=HTTPClient, **kwargs):
+    client = cls(hedge=FAST_HEDGE, **kwargs)
+    monkeypatch.setattr(client, "_get_session", lambda url: session)
+    return client
+
+
+def test_slow_request_is_hedged_and_fastest_answer_wins(monkeypatch, fake_response):
+    session = SlowFirstSession(
+        0.5, [fake_response(text="slow"), fake_response(text="fast")]
+    )
+    client = _client(monkeypatch, session)
+
+    started = time.perf_counter()
+    response = client.post(URL)
+
+    assert response.text == "fast"
+    assert response.retry_report.hedges == 1
+    assert time.perf_counter() - started < 0.4
+
+
+def test_fast_request_is_not_hedged(monkeypatch, fake_response):
+    session = SlowFirstSession(0.0, [fake_response()])
+    client = _client(monkeypatch, session)
+
+    response = client.post(URL)
+
+    assert response.retry_report.hedges == 0
+    assert session.calls == 1
+
+
+@pytest.mark.parametrize("cls", [HTTPClient, AsyncHTTPClient])
+def test_client_hedge_policy_is_not_applied_outside_transparency(
+    monkeypatch, fake_response, cls
+):
+    session = SlowFirstSession(0.2, [fake_response()])
+    client = _client(monkeypatch, session, cls=cls)
+    url = "https://epys.epias.com.tr/reconciliation-bpm/v1/bpm/update"
+
+    response = client.post(url)
+    if cls is AsyncHTTPClient:
+        response = asyncio.run(response)
+
+    assert session.calls == 1
+    assert response.retry_report.hedges == 0
+
+
+def test_hedge_is_skipped_without_rate_limit_tokens(monkeypatch, fake_response):
+    limiter = RateLimiter.for_host("seffaflik.epias.com.tr")
+    limiter.reserve()
+    limiter.update(
+        {"RateLimit-Limit": "10", "RateLimit-Remaining": "1", "RateLimit-Reset": "10"}
+    )
+    session = SlowFirstSession(0.2, [fake_response()])
+    client = _client(monkeypatch, session)
+
+    response = client.post(URL)
+
+    assert response.retry_report.hedges == 0
+    assert session.calls == 1
+
+
+def test_async_hedge_returns_fastest_answer(monkeypatch, fake_response):
+    session = SlowFirstSession(
+        0.5, [fake_response(text="slow"), fake_response(text="fast")]
+    )
+    client = _client(monkeypatch, session, cls=AsyncHTTPClient, use_httpx=False)
+
+    response = asyncio.run(client.post(URL))
+
+    assert response.text == "fast"
+    assert response.retry_report.hedges == 1
+
+
+def test_delay_follows_observed_percentile():
+    tracker = LatencyTracker(("host", "/path"))
+    policy = HedgePolicy(min_samples=20)
+    assert policy.delay(tracker) == policy.initial_delay
+
+    for latency in [0.1] * 19 + [3.0]:
+        tracker.record(latency)
+
+    assert policy.delay(tracker) == pytest.approx(0.1)
+    assert HedgePolicy(percentile=0.99).delay(tracker) == pytest.approx(3.0)
+
+
+def test_hedging_is_limited_to_transparency_categories():
+    with pytest.raises(ValueError):
+        Hedging.enable(["epys"])
+
+    epint.set_hedging("transparency")
+    assert Hedging.policy_for("seffaflik-electricity") is not None
+    assert Hedging.policy_for("seffaflik-natural-gas") is None
+
+    epint.set_hedging("seffaflik")
+    assert Hedging.policy_for("seffaflik-natural-gas") is not None
+
+    epint.set_hedging(["seffaflik", "transparency"], enabled=False)
+    assert Hedging.enabled_categories() == []
+
+
+class RecordingClient:
+    def __init__(self, response):
+        self.auth = None
+        self.calls = []
+        self._response = response
+
+    def post(self, url, **kwargs):
+        self.calls.append(kwargs)
+        return self._response
+
+
+def test_endpoint_passes_hedge_policy_for_enabled_category(monkeypatch, fake_response):
+    epint._username = "user"
+    epint._password = "pass"
+    monkeypatch.setattr(Authentication, "get_tgt", lambda self: ("TGT-1-cas", None))
+    endpoint = Endpoint(
+        "seffaflik-electricity",
+        "mcp",
+        {
+            "category": "seffaflik-electricity",
+            "method": "POST",
+            "path": "/v1/markets/dam/data/mcp",
+            "parameters": [],
+        },
+    )
+    client = endpoint.client = RecordingClient(fake_response(content=b"{}"))
+
+    endpoint()
+    epint.set_hedging("seffaflik-electricity", policy=FAST_HEDGE)
+    endpoint()
+
+    assert "hedge" not in client.calls[0]
+    assert client.calls[1]["hedge"] is FAST_HEDGE
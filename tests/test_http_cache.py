@@ -0,0 +1,132 @@
+# -*- coding: utf-8 -*-
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+import epint
+from epint.models.endpoint_callable import Endpoint
+from epint.modules.http_client import HTTPClient
+from epint.modules.http_client.http_cache import CachePolicy, Caching, HTTPCache
+
+PAYLOAD = json.dumps({"items": [{"id": 1, "name": "BARAJ"}]}).encode("utf-8")
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    """/etag ETag'li, /plain validator'sız cevap döndüren stub."""
+
+    requests = []
+    etag = '"v1"'
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        self.rfile.read(length)
+        StubHandler.requests.append((self.path, dict(self.headers)))
+        if self.path == "/etag" and self.headers.get("If-None-Match") == self.etag:
+            self.send_response(304)
+            self.send_header("ETag", self.etag)
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        if self.path == "/etag":
+            self.send_header("ETag", self.etag)
+        self.send_header("Content-Length", str(len(PAYLOAD)))
+        self.end_headers()
+        self.wfile.write(PAYLOAD)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_url():
+    StubHandler.requests = []
+    StubHandler.etag = '"v1"'
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubHandler)
+    thread = threading.Thread(target=server.serve_forever, args=(0.05,), daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def _client(store, ttl=None):
+    return HTTPClient(
+        rate_limit=False,
+        share_session=False,
+        cache=CachePolicy(ttl=ttl, store=store),
+    )
+
+
+def test_etag_is_revalidated_and_304_is_served_from_store(stub_url, tmp_path):
+    store = HTTPCache(tmp_path / "cache")
+    client = _client(store)
+
+    first = client.post(stub_url + "/etag", json={"date": "2026-01-01"})
+    second = client.post(stub_url + "/etag", json={"date": "2026-01-01"})
+
+    assert first.json() == second.json()
+    assert getattr(first, "from_cache", False) is False
+    assert second.from_cache is True
+    assert second.status_code == 200
+    assert StubHandler.requests[1][1]["If-None-Match"] == '"v1"'
+    assert store.state()["revalidated"] == 1
+
+
+def test_changed_resource_is_downloaded_again(stub_url, tmp_path):
+    client = _client(HTTPCache(tmp_path / "cache"))
+    client.post(stub_url + "/etag", json={})
+
+    StubHandler.etag = '"v2"'
+    response = client.post(stub_url + "/etag", json={})
+
+    assert not getattr(response, "from_cache", False)
+    assert response.headers["ETag"] == '"v2"'
+
+
+def test_ttl_is_used_when_the_server_sends_no_validators(stub_url, tmp_path):
+    client = _client(HTTPCache(tmp_path / "cache"), ttl=3600)
+
+    client.post(stub_url + "/plain", json={})
+    cached = client.post(stub_url + "/plain", json={})
+    other = client.post(stub_url + "/plain", json={"region": "TR1"})
+
+    assert cached.from_cache is True
+    assert len(StubHandler.requests) == 2
+    assert not getattr(other, "from_cache", False)
+
+
+def test_responses_without_validators_or_ttl_are_not_stored(stub_url, tmp_path):
+    client = _client(HTTPCache(tmp_path / "cache"))
+
+    client.post(stub_url + "/plain", json={})
+    client.post(stub_url + "/plain", json={})
+
+    assert len(StubHandler.requests) == 2
+    assert "If-None-Match" not in StubHandler.requests[1][1]
+
+
+def test_entries_are_shared_across_processes_through_the_directory(stub_url, tmp_path):
+    _client(HTTPCache(tmp_path / "cache")).post(stub_url + "/etag", json={})
+
+    # Yeni bir process'teki gibi boş belleğe sahip depo
+    response = _client(HTTPCache(tmp_path / "cache")).post(stub_url + "/etag", json={})
+
+    assert response.from_cache is True
+    assert response.json() == json.loads(PAYLOAD)
+
+
+def test_set_http_cache_targets_single_endpoints():
+    epint.set_http_cache(["transparency.powerplant_list", "reporting"], ttl=60)
+
+    assert Caching.policy_for("seffaflik-electricity", "powerplant_list").ttl == 60
+    assert Caching.policy_for("seffaflik-electricity", "mcp") is None
+    assert Caching.policy_for("seffaflik-reporting", "anything") is not None
+
+    endpoint = Endpoint("seffaflik-electricity", "powerplant_list", {})
+    assert endpoint._with_cache({})["cache"].ttl == 60
+
+    epint.set_http_cache("transparency.powerplant_list", enabled=False)
+    assert Caching.policy_for("seffaflik-electricity", "powerplant_list") is None
@@ -0,0 +1,46 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+from epint.modules.http_client import HTTPClient
+
+
+@pytest.fixture(autouse=True)
+def isolated_session_pool(monkeypatch):
+    monkeypatch.setattr(HTTPClient, "_shared_sessions", {})
+    yield
+    HTTPClient.close_shared_sessions()
+
+
+def test_clients_share_session_per_host():
+    first = HTTPClient()._get_session("https://seffaflik.epias.com.tr/a")
+    second = HTTPClient()._get_session("https://seffaflik.epias.com.tr/b")
+    other_host = HTTPClient()._get_session("https://epys.epias.com.tr/a")
+
+    assert first is second
+    assert first is not other_host
+
+
+def test_clients_with_different_settings_do_not_share_session():
+    default = HTTPClient()._get_session("https://seffaflik.epias.com.tr/a")
+    custom = HTTPClient(headers={"X-Test": "1"})._get_session(
+        "https://seffaflik.epias.com.tr/a"
+    )
+
+    assert default is not custom
+    assert custom.headers["X-Test"] == "1"
+
+
+def test_context_manager_keeps_shared_session_open():
+    with HTTPClient() as client:
+        session = client._get_session("https://seffaflik.epias.com.tr/a")
+
+    assert HTTPClient()._get_session("https://seffaflik.epias.com.tr/a") is session
+
+
+def test_private_session_is_closed_on_exit():
+    with HTTPClient(share_session=False) as client:
+        session = client._get_session("https://seffaflik.epias.com.tr/a")
+        assert session is client._session
+
+    assert client._session is None
+    assert HTTPClient._shared_sessions == {}
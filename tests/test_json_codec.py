@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+import importlib.util
+
+import pytest
+
+from epint.modules.error_handler import ErrorHandler
+from epint.modules.http_client import HTTPClient
+from epint.modules.json_codec import BACKENDS, JsonCodec
+
+INSTALLED_BACKENDS = [
+    name
+    for name in BACKENDS
+    if name == "json" or importlib.util.find_spec(name) is not None
+]
+
+
+@pytest.fixture(autouse=True)
+def restore_backend():
+    backend = JsonCodec.get_backend()
+    yield
+    JsonCodec.set_backend(backend)
+
+
+@pytest.mark.parametrize("backend", INSTALLED_BACKENDS)
+def test_backends_round_trip_to_bytes(backend):
+    JsonCodec.set_backend(backend)
+    payload = {"region": "TR1", "name": "Doğalgaz", "items": [1, 2.5, None, True]}
+
+    encoded = JsonCodec.dumps(payload)
+
+    assert isinstance(encoded, bytes)
+    assert JsonCodec.loads(encoded) == payload
+
+
+def test_default_backend_is_first_installed():
+    JsonCodec._backend = None
+    assert JsonCodec.get_backend() == INSTALLED_BACKENDS[0]
+
+
+def test_unknown_backend_is_rejected():
+    with pytest.raises(ValueError):
+        JsonCodec.set_backend("simplejson2")
+
+
+@pytest.mark.parametrize("backend", INSTALLED_BACKENDS)
+def test_large_integers_fall_back_to_stdlib(backend):
+    JsonCodec.set_backend(backend)
+    assert JsonCodec.loads(JsonCodec.dumps({"id": 2**70})) == {"id": 2**70}
+
+
+def _count_loads(monkeypatch):
+    calls = []
+    original_loads = JsonCodec._loads
+    monkeypatch.setattr(
+        JsonCodec, "_loads", lambda data: calls.append(data) or original_loads(data)
+    )
+    return calls
+
+
+def test_decode_response_parses_content_once(fake_response, monkeypatch):
+    response = fake_response(content=b'{"items": [{"price": 1.5}]}')
+    calls = _count_loads(monkeypatch)
+
+    assert JsonCodec.decode_response(response) == {"items": [{"price": 1.5}]}
+    assert JsonCodec.decode_response(response) is JsonCodec.decode_response(response)
+    assert len(calls) == 1
+
+
+def test_decode_response_caches_failures(fake_response):
+    response = fake_response(content=b"<html>error</html>")
+    with pytest.raises(ValueError):
+        JsonCodec.decode_response(response)
+    with pytest.raises(ValueError):
+        JsonCodec.decode_response(response)
+
+
+def test_error_handler_reuses_decoded_body(fake_response, monkeypatch):
+    response = fake_response(
+        status_code=401, content=b'{"errors": [{"errorCode": "AUTH009"}]}'
+    )
+    calls = _count_loads(monkeypatch)
+
+    ErrorHandler().handle_exception(Exception("401"), response)
+
+    assert len(calls) == 1
+
+
+def test_http_client_sends_json_body_as_bytes(monkeypatch, fake_response):
+    sent = {}
+
+    class Session:
+        def request(self, **kwargs):
+            sent.update(kwargs)
+            return fake_response()
+
+    client = HTTPClient()
+    monkeypatch.setattr(client, "_get_session", lambda url: Session())
+    client.post("https://seffaflik.epias.com.tr/x", json={"region": "TR1"})
+
+    assert "json" not in sent
+    assert JsonCodec.loads(sent["data"]) == {"region": "TR1"}
+    assert sent["headers"]["Content-Type"] == "application/json"
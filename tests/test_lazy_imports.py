@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+import subprocess
+import sys
+
+import pytest
+
+import epint
+
+
+@pytest.mark.parametrize("module", ["requests", "urllib3", "zoneinfo", "difflib"])
+def test_import_epint_defers_heavy_modules(module):
+    code = f"import sys, epint; sys.exit({module!r} in sys.modules)"
+    assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+def test_lazy_public_attributes_resolve():
+    from epint.modules.datetime import DateTimeUtils
+
+    assert epint.DateTimeUtils is DateTimeUtils
+
+
+def test_endpoint_client_is_created_on_first_access():
+    from epint.models.endpoint_callable import Endpoint
+    from epint.modules.http_client import HTTPClient
+
+    endpoint = Endpoint("fakecat", "sample_method", {"parameters": []})
+    assert endpoint._client is None
+    assert isinstance(endpoint.client, HTTPClient)
+    assert endpoint.client is endpoint.client
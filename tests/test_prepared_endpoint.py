@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import epint
+from epint.models.endpoint_callable import Endpoint
+from epint.models.prepared_endpoint import PreparedEndpoint
+from epint.models.request_model import RequestModel
+from epint.modules.authentication.auth_manager import Authentication
+
+
+class RecordingClient:
+    """HTTPClient yerine geçen, gönderilen istekleri kaydeden client."""
+
+    def __init__(self, response):
+        self.auth = None
+        self.calls = []
+        self._response = response
+
+    def post(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return self._response
+
+
+@pytest.fixture
+def authenticated(monkeypatch):
+    epint._username = "user"
+    epint._password = "pass"
+    monkeypatch.setattr(Authentication, "get_tgt", lambda self: ("TGT-1-cas", None))
+    monkeypatch.setattr(
+        Authentication, "get_st", lambda self, service: ("ST-1-cas", None)
+    )
+
+
+def _mcp_endpoint():
+    return {
+        "category": "seffaflik-electricity",
+        "method": "POST",
+        "basePath": "/electricity-service",
+        "path": "/v1/markets/dam/data/mcp",
+        "consumes": ["application/json"],
+        "produces": ["application/json"],
+        "parameters": [
+            {
+                "name": "body",
+                "in": "body",
+                "schema": {
+                    "type": "object",
+                    "properties": {
+                        "startDate": {"type": "string", "format": "date-time"},
+                        "endDate": {"type": "string", "format": "date-time"},
+                        "region": {"type": "string"},
+                        "page": {"type": "object"},
+                    },
+                },
+            }
+        ],
+    }
+
+
+def test_prepare_returns_prepared_endpoint(authenticated):
+    endpoint = Endpoint("seffaflik-electricity", "mcp", _mcp_endpoint())
+    prepared = endpoint.prepare(region="TR1")
+    assert isinstance(prepared, PreparedEndpoint)
+    assert prepared.static == {"region": "TR1"}
+    assert prepared.url.endswith("/electricity-service/v1/markets/dam/data/mcp")
+
+
+def test_prepared_request_matches_direct_request(authenticated):
+    data = _mcp_endpoint()
+    prepared = Endpoint("seffaflik-electricity", "mcp", data).prepare(
+        Region="TR1", debug=True
+    )
+    request_model = prepared(startDate="2026-01-01", endDate="2026-01-02")
+    direct = RequestModel(
+        data, {"Region": "TR1", "startDate": "2026-01-01", "endDate": "2026-01-02"}
+    )
+    assert request_model.json == direct.json
+    assert request_model.headers["TGT"] == "TGT-1-cas"
+
+
+def test_varying_kwargs_override_static_and_do_not_leak(authenticated):
+    prepared = Endpoint("seffaflik-electricity", "mcp", _mcp_endpoint()).prepare(
+        region="TR1", page={"number": 1}, debug=True
+    )
+    first = prepared(startDate="2026-01-01", region="TR2", page={"number": 3})
+    second = prepared(startDate="2026-01-02")
+    assert first.json["region"] == "TR2"
+    assert first.json["page"] == {"number": 3, "size": 1000, "limit": 1000}
+    assert second.json["region"] == "TR1"
+    assert second.json["page"] == {"number": 1, "size": 1000, "limit": 1000}
+    assert second.json["startDate"] == "2026-01-02T00:00:00+03:00"
+
+
+def test_prepared_call_sends_through_client(authenticated, fake_response):
+    endpoint = Endpoint("seffaflik-electricity", "mcp", _mcp_endpoint())
+    client = RecordingClient(
+        fake_response(
+            json_data={"items": [{"price": 1.0}]},
+            headers={"Content-Type": "application/json"},
+        )
+    )
+    endpoint.client = client
+    prepared = endpoint.prepare(region="TR1")
+
+    prepared(startDate="2026-01-01")
+    prepared(startDate="2026-01-02")
+
+    assert len(client.calls) == 2
+    urls = {url for url, _ in client.calls}
+    assert urls == {prepared.url}
+    bodies = [kwargs["json"] for _, kwargs in client.calls]
+    assert [body["startDate"] for body in bodies] == [
+        "2026-01-01T00:00:00+03:00",
+        "2026-01-02T00:00:00+03:00",
+    ]
+    assert all(body["region"] == "TR1" for body in bodies)
+
+
+def test_prepare_requires_auth():
+    endpoint = Endpoint("seffaflik-electricity", "mcp", _mcp_endpoint())
+    with pytest.raises(RuntimeError):
+        endpoint.prepare(region="TR1")
+
+
+def test_prepared_refreshes_auth_when_credentials_change(authenticated):
+    prepared = Endpoint("seffaflik-electricity", "mcp", _mcp_endpoint()).prepare(
+        debug=True
+    )
+    first_auth = prepared._auth
+    epint._username = "other"
+    prepared(startDate="2026-01-01")
+    assert prepared._auth is not first_auth
+    assert prepared._auth.username == "other"
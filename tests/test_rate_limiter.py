@@ -0,0 +1,113 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import epint
+from epint.modules.http_client import HTTPClient
+from epint.modules.http_client import time as http_time
+from epint.modules.http_client.rate_limiter import RateLimiter
+
+URL = "https://seffaflik.epias.com.tr/electricity-service/v1/markets/dam/data/mcp"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _limiter():
+    return RateLimiter("seffaflik.epias.com.tr", "user", clock=FakeClock())
+
+
+def _headers(limit, remaining, reset):
+    return {
+        "RateLimit-Limit": str(limit),
+        "RateLimit-Remaining": str(remaining),
+        "RateLimit-Reset": str(reset),
+    }
+
+
+def test_unlimited_until_headers_are_seen():
+    limiter = _limiter()
+    assert [limiter.reserve() for _ in range(100)] == [0.0] * 100
+    assert limiter.state()["tokens"] is None
+
+
+def test_requests_are_paced_after_remaining_runs_low():
+    limiter = _limiter()
+    limiter.reserve()
+    limiter.update(_headers(limit=10, remaining=2, reset=10))
+
+    waits = [limiter.reserve() for _ in range(4)]
+
+    assert waits == [0.0, 0.0, pytest.approx(1.0), pytest.approx(2.0)]
+    assert limiter.state()["rate"] == pytest.approx(1.0)
+
+
+def test_exhausted_window_blocks_until_reset():
+    limiter = _limiter()
+    limiter.reserve()
+    limiter.update(_headers(limit=100, remaining=0, reset=7))
+
+    assert limiter.reserve() >= 7.0
+    limiter._clock.now = 7.5
+    assert limiter.state()["blocked_for"] == 0.0
+
+
+def test_window_parameter_sets_refill_rate():
+    limiter = _limiter()
+    limiter.reserve()
+    limiter.update({"RateLimit-Limit": "60, 60;w=30", "RateLimit-Remaining": "0"})
+    assert limiter.state()["window"] == 30.0
+    assert limiter.state()["rate"] == pytest.approx(2.0)
+
+
+def test_in_flight_requests_are_subtracted_from_remaining():
+    limiter = _limiter()
+    for _ in range(3):
+        limiter.reserve()
+    limiter.update(_headers(limit=10, remaining=5, reset=10))
+
+    state = limiter.state()
+    assert state["pending"] == 2
+    assert state["tokens"] == 3
+
+
+def test_limiter_is_shared_per_host_and_user():
+    first = HTTPClient()._get_rate_limiter(URL)
+    second = HTTPClient()._get_rate_limiter(URL + "?page=2")
+
+    assert first is second
+    assert HTTPClient(rate_limit=False)._get_rate_limiter(URL) is None
+
+
+class ScriptedSession:
+    def __init__(self, responses):
+        self._responses = list(responses)
+
+    def request(self, **kwargs):
+        return self._responses.pop(0)
+
+
+def test_429_on_one_client_delays_other_clients(monkeypatch, fake_response):
+    sleeps = []
+    monkeypatch.setattr(http_time, "sleep", sleeps.append)
+    session = ScriptedSession(
+        [
+            fake_response(status_code=429, headers={"RateLimit-Reset": "3"}),
+            fake_response(),
+            fake_response(),
+        ]
+    )
+    first, second = HTTPClient(), HTTPClient()
+    for client in (first, second):
+        monkeypatch.setattr(client, "_get_session", lambda url: session)
+
+    assert first.get(URL).status_code == 200
+    assert second.get(URL).status_code == 200
+
+    # time.sleep taklit edildiği için blok süresi ikinci client için de geçmemiş olur
+    assert sleeps == [pytest.approx(3, abs=0.1)] * 2
+    assert epint.get_rate_limit_state()[0]["rejected"] == 1
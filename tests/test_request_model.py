@@ -1,6 +1,12 @@
 # -*- coding: utf-8 -*-
+import dataclasses
+
+import pytest
+
 import epint
+from epint.models.endpoint_registry import EndpointModel
 from epint.models.request_model import RequestModel
+from epint.models.request_plan import ParamBindingTable, compile_request_plan
 
 
 def _endpoint(category, parameters, consumes=None, produces=None):
@@ -140,6 +146,41 @@ def test_nested_array_field_mapping_flat_kwarg_to_array():
     assert rm.json["contracts"] == [{"deliveryDay": "2026-07-20"}]
 
 
+def _contracts_endpoint():
+    schema = {
+        "type": "object",
+        "properties": {
+            "contracts": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {"deliveryDay": {"type": "string"}},
+                },
+            }
+        },
+    }
+    return _endpoint("customer", [{"name": "request", "in": "body", "schema": schema}])
+
+
+def test_nested_array_field_extends_an_existing_list():
+    existing = [{"deliveryDay": "2026-07-19"}]
+    rm = RequestModel(
+        _contracts_endpoint(), {"contracts": existing, "deliveryDay": "2026-07-20"}
+    )
+    assert rm.json["contracts"] == [
+        {"deliveryDay": "2026-07-19"},
+        {"deliveryDay": "2026-07-20"},
+    ]
+    assert existing == [{"deliveryDay": "2026-07-19"}]
+
+
+def test_nested_array_field_rejects_a_string_array_value():
+    with pytest.raises(TypeError):
+        RequestModel(
+            _contracts_endpoint(), {"contracts": "abc", "deliveryDay": "2026-07-20"}
+        )
+
+
 def test_no_body_schema_passes_remaining_kwargs_as_json():
     endpoint = _endpoint("customer", [])
     rm = RequestModel(endpoint, {"foo": "bar"})
@@ -156,11 +197,140 @@ def test_host_selection_seffaflik():
     endpoint = _endpoint("seffaflik-electricity", [])
     epint.set_mode("prod")
     rm = RequestModel(endpoint, {})
-    assert rm._endpoint_data["host"] == "https://seffaflik.epias.com.tr"
+    assert rm.host == "https://seffaflik.epias.com.tr"
 
 
 def test_host_selection_gop_test_mode():
     endpoint = _endpoint("gop", [])
     epint.set_mode("test")
     rm = RequestModel(endpoint, {})
-    assert rm._endpoint_data["host"] == "https://testgop.epias.com.tr"
+    assert rm.host == "https://testgop.epias.com.tr"
+    assert rm.st_service_url == "https://testgop.epias.com.tr"
+
+
+def test_request_model_does_not_mutate_endpoint_data():
+    endpoint = _endpoint("customer", [])
+    endpoint.update(host="epys.epias.com.tr", basePath="/api", path="/v1/list")
+    snapshot = dict(endpoint)
+
+    epint.set_mode("test")
+    rm = RequestModel(endpoint, {})
+
+    assert endpoint == snapshot
+    assert rm.url == "https://epys-prp.epias.com.tr/api/v1/list"
+    assert rm.st_service_url == "https://epys.epias.com.tr"
+
+
+def test_request_plan_precomputes_urls_per_runtime_mode():
+    endpoint = _endpoint("gop", [])
+    endpoint.update(basePath="/gop-servis/", path="/rest/order")
+    plan = compile_request_plan(endpoint)
+
+    assert plan.urls == {
+        "prod": "https://gop.epias.com.tr/gop-servis/rest/order",
+        "test": "https://testgop.epias.com.tr/gop-servis/rest/order",
+    }
+    assert plan.st_service_urls["prod"] == "https://gop.epias.com.tr"
+
+
+def test_registered_endpoints_are_read_only():
+    EndpointModel.register_endpoint("customer", "list", _endpoint("customer", []))
+    data = EndpointModel.get_endpoint("customer", "list")._data
+    with pytest.raises(TypeError):
+        data["host"] = "https://example.com"
+
+
+def _contracts_endpoint():
+    schema = {
+        "type": "object",
+        "properties": {
+            "startDate": {"type": "string", "format": "date-time"},
+            "contracts": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "properties": {"deliveryDay": {"type": "string"}},
+                },
+            },
+        },
+    }
+    return _endpoint(
+        "customer",
+        [
+            {"name": "organizationId", "in": "query", "type": "integer"},
+            {"name": "request", "in": "body", "schema": schema},
+        ],
+    )
+
+
+def test_request_plan_is_compiled_from_endpoint():
+    plan = compile_request_plan(_contracts_endpoint())
+
+    assert plan.query_names == ("organizationId",)
+    assert set(plan.query_converters) == {"organizationId"}
+    assert plan.body_field_names == ("startDate", "contracts", "deliveryDay")
+    assert dict(plan.array_field_mapping) == {"deliveryDay": "contracts"}
+    assert plan.body_as_json
+    assert plan.content_headers == (
+        ("Content-Type", "application/json"),
+        ("Accept", "application/json"),
+    )
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        plan.body_as_json = False
+
+
+def test_request_model_with_shared_plan_matches_fresh_compile():
+    endpoint = _contracts_endpoint()
+    plan = compile_request_plan(endpoint)
+    kwargs = {
+        "organizationid": "7",
+        "startDate": "2026-07-20",
+        "deliveryDay": "2026-07-21",
+    }
+
+    first = RequestModel(endpoint, kwargs, plan)
+    second = RequestModel(endpoint, kwargs, plan)
+    fresh = RequestModel(endpoint, kwargs)
+
+    assert first.to_dict() == second.to_dict() == fresh.to_dict()
+    assert first.params == {"organizationId": 7}
+    assert first.json["contracts"] == [{"deliveryDay": "2026-07-21"}]
+
+
+def test_registry_caches_request_plan_per_endpoint_data():
+    endpoint = _contracts_endpoint()
+    plan = EndpointModel.get_request_plan("customer", "sample", endpoint)
+
+    assert EndpointModel.get_request_plan("customer", "sample", endpoint) is plan
+    assert (
+        EndpointModel.get_request_plan("customer", "sample", _contracts_endpoint())
+        is not plan
+    )
+
+
+def test_kwarg_bindings_are_memoized_per_plan(monkeypatch):
+    plan = compile_request_plan(_contracts_endpoint())
+    kwargs = {"organizationid": "7", "unknownArg": 1}
+    RequestModel(_contracts_endpoint(), kwargs, plan)
+
+    def fail(*args, **kwargs):
+        raise AssertionError("cache'lenmiş binding tekrar eşleştirilmemeli")
+
+    monkeypatch.setattr(RequestModel, "_find_param_match", fail)
+    rm = RequestModel(_contracts_endpoint(), kwargs, plan)
+    assert rm.params == {"organizationId": 7}
+
+    stats = plan.bindings.stats()
+    assert stats["hits"] == stats["misses"] == 3
+    assert stats["hit_rate"] == 0.5
+    assert stats["fuzzy"] == {"query": {"organizationid": "organizationId"}}
+    assert stats["unmatched"] == {"query": ["unknownArg"], "body": ["unknownArg"]}
+
+
+def test_binding_table_is_bounded():
+    table = ParamBindingTable(maxsize=2)
+    for name in ("a", "b", "c"):
+        table.resolve("query", name, lambda kwarg: kwarg.upper())
+
+    assert table.stats()["size"] == 2
+    assert table.resolve("query", "c", lambda kwarg: None) == "C"
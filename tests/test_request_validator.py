@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+import pytest
+
+import epint
+from epint.models.endpoint_callable import Endpoint
+from epint.models.request_model import RequestModel
+from epint.models.request_plan import compile_request_plan
+from epint.models.request_validator import RequestValidationError
+from epint.modules.authentication.auth_manager import Authentication
+
+
+def _consumption_endpoint():
+    schema = {
+        "type": "object",
+        "required": ["startDate", "endDate"],
+        "properties": {
+            "startDate": {"type": "string", "format": "date-time"},
+            "endDate": {"type": "string", "format": "date-time"},
+            "exportType": {"type": "string", "enum": ["XLSX", "CSV", "PDF"]},
+            "meteringPointId": {"type": "integer", "format": "int64"},
+            "items": {
+                "type": "array",
+                "items": {
+                    "type": "object",
+                    "required": ["hour"],
+                    "properties": {"hour": {"type": "string"}},
+                },
+            },
+        },
+    }
+    return {
+        "category": "seffaflik-electricity",
+        "method": "POST",
+        "path": "/v1/consumption/data/realtime-consumption",
+        "consumes": ["application/json"],
+        "produces": ["application/json"],
+        "parameters": [
+            {"name": "TGT", "in": "header", "type": "string", "required": True},
+            {"name": "body", "in": "body", "schema": schema},
+        ],
+    }
+
+
+def _errors(endpoint, kwargs):
+    with pytest.raises(RequestValidationError) as exc_info:
+        RequestModel(endpoint, kwargs)
+    return dict(exc_info.value.errors)
+
+
+def test_valid_request_passes():
+    rm = RequestModel(
+        _consumption_endpoint(),
+        {"startDate": "2026-01-01", "endDate": "2026-01-02", "exportType": "CSV"},
+    )
+    assert rm.json["exportType"] == "CSV"
+
+
+def test_missing_required_fields_are_reported_together():
+    errors = _errors(_consumption_endpoint(), {"meteringPointId": 5})
+    assert errors == {
+        "body.startDate": "zorunlu alan eksik",
+        "body.endDate": "zorunlu alan eksik",
+    }
+
+
+def test_enum_error_suggests_case_insensitive_match():
+    errors = _errors(
+        _consumption_endpoint(),
+        {"startDate": "2026-01-01", "endDate": "2026-01-02", "exportType": "xlsx"},
+    )
+    assert "'XLSX' mi demek istediniz" in errors["body.exportType"]
+
+
+def test_unparseable_date_and_integer_are_rejected():
+    errors = _errors(
+        _consumption_endpoint(),
+        {"startDate": "yesterday", "endDate": "2026-01-02", "meteringPointId": "abc"},
+    )
+    assert set(errors) == {"body.startDate", "body.meteringPointId"}
+
+
+def test_nested_array_items_are_validated():
+    errors = _errors(
+        _consumption_endpoint(),
+        {
+            "startDate": "2026-01-01",
+            "endDate": "2026-01-02",
+            "items": [{"hour": "01"}, {}],
+        },
+    )
+    assert errors == {"body.items[1].hour": "zorunlu alan eksik"}
+
+
+def test_ticket_headers_and_defaults_do_not_trigger_errors():
+    endpoint = {
+        "category": "customer",
+        "parameters": [
+            {"name": "TGT", "in": "header", "type": "string", "required": True},
+            {"name": "region", "in": "query", "type": "string", "required": True},
+        ],
+    }
+    assert RequestModel(endpoint, {}).params["region"] == "TR1"
+
+
+def test_plan_without_rules_has_no_validator():
+    endpoint = {"category": "customer", "parameters": []}
+    assert compile_request_plan(endpoint).validator is None
+
+
+def test_validation_can_be_disabled():
+    epint.set_request_validation(False)
+    rm = RequestModel(_consumption_endpoint(), {})
+    assert rm.json is None
+
+
+def test_endpoint_call_fails_before_tickets_are_requested(monkeypatch):
+    epint._username = "user"
+    epint._password = "pass"
+    monkeypatch.setattr(
+        Authentication, "get_tgt", lambda self: pytest.fail("TGT istenmemeli")
+    )
+    endpoint = Endpoint("seffaflik-electricity", "consumption", _consumption_endpoint())
+
+    with pytest.raises(RequestValidationError, match="body.endDate"):
+        endpoint(startDate="2026-01-01")
+
+
+def test_prepared_endpoint_validates_merged_request(monkeypatch):
+    epint._username = "user"
+    epint._password = "pass"
+    monkeypatch.setattr(Authentication, "get_tgt", lambda self: ("TGT-1-cas", None))
+    endpoint = Endpoint("seffaflik-electricity", "consumption", _consumption_endpoint())
+
+    prepared = endpoint.prepare(exportType="CSV", debug=True)
+
+    assert (
+        prepared(startDate="2026-01-01", endDate="2026-01-02").json["exportType"]
+        == "CSV"
+    )
+    with pytest.raises(RequestValidationError):
+        prepared(startDate="2026-01-01")
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+import pytest
+from requests.exceptions import ConnectionError, HTTPError
+
+from epint.modules.http_client import HTTPClient
+from epint.modules.http_client import time as http_time
+from epint.modules.http_client.retry_policy import RetryBudget, RetryPolicy
+
+URL = "https://seffaflik.epias.com.tr/electricity-service/v1/markets/dam/data/mcp"
+
+
+class ScriptedSession:
+    """Sırasıyla response döndüren veya exception fırlatan session."""
+
+    def __init__(self, results):
+        self._results = list(results)
+        self.calls = []
+
+    def request(self, **kwargs):
+        self.calls.append(kwargs)
+        result = self._results.pop(0) if len(self._results) > 1 else self._results[0]
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(http_time, "sleep", recorded.append)
+    return recorded
+
+
+def _client(monkeypatch, results, **kwargs):
+    client = HTTPClient(rate_limit=False, **kwargs)
+    session = ScriptedSession(results)
+    monkeypatch.setattr(client, "_get_session", lambda url: session)
+    return client, session
+
+
+def test_server_errors_are_retried_with_jittered_backoff(
+    monkeypatch, fake_response, sleeps
+):
+    client, session = _client(
+        monkeypatch,
+        [
+            fake_response(status_code=503),
+            fake_response(status_code=502),
+            fake_response(),
+        ],
+    )
+
+    response = client.post(URL)
+
+    assert response.status_code == 200
+    assert [a.outcome for a in response.retry_report.attempts] == [
+        "server_error",
+        "server_error",
+        "ok",
+    ]
+    assert len(sleeps) == 2
+    assert 0 <= sleeps[0] <= 1.0 and 0 <= sleeps[1] <= 2.0
+
+
+def test_attempt_limit_is_total_across_outcomes(monkeypatch, fake_response, sleeps):
+    client, session = _client(
+        monkeypatch,
+        [ConnectionError("reset"), fake_response(status_code=503)],
+        retries=2,
+    )
+
+    with pytest.raises(HTTPError) as exc_info:
+        client.get(URL)
+
+    report = exc_info.value.retry_report
+    assert len(session.calls) == report.count == 3
+    assert report.gave_up == "attempt limit"
+    assert exc_info.value.response.status_code == 503
+
+
+def test_client_errors_are_not_retried(monkeypatch, fake_response, sleeps):
+    client, session = _client(monkeypatch, [fake_response(status_code=400)])
+
+    with pytest.raises(HTTPError) as exc_info:
+        client.post(URL)
+
+    assert len(session.calls) == 1
+    assert exc_info.value.retry_report.gave_up == "not retryable"
+    assert sleeps == []
+
+
+def test_server_errors_respect_retry_methods(monkeypatch, fake_response, sleeps):
+    client, session = _client(
+        monkeypatch, [fake_response(status_code=503)], allowed_methods=("GET",)
+    )
+
+    with pytest.raises(HTTPError):
+        client.post(URL)
+
+    assert len(session.calls) == 1
+
+
+def test_rate_limit_wait_beyond_time_budget_fails_fast(
+    monkeypatch, fake_response, sleeps
+):
+    client, session = _client(
+        monkeypatch,
+        [fake_response(status_code=429, headers={"RateLimit-Reset": "30"})],
+        retry_policy=RetryPolicy(max_elapsed=10),
+    )
+
+    with pytest.raises(HTTPError) as exc_info:
+        client.get(URL)
+
+    assert exc_info.value.retry_report.gave_up == "time budget"
+    assert sleeps == []
+
+
+def test_process_wide_budget_stops_retry_storms(monkeypatch, fake_response, sleeps):
+    RetryBudget.configure(ratio=0.0, capacity=1)
+    client, session = _client(monkeypatch, [fake_response(status_code=503)])
+
+    with pytest.raises(HTTPError) as first:
+        client.get(URL)
+    with pytest.raises(HTTPError) as second:
+        client.get(URL)
+
+    assert first.value.retry_report.count == 2
+    assert second.value.retry_report.count == 1
+    assert second.value.retry_report.gave_up == "retry budget"
+    assert RetryBudget.shared().state()["denied"] == 2
+
+
+class FakeAuth:
+    username = "user"
+
+    def __init__(self):
+        self.cleared = 0
+
+    def clear_tickets(self):
+        self.cleared += 1
+
+    def get_tgt(self):
+        return "TGT-2-new", None
+
+
+def test_invalid_ticket_is_refreshed_in_header(monkeypatch, fake_response, sleeps):
+    invalid = fake_response(
+        status_code=404, text="TGT-1-old could not be found or is considered invalid"
+    )
+    client, session = _client(monkeypatch, [invalid, fake_response()])
+    client.auth = FakeAuth()
+
+    response = client.post(URL, headers={"TGT": "TGT-1-old"})
+
+    assert session.calls[1]["headers"]["TGT"] == "TGT-2-new"
+    assert client.auth.cleared == 1
+    assert response.retry_report.retries == 1
+    assert sleeps == []
+
+
+def test_backoff_is_full_jitter_and_capped():
+    policy = RetryPolicy(base_delay=1.0, max_delay=5.0)
+    samples = [policy.backoff(10) for _ in range(200)]
+
+    assert all(0 <= sample <= 5.0 for sample in samples)
+    assert len(set(samples)) > 1
+
+
+def test_sessions_do_not_retry_at_transport_level():
+    session = HTTPClient()._create_session()
+    assert session.get_adapter(URL).max_retries.total == 0
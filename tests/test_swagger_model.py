@@ -96,3 +96,102 @@ def test_circular_ref_does_not_infinite_loop(swagger_path):
     # Circular self_ref, visited-set koruması sayesinde sonsuz döngüye girmez;
     # key korunur ama değeri None'a çözülür (bkz. SwaggerModel._resolve_all_refs).
     assert resolved_schema["properties"]["self_ref"] is None
+
+
+def test_endpoints_are_resolved_lazily_on_first_access(swagger_path):
+    model = SwaggerModel(swagger_path)
+    endpoints = model.get_all_endpoints()
+
+    assert list(endpoints) == ["available_lookups"]
+    assert not endpoints.is_resolved("available_lookups")
+
+    first = endpoints["available_lookups"]
+    assert endpoints.is_resolved("available_lookups")
+    assert endpoints["available_lookups"] is first  # memoize edilir
+
+
+def test_category_is_injected_into_endpoint_data(swagger_path):
+    model = SwaggerModel(swagger_path, category="example")
+    assert model.get_endpoint("available_lookups")["category"] == "example"
+
+
+@pytest.fixture
+def shared_definitions_path(tmp_path):
+    page = {"$ref": "#/definitions/Page"}
+    spec = {
+        "definitions": {
+            "Page": {
+                "type": "object",
+                "properties": {"number": {"type": "integer"}},
+            },
+            "ListRequest": {
+                "type": "object",
+                "properties": {"page": page, "previousPage": page},
+            },
+            "Parent": {
+                "type": "object",
+                "properties": {"child": {"$ref": "#/definitions/Child"}},
+            },
+            "Child": {
+                "type": "object",
+                "properties": {"parent": {"$ref": "#/definitions/Parent"}},
+            },
+        },
+        "paths": {
+            "/list": {
+                "post": {
+                    "operationId": "list",
+                    "parameters": [
+                        {
+                            "name": "body",
+                            "in": "body",
+                            "schema": {"$ref": "#/definitions/ListRequest"},
+                        }
+                    ],
+                    "responses": {"200": {"schema": {"$ref": "#/definitions/Page"}}},
+                }
+            },
+            "/parent": {
+                "post": {
+                    "operationId": "parent",
+                    "parameters": [],
+                    "responses": {"200": {"schema": {"$ref": "#/definitions/Parent"}}},
+                }
+            },
+            "/child": {
+                "post": {
+                    "operationId": "child",
+                    "parameters": [],
+                    "responses": {"200": {"schema": {"$ref": "#/definitions/Child"}}},
+                }
+            },
+        },
+    }
+    path = tmp_path / "swagger.json"
+    path.write_text(json.dumps(spec), encoding="utf-8")
+    return str(path)
+
+
+def test_resolved_definitions_are_shared(shared_definitions_path):
+    model = SwaggerModel(shared_definitions_path)
+    endpoint = model.get_endpoint("list")
+    properties = endpoint["parameters"][0]["schema"]["properties"]
+
+    # Aynı definition'a yapılan sibling referansları artık None'a düşmüyor
+    assert properties["page"] is properties["previousPage"]
+    assert properties["page"] is endpoint["responses"]["200"]["schema"]
+
+
+def test_indirect_cycle_result_does_not_depend_on_resolution_order(
+    shared_definitions_path,
+):
+    parent_first = SwaggerModel(shared_definitions_path)
+    parent = parent_first.get_endpoint("parent")["responses"]["200"]["schema"]
+    child = parent_first.get_endpoint("child")["responses"]["200"]["schema"]
+
+    child_first = SwaggerModel(shared_definitions_path)
+    assert child_first.get_endpoint("child")["responses"]["200"]["schema"] == child
+    assert child_first.get_endpoint("parent")["responses"]["200"]["schema"] == parent
+
+    assert parent["properties"]["child"]["properties"]["parent"] is None
+    assert child["properties"]["parent"]["properties"]["child"] is None
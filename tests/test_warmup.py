@@ -0,0 +1,148 @@
+# -*- coding: utf-8 -*-
+import threading
+import time
+
+import pytest
+import requests
+
+import epint
+from epint.models.endpoint_registry import EndpointModel
+from epint.modules.authentication.auth_manager import Authentication
+from epint.modules.http_client import HTTPClient
+from epint.modules.http_client.circuit_breaker import BreakerPolicy, CircuitBreaker
+from epint.modules.http_client.retry_policy import SERVER_ERROR
+from epint.modules.warmup import KeepWarm, open_connections
+
+
+class HeadSession:
+    """HEAD isteklerini kaydeden, aynı anda açık istek sayısını ölçen session."""
+
+    def __init__(self, fail_hosts=()):
+        self.calls = []
+        self.active = 0
+        self.peak = 0
+        self.fail_hosts = fail_hosts
+        self._lock = threading.Lock()
+
+    def head(self, url, **kwargs):
+        with self._lock:
+            self.calls.append((url, kwargs))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(0.05)
+        with self._lock:
+            self.active -= 1
+        if url in self.fail_hosts:
+            raise requests.exceptions.ConnectionError("bağlanamadı")
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b""
+        return response
+
+
+@pytest.fixture
+def session(monkeypatch):
+    session = HeadSession()
+    monkeypatch.setattr(HTTPClient, "_get_session", lambda self, url=None: session)
+    return session
+
+
+@pytest.fixture
+def tgt_calls(monkeypatch):
+    calls = []
+
+    def get_tgt(self, deadline=None):
+        calls.append(self.root)
+        return "TGT-1-cas", None
+
+    monkeypatch.setattr(Authentication, "get_tgt", get_tgt)
+    return calls
+
+
+def test_warmup_loads_categories_and_warms_hosts(session, tgt_calls):
+    epint.set_auth("user", "pass")
+
+    report = epint.warmup(["transparency", "gop"], connections=3)
+
+    assert report["categories"] == ["seffaflik-electricity", "gop"]
+    assert "seffaflik-electricity" in EndpointModel.get_all_categories()
+    assert "gop" in EndpointModel.get_all_categories()
+    assert set(report["hosts"]) == {
+        "https://giris.epias.com.tr",
+        "https://cas.epias.com.tr",
+        "https://seffaflik.epias.com.tr",
+        "https://gop.epias.com.tr",
+    }
+    assert all(result["connections"] == 3 for result in report["hosts"].values())
+    assert session.peak > 1
+    assert all(kwargs["allow_redirects"] is False for _, kwargs in session.calls)
+    assert sorted(tgt_calls) == [
+        "https://cas.epias.com.tr",
+        "https://giris.epias.com.tr",
+    ]
+    assert set(report["tickets"].values()) == {"ok"}
+
+
+def test_warmup_requires_auth_for_tickets(session):
+    with pytest.raises(RuntimeError):
+        epint.warmup("transparency")
+
+    report = epint.warmup("transparency", tickets=False)
+    assert list(report["hosts"]) == ["https://seffaflik.epias.com.tr"]
+    assert report["tickets"] == {}
+
+
+def test_unknown_category_is_rejected(session):
+    with pytest.raises(ValueError):
+        epint.warmup("xyz-qwerty-123", tickets=False)
+
+
+def test_failures_are_reported_instead_of_raised(monkeypatch):
+    host = "https://seffaflik.epias.com.tr"
+    session = HeadSession(fail_hosts=(host,))
+    monkeypatch.setattr(HTTPClient, "_get_session", lambda self, url=None: session)
+
+    result = open_connections(host, connections=2)
+
+    assert result["connections"] == 0
+    assert "ConnectionError" in result["error"]
+
+
+def test_open_circuit_is_not_warmed(session):
+    host = "https://seffaflik.epias.com.tr"
+    CircuitBreaker.configure(BreakerPolicy(failure_threshold=1))
+    CircuitBreaker.for_url(host).record(SERVER_ERROR)
+
+    result = open_connections(host)
+
+    assert result == {"connections": 0, "elapsed": 0.0, "error": "circuit open"}
+    assert session.calls == []
+
+
+def test_keep_warm_repeats_in_background(session, tgt_calls):
+    epint.set_auth("user", "pass")
+
+    epint.warmup("transparency", connections=1, keep_warm=True, interval=0.05)
+    keeper = KeepWarm.current()
+    deadline = time.monotonic() + 5
+    while keeper.runs < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    epint.stop_keep_warm()
+
+    assert keeper.runs >= 2
+    assert not keeper.running
+    assert KeepWarm.current() is None
+    assert len(tgt_calls) >= 3
+    assert (
+        keeper.last_report["hosts"]["https://seffaflik.epias.com.tr"]["connections"]
+        == 1
+    )
+
+
+def test_restarting_keep_warm_replaces_the_running_thread(session):
+    first = KeepWarm.start(["seffaflik-electricity"], tickets=False, interval=60)
+    second = KeepWarm.start(["seffaflik-electricity"], tickets=False, interval=60)
+
+    assert not first.running
+    assert second.running
+    assert KeepWarm.current() is second